@@ -0,0 +1,92 @@
+"""Benchmark the "safe" and "fast" storage profiles of the vocab database.
+
+For each profile, a fresh database is created in a temporary home
+directory (on the file system of --dir, since fsync cost depends on it)
+and these workloads are timed:
+- import: one bulk insert of --items vocabulary items
+- answer: single-answer progress commits (update_progress), per commit
+- segment: progress journal segments of 50 events, per flush
+- sample: random samples of 15 incomplete items, per sample
+
+Usage:
+    PYTHONPATH=src python benchmarks/db_profiles.py [--items 50000]
+        [--runs 3] [--dir /path/on/the/disk/to/test]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from nihon_cli.infra.config import DB_PROFILES, save_config
+from nihon_cli.infra.connection import close_all_connections
+
+_ANSWERS = 1000
+_SEGMENTS = 20
+_SEGMENT_EVENTS = 50
+_SAMPLES = 200
+_SAMPLE_SIZE = 15
+
+
+def run(items: int) -> dict:
+    """Time all workloads against the database of the current home directory."""
+    from nihon_cli.core.vocabulary import VocabularyItem
+    from nihon_cli.infra.progress_journal import ProgressJournal
+    from nihon_cli.infra.repository import VocabRepository
+
+    repo = VocabRepository()
+    batch = [
+        VocabularyItem(id=0, japanese_vocab=[f"ことば{i}"], german_vocab=[f"Wort {i}"],
+                       source_file="bench.md", upload_tag="bench")
+        for i in range(items)
+    ]
+    result = {}
+
+    start = time.perf_counter()
+    repo.add_vocabulary_batch(batch, "bench.md", "bench")
+    result["import"] = time.perf_counter() - start
+
+    ids = [item.id for item in batch]
+    start = time.perf_counter()
+    for i in range(_ANSWERS):
+        repo.update_progress(ids[i % len(ids)], "jp_to_de", True)
+    result["answer"] = (time.perf_counter() - start) / _ANSWERS
+
+    journal = ProgressJournal(repo, max_events=_SEGMENT_EVENTS + 1)
+    start = time.perf_counter()
+    for s in range(_SEGMENTS):
+        for e in range(_SEGMENT_EVENTS):
+            journal.record_progress(ids[(s * _SEGMENT_EVENTS + e) % len(ids)], "de_to_jp")
+        journal.flush()
+    result["segment"] = (time.perf_counter() - start) / _SEGMENTS
+
+    start = time.perf_counter()
+    for _ in range(_SAMPLES):
+        repo.get_incomplete_vocabulary(limit=_SAMPLE_SIZE)
+    result["sample"] = (time.perf_counter() - start) / _SAMPLES
+
+    close_all_connections()
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--items", type=int, default=50000)
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--dir", default=None, help="directory for the test databases")
+    args = ap.parse_args()
+
+    print(f"{'':6} {'import':>9} {'answer':>11} {'segment':>11} {'sample':>11}")
+    for profile in DB_PROFILES:
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory(dir=args.dir) as home:
+                # Keep the databases away from the real ~/.nihon-cli
+                os.environ["HOME"] = home
+                save_config("db_profile", profile)
+                r = run(args.items)
+            print(f"{profile:6} {r['import']:8.2f}s {r['answer'] * 1000:8.3f} ms "
+                  f"{r['segment'] * 1000:8.3f} ms {r['sample'] * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
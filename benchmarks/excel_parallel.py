@@ -0,0 +1,88 @@
+"""Benchmark parsing an Excel workbook with 1 and N worker processes.
+
+Builds a synthetic まるごと-style workbook with many sheets and times
+ExcelVocabParser.iter_sheets() for each worker count, consuming every
+item as 'vocab upload' does. All runs must yield identical items in
+identical order.
+
+Usage:
+    PYTHONPATH=src python benchmarks/excel_parallel.py [--sheets 24] [--rows 3000]
+        [--workers 1 2 4] [--repeat 3]
+
+The parallel mode only pays off with more than one CPU core; on a single
+core the numbers show its overhead (process start-up, pickling).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from nihon_cli.core.excel_parser import ExcelVocabParser
+
+_TYPES = ["01 名詞", "02 動詞", "03 い形容詞", "04 な形容詞", "05 副詞", "あいさつ"]
+
+
+def build_workbook(path: Path, sheets: int, rows: int) -> None:
+    """Write a workbook with the header layout the parser expects."""
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"{s + 1:02d} Lektion")
+        ws.append(["かな", "漢字", "ドイツ語訳", "品詞"])
+        for r in range(rows):
+            ws.append([
+                f"ことば{s}の{r}",
+                f"言葉{s}の{r}" if r % 3 else None,
+                f"Wort {s}.{r}, Begriff {r}",
+                _TYPES[r % len(_TYPES)],
+            ])
+    wb.save(path)
+
+
+def parse(path: Path, sheet_names, workers: int):
+    """Consume all sheets and return their items as comparable tuples."""
+    result = []
+    for name, items in ExcelVocabParser().iter_sheets(path, sheet_names, workers):
+        result.extend(
+            (name, tuple(item.japanese_vocab), tuple(item.german_vocab), item.vocab_type)
+            for item in items
+        )
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sheets", type=int, default=24)
+    ap.add_argument("--rows", type=int, default=3000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.xlsx"
+        start = time.perf_counter()
+        build_workbook(path, args.sheets, args.rows)
+        print(f"workbook: {args.sheets} sheets x {args.rows} rows, "
+              f"{path.stat().st_size / 2**20:.1f} MiB, built in "
+              f"{time.perf_counter() - start:.1f} s; {os.cpu_count()} CPU(s)")
+
+        sheet_names = [name for name, _ in ExcelVocabParser().list_sheets(path)]
+        reference = None
+        for workers in args.workers:
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                items = parse(path, sheet_names, workers)
+                times.append(time.perf_counter() - start)
+            if reference is None:
+                reference = items
+            assert items == reference, f"{workers} workers yielded different items"
+            print(f"  {workers} worker(s): best {min(times):6.2f} s  "
+                  f"({len(items)} items)")
+
+
+if __name__ == "__main__":
+    main()
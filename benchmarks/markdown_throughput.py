@@ -0,0 +1,101 @@
+"""Benchmark reading and uploading a multi-megabyte Markdown vocabulary file.
+
+Generates a note with many vocabulary tables separated by prose, then
+measures:
+- parse() and iter_items(): throughput (MB/s) and peak Python memory
+  (tracemalloc, measured in a separate untimed pass)
+- 'vocab upload': the streaming import into a fresh database in a
+  temporary home directory
+
+Usage:
+    PYTHONPATH=src python benchmarks/markdown_throughput.py [--tables 60]
+        [--rows 2000] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from nihon_cli.core.parser import MarkdownVocabParser
+
+
+def build_note(path: Path, tables: int, rows: int) -> None:
+    """Write tables of varying width with prose and blank lines around them."""
+    with open(path, "w", encoding="utf-8") as f:
+        for t in range(tables):
+            f.write(f"## Lektion {t + 1}\n\nEin paar Sätze Text zwischen den Tabellen.\n\n")
+            if t % 2:
+                f.write("| Nr | Japanisch | Lesung | Deutsch |\n|---|---|---|---|\n")
+                for r in range(rows):
+                    f.write(f"| {r} | 言葉{t}の{r} | ことば | Wort {t}.{r}, Begriff {r} |\n")
+            else:
+                f.write("| Japanisch | Deutsch |\n|-----------|---------|\n")
+                for r in range(rows):
+                    f.write(f"| ことば{t}の{r} | Wort {t}.{r} |\n")
+            f.write("\n")
+
+
+def _parse_list(path: Path) -> int:
+    return len(MarkdownVocabParser().parse(path))
+
+
+def _iter_items(path: Path) -> int:
+    count = deque(enumerate(MarkdownVocabParser().iter_items(path), 1), maxlen=1)
+    return count[0][0] if count else 0
+
+
+def _best_of(fn, path: Path, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(path)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def _peak_memory(fn, path: Path) -> int:
+    tracemalloc.start()
+    try:
+        fn(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tables", type=int, default=60)
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the import away from the real ~/.nihon-cli
+        os.environ["HOME"] = tmp
+        path = Path(tmp) / "bench.md"
+        build_note(path, args.tables, args.rows)
+        megabytes = path.stat().st_size / 1e6
+        print(f"note: {args.tables} tables x {args.rows} rows, {megabytes:.1f} MB")
+
+        for label, fn in (("parse()", _parse_list), ("iter_items()", _iter_items)):
+            seconds, count = _best_of(fn, path, args.repeat)
+            peak = _peak_memory(fn, path)
+            print(f"  {label:<13} {seconds * 1000:7.0f} ms  {megabytes / seconds:5.1f} MB/s  "
+                  f"peak {peak / 2**20:6.1f} MiB  ({count} items)")
+
+        from nihon_cli.cli.commands import _upload_markdown
+        from nihon_cli.infra.connection import close_all_connections
+
+        start = time.perf_counter()
+        _upload_markdown(path, "bench")
+        seconds = time.perf_counter() - start
+        close_all_connections()
+        print(f"  upload        {seconds * 1000:7.0f} ms  {megabytes / seconds:5.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
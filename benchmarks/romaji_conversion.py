@@ -0,0 +1,64 @@
+"""Benchmark converting romaji words to kana.
+
+Converts the romaji of every built-in word (data/words.py), repeated
+--copies times, with convert_word_to_kana() word by word and with
+convert_many() as a batch; reports the best of --repeat runs. Also
+counts how many words convert at all and how many yield the word's own
+kana spelling.
+
+Usage:
+    PYTHONPATH=src python benchmarks/romaji_conversion.py [--copies 20] [--repeat 5]
+"""
+
+import argparse
+import gc
+import time
+
+from nihon_cli.core.romaji_converter import RomajiConverter
+from nihon_cli.data.words import WORDS
+
+
+def _best_of(fn, repeat: int) -> float:
+    # Like timeit, keep garbage collection out of the measurement
+    times = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(times)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--copies", type=int, default=20)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    converter = RomajiConverter()
+    romaji = [word.romaji.lower() for word in WORDS]
+    batch = romaji * args.copies
+
+    converted = converter.convert_many(romaji)
+    convertible = sum(kana is not None for kana in converted)
+    own_spelling = sum(kana == word.japanese for kana, word in zip(converted, WORDS))
+    print(f"{len(romaji)} words: {convertible} convertible, "
+          f"{own_spelling} give the word's own kana spelling")
+
+    def one_by_one():
+        for word in batch:
+            converter.convert_word_to_kana(word)
+
+    for label, fn in (
+        ("convert_word_to_kana", one_by_one),
+        ("convert_many", lambda: converter.convert_many(batch)),
+    ):
+        seconds = _best_of(fn, args.repeat)
+        print(f"  {label:<21} {len(batch) / seconds / 1000:6.0f}k words/s")
+
+
+if __name__ == "__main__":
+    main()
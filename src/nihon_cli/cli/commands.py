@@ -5,10 +5,15 @@ CLI command definitions for the Nihon CLI application using argparse.
 
 import argparse
 import sys
+from itertools import islice
 from typing import List, Optional
 
 from nihon_cli.app import NihonCli
-from nihon_cli.infra.config import save_config
+from nihon_cli.core.grading import DEFAULT_GRADING_MODE, GRADING_MODES
+from nihon_cli.infra.config import DB_PROFILES, SEMANTIC_BACKENDS, save_config
+
+# Items parsed from a sheet per bulk insert during a streaming import
+_IMPORT_CHUNK_SIZE = 500
 
 
 def handle_hiragana_command(args: argparse.Namespace) -> None:
@@ -68,19 +73,18 @@ def handle_vocab_upload_command(args: argparse.Namespace) -> None:
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
-                                   Expected to have 'file' and 'tag' attributes.
+                                   Expected to have 'file', 'tag', 'workers' and 'force' attributes.
     """
     from pathlib import Path
-    from nihon_cli.infra.repository import VocabRepository
 
     file_path = Path(args.file)
     upload_tag = args.tag or file_path.stem
 
     try:
         if file_path.suffix in ('.xlsx', '.xls'):
-            _upload_excel(file_path, upload_tag)
+            _upload_excel(file_path, upload_tag, args.workers, args.force)
         else:
-            _upload_markdown(file_path, upload_tag)
+            _upload_markdown(file_path, upload_tag, args.force)
 
     except FileNotFoundError as e:
         print(f"✗ Fehler: Datei nicht gefunden - {e}")
@@ -96,38 +100,167 @@ def handle_vocab_upload_command(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def _upload_markdown(file_path, upload_tag: str) -> None:
-    """Import vocabulary from a Markdown file."""
+def _upload_markdown(file_path, upload_tag: str, force: bool = False) -> None:
+    """Import vocabulary from a Markdown file.
+
+    Unchanged files are recognized from the imports table and not parsed
+    again; of a changed file only the items not yet imported from it are
+    inserted. With force, the file is imported as if it never had been.
+    Items are streamed from the file and inserted in chunks of
+    _IMPORT_CHUNK_SIZE.
+    """
     from nihon_cli.core.parser import MarkdownVocabParser
+    from nihon_cli.infra.import_repository import FileFingerprint, ImportRepository
     from nihon_cli.infra.repository import VocabRepository
 
-    parser = MarkdownVocabParser()
-    items = parser.parse(file_path)
-
-    for item in items:
-        item.upload_tag = upload_tag
+    imports = ImportRepository()
+    fingerprint = FileFingerprint.of(file_path)
+    record = imports.get_import(file_path)
+    if not force and imports.is_unchanged(
+        record, fingerprint, MarkdownVocabParser.PARSER_VERSION
+    ):
+        print("✓ Datei unverändert seit dem letzten Import, nichts zu tun.")
+        print("  (--force importiert sie trotzdem erneut)")
+        return
 
+    parser = MarkdownVocabParser()
+    known_keys = set() if force else imports.get_known_keys(record)
     repo = VocabRepository()
-    inserted, skipped = repo.add_vocabulary_batch(items, file_path.name, upload_tag)
+    embeddings = _embeddings_enabled()
+    # None once Ollama turned out to be unavailable
+    embedded: Optional[int] = 0
+    inserted = skipped = known = 0
+    new_ids: List[int] = []
+
+    for chunk in _chunked(parser.iter_items(file_path), _IMPORT_CHUNK_SIZE):
+        new_chunk = _new_items(chunk, known_keys)
+        known += len(chunk) - len(new_chunk)
+        if not new_chunk:
+            continue
+
+        for item in new_chunk:
+            item.upload_tag = upload_tag
+
+        chunk_inserted, chunk_skipped = repo.add_vocabulary_batch(
+            new_chunk, file_path.name, upload_tag
+        )
+        inserted += chunk_inserted
+        skipped += chunk_skipped
+        new_ids.extend(item.id for item in new_chunk if item.id > 0)
+
+        if embeddings and embedded is not None:
+            computed = _embed_items(new_chunk)
+            embedded = None if computed is None else embedded + computed
+
+    if inserted + skipped + known == 0:
+        raise ValueError(
+            "Keine Vokabeln in der Markdown-Datei gefunden. Erwartet wird eine "
+            f"Tabelle mit den Spalten '{parser.japanese_column.capitalize()}' und "
+            f"'{parser.german_column.capitalize()}'."
+        )
+
+    imports.record_import(
+        file_path, fingerprint, MarkdownVocabParser.PARSER_VERSION,
+        (record.vocab_ids if record is not None else []) + new_ids
+    )
 
     print(f"✓ {inserted} Vokabeln erfolgreich importiert!")
     if skipped > 0:
         print(f"  ({skipped} Duplikate übersprungen)")
+    if known > 0:
+        print(f"  ({known} bereits aus dieser Datei importiert)")
+
+    if embeddings:
+        _report_embeddings(embedded)
+
+
+def _new_items(items, known_keys):
+    """Items whose Japanese key an earlier import of the source did not add."""
+    if not known_keys:
+        return list(items)
+    return [item for item in items if ", ".join(item.japanese_vocab) not in known_keys]
+
 
+def _precompute_embeddings(items) -> None:
+    """Store embeddings of imported meanings if the embedding backend is used."""
+    if _embeddings_enabled():
+        _report_embeddings(_embed_items(items))
 
-def _upload_excel(file_path, upload_tag: str) -> None:
-    """Import vocabulary from an Excel file with interactive sheet selection."""
+
+def _embeddings_enabled() -> bool:
+    """Whether answers are checked with the embedding backend."""
+    from nihon_cli.infra.config import load_semantic_backend
+
+    try:
+        return load_semantic_backend() == "embedding"
+    except ValueError:
+        return False
+
+
+def _embed_items(items) -> Optional[int]:
+    """Store embeddings of the items' meanings; None if Ollama is unavailable."""
+    from nihon_cli.core.embedding_matcher import precompute_embeddings
+
+    texts = [text for item in items for text in (*item.german_vocab, *item.japanese_vocab)]
+    return precompute_embeddings(texts)
+
+
+def _report_embeddings(computed: Optional[int]) -> None:
+    """Print the outcome of precomputing embeddings."""
+    if computed is None:
+        print("⚠ Ollama nicht erreichbar, Embeddings werden beim Lernen berechnet.")
+    elif computed > 0:
+        print(f"✓ {computed} Embeddings vorberechnet")
+
+
+def _chunked(iterable, size: int):
+    """Yield lists of up to size consecutive elements of iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _upload_excel(
+    file_path, upload_tag: str, workers: int = 1, force: bool = False
+) -> None:
+    """Import vocabulary from an Excel file with interactive sheet selection.
+
+    Sheets are streamed: parsed items are inserted in chunks of
+    _IMPORT_CHUNK_SIZE while the sheet is still being read. With more
+    than one worker, sheets are parsed in parallel processes and inserted
+    in sheet order. With force, sheets imported before are imported again
+    as if they never had been.
+
+    If the file is unchanged since all of its sheets were last imported,
+    the workbook is not opened at all.
+    """
     from nihon_cli.core.excel_parser import ExcelVocabParser
+    from nihon_cli.infra.import_repository import FileFingerprint, ImportRepository
     from nihon_cli.infra.repository import VocabRepository
 
+    imports = ImportRepository()
+    fingerprint = FileFingerprint.of(file_path)
+    stored = imports.get_imports(file_path)
+    if not force and stored and all(
+        imports.is_unchanged(record, fingerprint, ExcelVocabParser.PARSER_VERSION)
+        for record in stored.values()
+    ):
+        print("✓ Datei unverändert seit dem letzten Import, nichts zu tun.")
+        print(f"  (importierte Sheets: {', '.join(sorted(stored))})")
+        print("  (--force importiert sie trotzdem erneut oder andere Sheets)")
+        return
+
     parser = ExcelVocabParser()
-    sheets = parser.parse(file_path)
+    sheets = parser.list_sheets(file_path)
 
-    sheet_names = list(sheets.keys())
+    sheet_names = [name for name, _ in sheets]
     print(f"\n📚 {len(sheet_names)} Sheets gefunden:\n")
-    for i, name in enumerate(sheet_names, 1):
-        count = len(sheets[name])
-        print(f"  [{i}] {name} ({count} Vokabeln)")
+    for i, (name, rows) in enumerate(sheets, 1):
+        size = f"~{rows} Zeilen" if rows is not None else "Größe unbekannt"
+        print(f"  [{i}] {name} ({size})")
 
     print(f"\n  [a] Alle Sheets importieren")
     print()
@@ -148,29 +281,76 @@ def _upload_excel(file_path, upload_tag: str) -> None:
         print("Keine Sheets ausgewählt. Abgebrochen.")
         sys.exit(0)
 
+    # Sheets imported before from the same file content are skipped
+    records = {name: stored.get(name) for name in selected}
+    changed = []
+    for name in selected:
+        if not force and imports.is_unchanged(
+            records[name], fingerprint, ExcelVocabParser.PARSER_VERSION
+        ):
+            print(f"  ✓ {name}: unverändert seit dem letzten Import")
+        else:
+            changed.append(name)
+    if not changed:
+        print("  (--force importiert sie trotzdem erneut)")
+        parser.close()
+        return
+
     repo = VocabRepository()
     total_inserted = 0
     total_skipped = 0
+    embeddings = _embeddings_enabled()
+    # None once Ollama turned out to be unavailable
+    embedded: Optional[int] = 0
 
-    for name in selected:
-        items = sheets[name]
+    for name, items in parser.iter_sheets(file_path, changed, workers):
         tag = f"{upload_tag}_{name}" if len(selected) > 1 else upload_tag
+        known_keys = set() if force else imports.get_known_keys(records[name])
+        inserted = skipped = 0
+        new_ids: List[int] = []
+
+        for chunk in _chunked(items, _IMPORT_CHUNK_SIZE):
+            # Items this sheet already added count as skipped
+            new_chunk = _new_items(chunk, known_keys)
+            skipped += len(chunk) - len(new_chunk)
+            chunk = new_chunk
+            if not chunk:
+                continue
+
+            for item in chunk:
+                item.upload_tag = tag
+                item.source_file = file_path.name
+
+            chunk_inserted, chunk_skipped = repo.add_vocabulary_with_weekly_fields(
+                chunk, file_path.name, tag
+            )
+            inserted += chunk_inserted
+            skipped += chunk_skipped
+            new_ids.extend(item.id for item in chunk if item.id > 0)
 
-        for item in items:
-            item.upload_tag = tag
-            item.source_file = file_path.name
+            if embeddings and embedded is not None:
+                computed = _embed_items(chunk)
+                embedded = None if computed is None else embedded + computed
 
-        inserted, skipped = repo.add_vocabulary_with_weekly_fields(
-            items, file_path.name, tag
+        imports.record_import(
+            file_path, fingerprint, ExcelVocabParser.PARSER_VERSION,
+            (records[name].vocab_ids if records[name] else []) + new_ids, sheet=name
         )
+
         total_inserted += inserted
         total_skipped += skipped
         print(f"  ✓ {name}: {inserted} importiert, {skipped} übersprungen")
 
+    if total_inserted + total_skipped == 0:
+        raise ValueError("Keine Vokabeln in der Excel-Datei gefunden.")
+
     print(f"\n✓ Gesamt: {total_inserted} Vokabeln importiert!")
     if total_skipped > 0:
         print(f"  ({total_skipped} Duplikate übersprungen)")
 
+    if embeddings:
+        _report_embeddings(embedded)
+
 
 def handle_vocab_learn_command(args: argparse.Namespace) -> None:
     """
@@ -181,7 +361,7 @@ def handle_vocab_learn_command(args: argparse.Namespace) -> None:
     
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
-                                   Expected to have 'limit' and 'test' attributes.
+                                   Expected to have 'limit', 'test' and 'grading' attributes.
     """
     from nihon_cli.core.quiz_vocab import VocabQuiz
     from nihon_cli.core.timer import LearningTimer
@@ -190,7 +370,7 @@ def handle_vocab_learn_command(args: argparse.Namespace) -> None:
     try:
         # Initialize repository and quiz engine
         repository = VocabRepository()
-        quiz = VocabQuiz(repository)
+        quiz = VocabQuiz(repository, grading=args.grading)
         
         # Determine timer interval based on test mode
         interval_seconds = 5 if args.test else 1500
@@ -225,7 +405,7 @@ def handle_weekly_session_start_command(args: argparse.Namespace) -> None:
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
-                                   Expected to have 'test' attribute.
+                                   Expected to have 'test' and 'grading' attributes.
     """
     from datetime import date
     from nihon_cli.core.quiz_weekly import WeeklySessionQuiz
@@ -275,7 +455,7 @@ def handle_weekly_session_start_command(args: argparse.Namespace) -> None:
                 sys.exit(1)
 
         # Initialize quiz engine
-        quiz = WeeklySessionQuiz(vocab_repo, session_repo)
+        quiz = WeeklySessionQuiz(vocab_repo, session_repo, grading=args.grading)
 
         # Determine timer interval
         interval_seconds = 5 if args.test else 1500
@@ -305,32 +485,41 @@ def handle_weekly_session_import_image_command(args: argparse.Namespace) -> None
     """
     Handler for the 'vocab weekly-session import-image' command.
 
-    Imports vocabulary from an image using OCR (OpenAI Vision API).
+    Imports vocabulary from one or more images using OCR (OpenAI Vision API).
+    The images are extracted concurrently and their results merged into
+    one selection.
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
-                                   Expected to have 'image_path' and 'tag' attributes.
+                                   Expected to have 'image_paths', 'tag' and
+                                   'workers' attributes.
     """
     from datetime import date
-    from pathlib import Path
-    from nihon_cli.core.ocr_parser import OpenAIVisionParser
+    from nihon_cli.core.ocr_parser import (
+        DEFAULT_OCR_WORKERS,
+        OpenAIVisionParser,
+        collect_image_paths,
+    )
     from nihon_cli.core.vocabulary import VocabularyItem
     from nihon_cli.infra.repository import VocabRepository
     from nihon_cli.infra.weekly_session_repository import WeeklySessionRepository
     from nihon_cli.ui.item_selector import VocabItemSelector
 
     try:
-        image_path = Path(args.image_path)
+        image_paths = collect_image_paths(args.image_paths)
+
+        if not image_paths:
+            print(f"✗ Keine Bilddateien gefunden: {' '.join(args.image_paths)}")
+            sys.exit(1)
 
-        if not image_path.exists():
-            print(f"✗ Bilddatei nicht gefunden: {image_path}")
+        missing = [path for path in image_paths if not path.exists()]
+        if missing:
+            for path in missing:
+                print(f"✗ Bilddatei nicht gefunden: {path}")
             sys.exit(1)
 
-        # Extract vocabulary from image
-        print("🔍 Extrahiere Vokabeln aus Bild...")
         try:
             parser = OpenAIVisionParser()
-            extracted_items = parser.extract_vocabulary_from_image(image_path)
         except ImportError as e:
             print(f"\n✗ Fehler: {e}")
             print("\nBitte installieren Sie das openai Package:")
@@ -342,7 +531,40 @@ def handle_weekly_session_import_image_command(args: argparse.Namespace) -> None
             print("  export OPENAI_API_KEY='your-api-key'")
             sys.exit(1)
 
+        # Extract vocabulary from all images, reporting each as it finishes
+        total = len(image_paths)
+        print(f"🔍 Extrahiere Vokabeln aus {total} Bild(ern)...")
+        finished = 0
+
+        def report(result) -> None:
+            nonlocal finished
+            finished += 1
+            name = result.image_path.name
+            if result.error:
+                print(f"  [{finished}/{total}] ✗ {name}: {result.error}")
+            else:
+                retries = f" ({result.attempts} Versuche)" if result.attempts > 1 else ""
+                print(f"  [{finished}/{total}] ✓ {name}: {len(result.items)} Vokabeln{retries}")
+
+        results = parser.extract_vocabulary_from_images(
+            image_paths, args.workers or DEFAULT_OCR_WORKERS, report
+        )
+
+        failed = [result for result in results if result.error]
+        if len(failed) == total:
+            print("\n✗ Aus keinem Bild konnten Vokabeln extrahiert werden.")
+            sys.exit(1)
+
+        # Merge in argument order, remembering the image of each item
+        extracted_items = []
+        for result in results:
+            for item_dict in result.items:
+                item_dict['source_file'] = result.image_path.name
+                extracted_items.append(item_dict)
+
         print(f"✓ {len(extracted_items)} Vokabeln gefunden")
+        if failed:
+            print(f"⚠ {len(failed)} Bild(er) fehlgeschlagen, siehe oben")
 
         if not extracted_items:
             print("Keine Vokabeln extrahiert. Bitte prüfen Sie das Bild.")
@@ -356,31 +578,37 @@ def handle_weekly_session_import_image_command(args: argparse.Namespace) -> None
             print("Import abgebrochen.")
             sys.exit(0)
 
-        # Convert to VocabularyItem objects
-        vocab_items = []
+        # Convert to VocabularyItem objects, grouped by source image
+        upload_tag = args.tag or f"ocr_{date.today().isoformat()}"
+        items_by_source = {}
         for item_dict in selected_items:
             vocab_item = VocabularyItem(
                 id=0,  # Will be set by database
                 japanese_vocab=item_dict['japanese'],
                 german_vocab=item_dict['german'],
-                source_file=image_path.name,
-                upload_tag=args.tag or f"ocr_{date.today().isoformat()}",
+                source_file=item_dict['source_file'],
+                upload_tag=upload_tag,
                 vocab_type=item_dict.get('vocab_type'),
                 base_form=item_dict.get('base_form'),
                 weekly_correct_german=0,
                 weekly_correct_japanese=0
             )
-            vocab_items.append(vocab_item)
+            items_by_source.setdefault(vocab_item.source_file, []).append(vocab_item)
 
         # Insert into database
         vocab_repo = VocabRepository()
-        inserted, skipped = vocab_repo.add_vocabulary_with_weekly_fields(
-            vocab_items,
-            image_path.name,
-            args.tag or f"ocr_{date.today().isoformat()}"
-        )
+        inserted = skipped = 0
+        vocab_items = []
+        for source_file, items in items_by_source.items():
+            source_inserted, source_skipped = vocab_repo.add_vocabulary_with_weekly_fields(
+                items, source_file, upload_tag
+            )
+            inserted += source_inserted
+            skipped += source_skipped
+            vocab_items.extend(items)
 
         print(f"\n✓ {inserted} Vokabeln importiert ({skipped} Duplikate übersprungen)")
+        _precompute_embeddings(vocab_items)
 
         # Add to current weekly session if one exists
         session_repo = WeeklySessionRepository()
@@ -429,21 +657,18 @@ def handle_weekly_session_new_command(args: argparse.Namespace) -> None:
                 print("Abgebrochen.")
                 sys.exit(0)
 
-        # Get all available vocabulary
-        all_vocab = vocab_repo.get_incomplete_vocabulary(limit=1000)
+        # Get available vocabulary, filtered by tag if specified
+        tag = getattr(args, 'tag', None)
+        all_vocab = vocab_repo.get_incomplete_vocabulary(limit=1000, tag=tag)
 
         if not all_vocab:
-            print("\n✗ Keine Vokabeln verfügbar.")
-            print("Bitte importieren Sie zuerst Vokabeln mit 'vocab upload' oder 'vocab weekly-session import-image'.")
+            if tag:
+                print(f"\n✗ Keine Vokabeln mit Tag '{tag}' gefunden.")
+            else:
+                print("\n✗ Keine Vokabeln verfügbar.")
+                print("Bitte importieren Sie zuerst Vokabeln mit 'vocab upload' oder 'vocab weekly-session import-image'.")
             sys.exit(1)
 
-        # Filter by tag if specified
-        if hasattr(args, 'tag') and args.tag:
-            all_vocab = [v for v in all_vocab if v.upload_tag == args.tag]
-            if not all_vocab:
-                print(f"\n✗ Keine Vokabeln mit Tag '{args.tag}' gefunden.")
-                sys.exit(1)
-
         # Display available vocabulary
         print("\n" + draw_box(
             f"Verfügbare Vokabeln: {len(all_vocab)}",
@@ -730,6 +955,66 @@ def handle_kanji_list_command(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def handle_vocab_aliases_list_command(args: argparse.Namespace) -> None:
+    """
+    Handler for the 'vocab aliases list' command.
+
+    Shows the answer aliases learned from accepted semantic verdicts.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+                                   Expected to have a 'search' attribute.
+    """
+    from datetime import datetime
+    from nihon_cli.infra.alias_index import AliasIndex
+
+    try:
+        aliases = AliasIndex().list_learned(args.search)
+
+        if not aliases:
+            print("Keine gelernten Aliase gespeichert.")
+            return
+
+        print(f"\nGelernte Aliase: {len(aliases)}\n")
+        for alias in aliases:
+            expected = " / ".join(alias.expected.split("\n"))
+            learned_on = datetime.fromtimestamp(alias.created_at).strftime("%Y-%m-%d")
+            print(f"  {alias.alias}  →  {expected}")
+            print(f"      {alias.backend}, {alias.model}, gelernt am {learned_on}")
+
+    except Exception as e:
+        print(f"✗ Fehler: {e}")
+        sys.exit(1)
+
+
+def handle_vocab_aliases_delete_command(args: argparse.Namespace) -> None:
+    """
+    Handler for the 'vocab aliases delete' command.
+
+    Forgets a learned alias, so the answer is judged by the model again.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+                                   Expected to have 'alias' and 'expected' attributes.
+    """
+    from nihon_cli.infra.alias_index import AliasIndex
+
+    try:
+        alias = args.alias.strip().lower()
+        expected = args.expected.strip().lower() if args.expected else None
+        removed = AliasIndex().delete(alias, expected)
+
+        if removed:
+            print(f"✓ {removed} Alias(e) für '{alias}' gelöscht")
+        else:
+            print(f"✗ Kein gelernter Alias '{alias}' gefunden")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"✗ Fehler: {e}")
+        sys.exit(1)
+
+
 def handle_config_set_command(key: str, value: str) -> None:
     """
     Handler for the 'config set' command.
@@ -740,6 +1025,21 @@ def handle_config_set_command(key: str, value: str) -> None:
         key: The configuration key to set
         value: The configuration value to set
     """
+    if key == "db_profile" and value not in DB_PROFILES:
+        print(f"✗ Unbekanntes Speicherprofil: {value} (erlaubt: {', '.join(DB_PROFILES)})")
+        sys.exit(1)
+    if key == "semantic_backend" and value not in SEMANTIC_BACKENDS:
+        print(f"✗ Unbekanntes Prüfverfahren: {value} (erlaubt: {', '.join(SEMANTIC_BACKENDS)})")
+        sys.exit(1)
+    if key == "embedding_threshold":
+        try:
+            valid = 0.0 <= float(value) <= 1.0
+        except ValueError:
+            valid = False
+        if not valid:
+            print(f"✗ Ungültiger Schwellenwert: {value} (erlaubt: Zahl zwischen 0 und 1)")
+            sys.exit(1)
+
     try:
         save_config(key, value)
         print(f"✓ Konfiguration gespeichert: {key} = {value}")
@@ -863,6 +1163,17 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         type=str,
         help="Optional tag for this upload (default: filename without extension)"
     )
+    upload_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes parsing Excel sheets in parallel (default: 1)"
+    )
+    upload_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Import again even if the file is unchanged since the last import"
+    )
     upload_parser.set_defaults(func=handle_vocab_upload_command)
 
     # vocab learn subcommand
@@ -881,8 +1192,49 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run in 5-second test mode instead of the standard 25-minute intervals"
     )
+    learn_parser.add_argument(
+        "--grading",
+        choices=GRADING_MODES,
+        default=DEFAULT_GRADING_MODE,
+        help="'async' checks answers with the LLM in the background, 'end' in one "
+             "batch at the end of the session (default: sync)"
+    )
     learn_parser.set_defaults(func=handle_vocab_learn_command)
 
+    # vocab aliases subcommand
+    aliases_parser = vocab_subparsers.add_parser(
+        "aliases",
+        help="Manage answer aliases learned from semantic checks"
+    )
+    aliases_subparsers = aliases_parser.add_subparsers(
+        dest="aliases_command", help="Alias sub-commands"
+    )
+    aliases_list_parser = aliases_subparsers.add_parser(
+        "list",
+        help="Show learned aliases"
+    )
+    aliases_list_parser.add_argument(
+        "--search",
+        type=str,
+        help="Only aliases whose answer or expected answer contains this text"
+    )
+    aliases_list_parser.set_defaults(func=handle_vocab_aliases_list_command)
+    aliases_delete_parser = aliases_subparsers.add_parser(
+        "delete",
+        help="Forget a learned alias, so the answer is judged again"
+    )
+    aliases_delete_parser.add_argument(
+        "alias",
+        type=str,
+        help="The accepted answer to forget"
+    )
+    aliases_delete_parser.add_argument(
+        "--expected",
+        type=str,
+        help="Only forget it for this expected answer (default: for all)"
+    )
+    aliases_delete_parser.set_defaults(func=handle_vocab_aliases_delete_command)
+
     # Subparser for 'weekly-session' (top-level command)
     weekly_parser = subparsers.add_parser(
         "weekly-session",
@@ -915,23 +1267,36 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run in 5-second test mode instead of 25-minute intervals"
     )
+    start_parser.add_argument(
+        "--grading",
+        choices=GRADING_MODES,
+        default=DEFAULT_GRADING_MODE,
+        help="'async' checks answers with the LLM in the background, 'end' in one "
+             "batch at the end of the session (default: sync)"
+    )
     start_parser.set_defaults(func=handle_weekly_session_start_command)
 
     # weekly-session import-image
     import_parser = weekly_subparsers.add_parser(
         "import-image",
-        help="Import vocabulary from an image using OCR"
+        help="Import vocabulary from images using OCR"
     )
     import_parser.add_argument(
-        "image_path",
-        type=str,
-        help="Path to the image file"
+        "image_paths",
+        nargs="+",
+        metavar="image_path",
+        help="Image files, directories or glob patterns"
     )
     import_parser.add_argument(
         "--tag",
         type=str,
         help="Optional tag for this import (default: ocr_<date>)"
     )
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Images sent to the OCR API at the same time (default: 4)"
+    )
     import_parser.set_defaults(func=handle_weekly_session_import_image_command)
 
     # weekly-session status
@@ -1026,7 +1391,8 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     set_parser.add_argument(
         "key",
         type=str,
-        help="Configuration key to set"
+        help="Configuration key to set, e.g. db_profile (safe, the default, or "
+             "fast: quicker writes, but a crash can lose the last transactions)"
     )
     set_parser.add_argument(
         "value",
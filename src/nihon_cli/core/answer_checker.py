@@ -1,23 +1,52 @@
 """Semantic answer checking for vocabulary quizzes.
 
 Uses a local Ollama LLM to determine if a user's answer is semantically
-equivalent to the expected answer. Falls back to exact matching when
-Ollama is not available.
+equivalent to the expected answer, either by asking the chat model for a
+verdict or by comparing embeddings (see core.embedding_matcher). Falls
+back to exact matching when Ollama is not available.
 """
 
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import List, Optional
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from nihon_cli.core.kana_normalizer import normalize_japanese, prepare_kana_answers
+
+if TYPE_CHECKING:
+    from nihon_cli.core.embedding_matcher import EmbeddingMatcher
+    from nihon_cli.infra.alias_index import AliasIndex
+    from nihon_cli.infra.verdict_cache import VerdictCache
 
 _TYPO_THRESHOLD = 0.87
 
+# Number of distinct answer sets kept in normalized form
+_PREPARED_CACHE_SIZE = 1024
+
 try:
+    import httpx
     import ollama as _ollama_client
 
     _OLLAMA_AVAILABLE = True
 except ImportError:
     _OLLAMA_AVAILABLE = False
 
+# The health probe must fail fast; model calls may take long once connected
+_PROBE_TIMEOUT_SECONDS = 0.5
+_CONNECT_TIMEOUT_SECONDS = 0.5
+_REQUEST_TIMEOUT_SECONDS = 120.0
+
+# Consecutive failures that open the circuit breaker ...
+_BREAKER_THRESHOLD = 3
+# ... and for how long semantic checks are then skipped
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
 _PROMPT_TEMPLATE = """\
 Du bist ein Korrektor für ein Japanisch-Deutsch Vokabelquiz (Anfängerniveau A1).
 Entscheide ob der Schüler das richtige Wort/Konzept gemeint hat.
@@ -69,19 +98,365 @@ Antwort des Schülers: {answer}
 Antworte NUR mit: JA oder NEIN"""
 
 
+# Batch prompts reuse the instructions of the templates above (everything
+# before the single answer) and ask for one verdict per numbered answer
+_BATCH_TAIL = """\
+Bewerte jede der folgenden Antworten einzeln:
+
+{cases}
+
+Antworte NUR mit einem JSON-Array mit genau {count} Einträgen "JA" oder "NEIN" in derselben Reihenfolge, z.B. ["JA", "NEIN"]"""
+
+_BATCH_CASE = "{number}. Erwartete Antwort(en): {expected} | Antwort des Schülers: {answer}"
+
+# Maximum number of answers judged with one prompt
+_BATCH_SIZE = 20
+
+# (user input, expected answers, direction) of an answer to judge
+SemanticCase = Tuple[str, List[str], str]
+
+
+def _prompt_hash(template: str) -> str:
+    """Fingerprint of a prompt template; cached verdicts depend on it."""
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+_PROMPT_HASH = _prompt_hash(_PROMPT_TEMPLATE)
+_PROMPT_JP_HASH = _prompt_hash(_PROMPT_JP_TEMPLATE)
+
+
+class OllamaHealth:
+    """Process-wide health state of the Ollama daemon, with a circuit breaker.
+
+    A successful probe is shared by every AnswerChecker of the process.
+    Failed probes and failed model calls are counted; after
+    _BREAKER_THRESHOLD consecutive failures the breaker opens and
+    is_available() answers False without any network access until the
+    cooldown has passed. Then a single probe decides again.
+    """
+
+    def __init__(
+        self,
+        threshold: int = _BREAKER_THRESHOLD,
+        cooldown_seconds: float = _BREAKER_COOLDOWN_SECONDS,
+        probe_timeout_seconds: float = _PROBE_TIMEOUT_SECONDS,
+    ):
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._available = False
+        self._failures = 0
+        self._open_until = 0.0
+        self._client: Optional[Any] = None
+        self._probe_client: Optional[Any] = None
+
+        # Probe metrics
+        self._probes = 0
+        self._probe_failures = 0
+        self._latency_total = 0.0
+        self._latency_last = 0.0
+        self._latency_max = 0.0
+
+    def is_available(self) -> bool:
+        """Whether semantic checks should be attempted right now.
+
+        Returns:
+            False while the ollama package is missing or the breaker is
+            open, otherwise the result of the last (or a fresh) probe
+        """
+        if not _OLLAMA_AVAILABLE:
+            return False
+        with self._lock:
+            if time.monotonic() < self._open_until:
+                return False
+            if self._available:
+                return True
+            return self._probe()
+
+    def client(self) -> Any:
+        """Shared Ollama client with a short connect timeout."""
+        with self._lock:
+            if self._client is None:
+                self._client = _ollama_client.Client(
+                    timeout=httpx.Timeout(
+                        _REQUEST_TIMEOUT_SECONDS, connect=_CONNECT_TIMEOUT_SECONDS
+                    )
+                )
+            return self._client
+
+    def record_success(self) -> None:
+        """Note a successful model call."""
+        with self._lock:
+            self._available = True
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Note a failed model call; the next check probes again."""
+        with self._lock:
+            self._record_failure()
+
+    def stats(self) -> Dict[str, Any]:
+        """Probe metrics and breaker state.
+
+        Returns:
+            Dictionary with probe counts, probe latencies in milliseconds
+            and the breaker state
+        """
+        with self._lock:
+            return {
+                'probes': self._probes,
+                'probe_failures': self._probe_failures,
+                'last_latency_ms': self._latency_last * 1000,
+                'avg_latency_ms': (
+                    self._latency_total / self._probes * 1000 if self._probes else 0.0
+                ),
+                'max_latency_ms': self._latency_max * 1000,
+                'consecutive_failures': self._failures,
+                'breaker_open': time.monotonic() < self._open_until,
+            }
+
+    def _probe(self) -> bool:
+        """List the installed models with a short timeout; lock must be held."""
+        start = time.perf_counter()
+        try:
+            if self._probe_client is None:
+                self._probe_client = _ollama_client.Client(timeout=self.probe_timeout_seconds)
+            self._probe_client.list()
+            ok = True
+        except Exception:
+            ok = False
+        latency = time.perf_counter() - start
+
+        self._probes += 1
+        self._latency_total += latency
+        self._latency_last = latency
+        self._latency_max = max(self._latency_max, latency)
+        logging.debug(f"Ollama probe {'ok' if ok else 'failed'} in {latency * 1000:.1f} ms")
+
+        if ok:
+            self._available = True
+            self._failures = 0
+        else:
+            self._probe_failures += 1
+            self._record_failure()
+        return ok
+
+    def _record_failure(self) -> None:
+        """Count a failure and open the breaker at the threshold; lock must be held."""
+        self._available = False
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            logging.info(
+                f"Ollama unavailable after {self._failures} failures, "
+                f"skipping semantic checks for {self.cooldown_seconds:.0f} s"
+            )
+
+
+_OLLAMA_HEALTH = OllamaHealth()
+
+
+def get_ollama_health() -> OllamaHealth:
+    """The process-wide OllamaHealth instance."""
+    return _OLLAMA_HEALTH
+
+
 @dataclass
 class AnswerCheckResult:
     accepted: bool
-    method: str  # "exact", "semantic", "fallback_exact"
+    method: str  # "exact", "kana", "typo", "semantic", "fallback_exact"
     feedback: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class ExpectedAnswers:
+    """An answer set in the form the checks compare against.
+
+    Attributes:
+        originals: The answers as stored, used in feedback messages
+        normalized: Stripped, lower-cased answers, same order as originals
+        normalized_set: Set of the normalized answers for exact matching
+    """
+
+    originals: Tuple[str, ...]
+    normalized: Tuple[str, ...]
+    normalized_set: frozenset
+
+
+@lru_cache(maxsize=_PREPARED_CACHE_SIZE)
+def prepare_answers(answers: Tuple[str, ...]) -> ExpectedAnswers:
+    """Normalize an answer set once; repeated questions reuse the result.
+
+    Args:
+        answers: Expected answers of a vocabulary item
+
+    Returns:
+        ExpectedAnswers for the given answers
+    """
+    normalized = tuple(a.strip().lower() for a in answers)
+    return ExpectedAnswers(answers, normalized, frozenset(normalized))
+
+
+def _bounded_indel_distance(a: str, b: str, bound: int) -> int:
+    """Insert/delete edit distance between a and b, capped at bound + 1.
+
+    Only the diagonal band of width 2 * bound + 1 is computed, and the
+    computation stops as soon as a whole row exceeds the bound.
+
+    Args:
+        a: First string
+        b: Second string
+        bound: Largest distance of interest
+
+    Returns:
+        The distance if it is at most bound, otherwise bound + 1
+    """
+    la, lb = len(a), len(b)
+    over = bound + 1
+    if abs(la - lb) > bound:
+        return over
+
+    prev = [min(j, over) for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        lo, hi = max(1, i - bound), min(lb, i + bound)
+        cur = [over] * (lb + 1)
+        if i <= bound:
+            cur[0] = i
+        row_min = cur[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            if ca == b[j - 1]:
+                v = prev[j - 1]
+            else:
+                v = prev[j] + 1
+                w = cur[j - 1] + 1
+                if w < v:
+                    v = w
+                if v > over:
+                    v = over
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > bound:
+            return over
+        prev = cur
+    return prev[lb]
+
+
+class FuzzyMatcher:
+    """Typo matcher based on difflib.SequenceMatcher similarity ratios.
+
+    Subclasses may skip candidates that provably cannot reach the
+    threshold, but must report the same ratio for all other candidates,
+    so that every matcher accepts exactly the same answers.
+    """
+
+    def __init__(self, threshold: float = _TYPO_THRESHOLD):
+        self.threshold = threshold
+
+    def scores(self, answer: str, candidates: Sequence[str]) -> List[Optional[float]]:
+        """Score one normalized answer against many normalized candidates.
+
+        Args:
+            answer: The normalized user answer
+            candidates: Normalized expected answers
+
+        Returns:
+            Similarity ratio per candidate, or None for candidates that
+            cannot reach the threshold
+        """
+        return [SequenceMatcher(None, answer, c).ratio() for c in candidates]
+
+    def best_match(
+        self, answer: str, candidates: Sequence[str]
+    ) -> Optional[Tuple[int, float]]:
+        """Find the most similar candidate at or above the threshold.
+
+        On equal ratios the first candidate wins.
+
+        Args:
+            answer: The normalized user answer
+            candidates: Normalized expected answers
+
+        Returns:
+            (index, ratio) of the best candidate, or None if no candidate
+            reaches the threshold
+        """
+        best: Optional[Tuple[int, float]] = None
+        for index, ratio in enumerate(self.scores(answer, candidates)):
+            if ratio is not None and (best is None or ratio > best[1]):
+                best = (index, ratio)
+        if best is None or best[1] < self.threshold:
+            return None
+        return best
+
+
+class BandedFuzzyMatcher(FuzzyMatcher):
+    """FuzzyMatcher that prunes candidates with a bounded edit distance.
+
+    SequenceMatcher counts at most LCS(a, b) matching characters, so its
+    ratio is at most 1 - d / (len(a) + len(b)), where d is the
+    insert/delete distance. Candidates whose bound is below the threshold
+    are rejected by a cheap banded distance computation; SequenceMatcher
+    only runs on the few that remain.
+    """
+
+    def scores(self, answer: str, candidates: Sequence[str]) -> List[Optional[float]]:
+        results: List[Optional[float]] = []
+        for c in candidates:
+            total = len(answer) + len(c)
+            if total == 0:
+                results.append(1.0)
+                continue
+            # One extra edit of slack keeps float rounding on the safe side
+            max_distance = int((1.0 - self.threshold) * total) + 1
+            if _bounded_indel_distance(answer, c, max_distance) > max_distance:
+                results.append(None)
+            else:
+                results.append(SequenceMatcher(None, answer, c).ratio())
+        return results
+
+
 class AnswerChecker:
     """Check quiz answers with optional semantic comparison via Ollama."""
 
-    def __init__(self, model: str = "gemma3:4b"):
+    def __init__(
+        self,
+        model: str = "gemma3:4b",
+        matcher: Optional[FuzzyMatcher] = None,
+        verdict_cache: Optional["VerdictCache"] = None,
+        semantic_backend: Optional[str] = None,
+        embedding_matcher: Optional["EmbeddingMatcher"] = None,
+        alias_index: Optional["AliasIndex"] = None,
+        strip_qualifiers: Optional[bool] = None,
+    ):
         self.model = model
-        self._ollama_ok: Optional[bool] = None
+        self.matcher = matcher or BandedFuzzyMatcher()
+        # Created on the first semantic check unless one is passed in
+        self._verdict_cache = verdict_cache
+        self._verdict_cache_failed = False
+        # Loaded on the first non-exact answer unless one is passed in
+        self._alias_index = alias_index
+        self._alias_index_failed = False
+
+        if strip_qualifiers is None:
+            from nihon_cli.infra.config import load_strip_qualifiers
+
+            strip_qualifiers = load_strip_qualifiers()
+        self.strip_qualifiers = strip_qualifiers
+
+        if semantic_backend is None:
+            from nihon_cli.infra.config import load_semantic_backend
+
+            semantic_backend = load_semantic_backend()
+        self.semantic_backend = semantic_backend
+        if semantic_backend == "embedding" and embedding_matcher is None:
+            from nihon_cli.core.embedding_matcher import EmbeddingMatcher
+
+            embedding_matcher = EmbeddingMatcher.from_config()
+        self.embedding_matcher = embedding_matcher
 
     def check(
         self,
@@ -92,32 +467,74 @@ class AnswerChecker:
         """Check if the user's answer is acceptable.
 
         1. Exact match (fast path)
-        2. For jp_to_de only: semantic LLM check via Ollama
-        3. Graceful fallback to exact-only when Ollama unavailable
+        2. Kana match: for de_to_jp, after kana normalization
+        3. Known alias (seed synonyms and earlier accepted verdicts)
+        4. Typo match
+        5. Prefix match against a longer or shorter expected answer
+        6. Cached semantic verdict
+        7. Semantic check via Ollama (chat model or embeddings)
+        8. Graceful fallback to rejection when Ollama is unavailable
+
+        Steps 1-6 are check_local(), steps 7-8 check_semantic().
+        """
+        result = self.check_local(user_input, correct_answers, direction)
+        if result is not None:
+            return result
+        return self.check_semantic(user_input, correct_answers, direction)
+
+    def check_local(
+        self,
+        user_input: str,
+        correct_answers: List[str],
+        direction: str,
+    ) -> Optional[AnswerCheckResult]:
+        """Run the checks that need no model round trip.
+
+        Covers exact match, kana-normalized match, known aliases, typo
+        match, prefix match and cached semantic verdicts. Takes
+        microseconds.
+
+        Returns:
+            The result, or None if the answer needs check_semantic()
         """
         normalized = user_input.strip().lower()
+        expected = prepare_answers(tuple(correct_answers))
 
         # Fast path: exact match
-        if any(normalized == a.strip().lower() for a in correct_answers):
+        if normalized in expected.normalized_set:
             return AnswerCheckResult(accepted=True, method="exact")
 
+        # Katakana, romaji and width variants of a Japanese answer
+        # ("haha", "ハハ") compare equal after normalization
+        if direction == "de_to_jp":
+            kana_answers = prepare_kana_answers(tuple(correct_answers), self.strip_qualifiers)
+            kana = normalize_japanese(user_input, self.strip_qualifiers)
+            if kana in kana_answers:
+                return AnswerCheckResult(
+                    accepted=True, method="kana",
+                    feedback=f"korrekt: {kana_answers[kana]}",
+                )
+
+        # Known equivalences ("そぼ" for "おばあさん", also as "obaasan")
+        # never reach the model
+        alias_index = self._get_alias_index()
+        if alias_index is not None and alias_index.lookup(
+            normalized, expected.normalized, self._alias_source(direction)
+        ):
+            return self._semantic_result(True, correct_answers, direction)
+
         # Typo check — pick best match only
-        best_ratio, best_answer = 0.0, ""
-        for a in correct_answers:
-            ratio = SequenceMatcher(None, normalized, a.strip().lower()).ratio()
-            if ratio > best_ratio:
-                best_ratio, best_answer = ratio, a
-        if best_ratio >= _TYPO_THRESHOLD:
+        match = self.matcher.best_match(normalized, expected.normalized)
+        if match is not None:
             return AnswerCheckResult(
                 accepted=True, method="typo",
-                feedback=f"Tippfehler erkannt, korrekt: {best_answer}",
+                feedback=f"Tippfehler erkannt, korrekt: {expected.originals[match[0]]}",
             )
 
         # Substring check: user's answer is the core of a longer expected answer
         # e.g. "jüngerer Bruder" matches "jüngerer Bruder von jemand anderem"
         # or "Großvater von jemand anderem" matches "Großvater"
-        for a in correct_answers:
-            a_lower = a.strip().lower()
+        for a, a_lower in zip(expected.originals, expected.normalized):
             if (a_lower.startswith(normalized) and len(normalized) >= len(a_lower) * 0.4) or \
                (normalized.startswith(a_lower) and len(a_lower) >= len(normalized) * 0.4):
                 return AnswerCheckResult(
@@ -125,23 +542,225 @@ class AnswerChecker:
                     feedback=f"als korrekt gewertet, erwartete Antwort: {a}",
                 )
 
-        # Try semantic check
+        # Earlier verdicts are reused, even while Ollama is unavailable
+        cached = self._cached_verdict(normalized, expected, direction)
+        if cached is not None:
+            return self._semantic_result(cached, correct_answers, direction)
+
+        return None
+
+    def check_semantic(
+        self,
+        user_input: str,
+        correct_answers: List[str],
+        direction: str,
+    ) -> AnswerCheckResult:
+        """Judge an answer with the Ollama model.
+
+        Blocks for the model round trip. Safe to call from a worker thread.
+
+        Returns:
+            The semantic verdict, or a rejecting "fallback_exact" result
+            when Ollama is unavailable
+        """
         if not self._is_ollama_available():
             return AnswerCheckResult(accepted=False, method="fallback_exact")
 
-        return self._semantic_check(normalized, correct_answers, direction)
+        if self.embedding_matcher is not None:
+            return self._embedding_check(user_input.strip().lower(), correct_answers, direction)
+        return self._semantic_check(user_input.strip().lower(), correct_answers, direction)
 
-    def _is_ollama_available(self) -> bool:
-        if not _OLLAMA_AVAILABLE:
-            return False
-        if self._ollama_ok is not None:
-            return self._ollama_ok
+    def check_semantic_batch(self, cases: List[SemanticCase]) -> List[AnswerCheckResult]:
+        """Judge many answers with one model round trip per direction.
+
+        All cases of a direction are sent as one numbered list and the
+        model replies with a JSON array of verdicts, so the long prompt
+        instructions are processed once instead of once per answer. If a
+        reply cannot be parsed, its cases are judged one by one.
+
+        Args:
+            cases: (user input, expected answers, direction) per answer
+
+        Returns:
+            One result per case, in the same order
+        """
+        if not self._is_ollama_available():
+            return [AnswerCheckResult(accepted=False, method="fallback_exact") for _ in cases]
+
+        # An embedding check is a single cheap request; nothing to batch
+        if self.embedding_matcher is not None:
+            return [self.check_semantic(*case) for case in cases]
+
+        results: List[Optional[AnswerCheckResult]] = [None] * len(cases)
+        for direction in ("jp_to_de", "de_to_jp"):
+            indexes = [i for i, case in enumerate(cases) if case[2] == direction]
+            for start in range(0, len(indexes), _BATCH_SIZE):
+                chunk = indexes[start:start + _BATCH_SIZE]
+                verdicts = self._batch_verdicts(
+                    [(cases[i][0].strip().lower(), cases[i][1]) for i in chunk], direction
+                )
+                for i, accepted in zip(chunk, verdicts or [None] * len(chunk)):
+                    user_input, correct_answers, _ = cases[i]
+                    if accepted is None:
+                        results[i] = self.check_semantic(user_input, correct_answers, direction)
+                    else:
+                        self._store_verdict(
+                            user_input.strip().lower(), correct_answers, direction, accepted
+                        )
+                        results[i] = self._semantic_result(accepted, correct_answers, direction)
+
+        return results
+
+    def _batch_verdicts(
+        self, cases: List[Tuple[str, List[str]]], direction: str
+    ) -> Optional[List[bool]]:
+        template = _PROMPT_JP_TEMPLATE if direction == "de_to_jp" else _PROMPT_TEMPLATE
+        instructions = template.split("Erwartete Antwort(en):")[0]
+        prompt = instructions + _BATCH_TAIL.format(
+            cases="\n".join(
+                _BATCH_CASE.format(number=n, expected=", ".join(answers), answer=answer)
+                for n, (answer, answers) in enumerate(cases, 1)
+            ),
+            count=len(cases),
+        )
+
+        health = get_ollama_health()
+        try:
+            response = health.client().chat(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                options={"temperature": 0, "num_predict": 8 * len(cases) + 16},
+            )
+            reply = response["message"]["content"]
+        except Exception:
+            health.record_failure()
+            return None
+        health.record_success()
+
+        try:
+            verdicts = json.loads(reply[reply.index("["):reply.rindex("]") + 1])
+        except ValueError:
+            return None
+
+        if not isinstance(verdicts, list) or len(verdicts) != len(cases):
+            return None
+        if all(isinstance(v, bool) for v in verdicts):
+            return verdicts
+        return [str(v).strip().upper().startswith("JA") for v in verdicts]
+
+    def prewarm(self) -> None:
+        """Load the model into Ollama's memory ahead of the first check.
+
+        An empty generate request makes Ollama load the model without
+        producing output, so the first semantic check does not pay for it.
+        """
+        if not self._is_ollama_available():
+            return
+        health = get_ollama_health()
         try:
-            _ollama_client.list()
-            self._ollama_ok = True
+            if self.embedding_matcher is not None:
+                self.embedding_matcher.prewarm()
+            else:
+                health.client().generate(model=self.model, prompt="")
         except Exception:
-            self._ollama_ok = False
-        return self._ollama_ok
+            health.record_failure()
+
+    def _is_ollama_available(self) -> bool:
+        return get_ollama_health().is_available()
+
+    def _get_verdict_cache(self) -> Optional["VerdictCache"]:
+        """The verdict cache, opened on first use; None if it cannot be."""
+        if self._verdict_cache is None and not self._verdict_cache_failed:
+            try:
+                from nihon_cli.infra.verdict_cache import VerdictCache
+
+                self._verdict_cache = VerdictCache()
+            except (sqlite3.Error, OSError):
+                self._verdict_cache_failed = True
+        return self._verdict_cache
+
+    def _get_alias_index(self) -> Optional["AliasIndex"]:
+        """The alias index, loaded on first use; None if it cannot be."""
+        if self._alias_index is None and not self._alias_index_failed:
+            try:
+                from nihon_cli.infra.alias_index import AliasIndex
+
+                self._alias_index = AliasIndex(
+                    japanese_key=partial(
+                        normalize_japanese, strip_qualifiers=self.strip_qualifiers
+                    )
+                )
+            except (sqlite3.Error, OSError):
+                self._alias_index_failed = True
+        return self._alias_index
+
+    def _cached_verdict(
+        self, user_input: str, expected: ExpectedAnswers, direction: str
+    ) -> Optional[bool]:
+        cache = self._get_verdict_cache()
+        if cache is None:
+            return None
+        model, prompt_hash = self._verdict_source(direction)
+        key = cache.make_key(model, direction, expected.normalized, user_input)
+        try:
+            return cache.get(key, prompt_hash)
+        except sqlite3.Error:
+            return None
+
+    def _store_verdict(
+        self, user_input: str, correct_answers: List[str], direction: str, accepted: bool
+    ) -> None:
+        expected = prepare_answers(tuple(correct_answers))
+
+        # Accepted answers become aliases of the checker that accepted them;
+        # rejections are only cached
+        alias_index = self._get_alias_index()
+        if accepted and alias_index is not None:
+            try:
+                alias_index.add(user_input, expected.normalized, self._alias_source(direction))
+            except sqlite3.Error:
+                pass
+
+        cache = self._get_verdict_cache()
+        if cache is None:
+            return
+        model, prompt_hash = self._verdict_source(direction)
+        key = cache.make_key(model, direction, expected.normalized, user_input)
+        try:
+            cache.put(key, prompt_hash, accepted)
+        except sqlite3.Error:
+            pass
+
+    def _verdict_source(self, direction: str) -> Tuple[str, str]:
+        """Model and prompt hash under which verdicts are cached.
+
+        Embedding verdicts are keyed by the embedding model and depend on
+        the threshold instead of a prompt.
+        """
+        if self.embedding_matcher is not None:
+            return self.embedding_matcher.model, f"embedding:{self.embedding_matcher.threshold}"
+        return self.model, _PROMPT_JP_HASH if direction == "de_to_jp" else _PROMPT_HASH
+
+    def _alias_source(self, direction: str) -> Tuple[str, str, str]:
+        """Backend, model and prompt hash learned aliases must match."""
+        backend = "embedding" if self.embedding_matcher is not None else "chat"
+        return (backend, *self._verdict_source(direction))
+
+    @staticmethod
+    def _semantic_result(
+        accepted: bool, correct_answers: List[str], direction: str
+    ) -> AnswerCheckResult:
+        if accepted and direction == "de_to_jp":
+            feedback = f"auch korrekt, gesucht war: {', '.join(correct_answers)}"
+        elif accepted:
+            feedback = "als Synonym akzeptiert"
+        else:
+            feedback = None
+        return AnswerCheckResult(
+            accepted=accepted,
+            method="semantic",
+            feedback=feedback,
+        )
 
     def _semantic_check(
         self, user_input: str, correct_answers: List[str], direction: str = "jp_to_de"
@@ -150,24 +769,32 @@ class AnswerChecker:
         template = _PROMPT_JP_TEMPLATE if direction == "de_to_jp" else _PROMPT_TEMPLATE
         prompt = template.format(expected=expected, answer=user_input)
 
+        health = get_ollama_health()
         try:
-            response = _ollama_client.chat(
+            response = health.client().chat(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 options={"temperature": 0, "num_predict": 10},
             )
             reply = response["message"]["content"].strip().upper()
             accepted = reply.startswith("JA")
-            if accepted and direction == "de_to_jp":
-                feedback = f"auch korrekt, gesucht war: {', '.join(correct_answers)}"
-            elif accepted:
-                feedback = "als Synonym akzeptiert"
-            else:
-                feedback = None
-            return AnswerCheckResult(
-                accepted=accepted,
-                method="semantic",
-                feedback=feedback,
-            )
+        except Exception:
+            health.record_failure()
+            return AnswerCheckResult(accepted=False, method="fallback_exact")
+        health.record_success()
+
+        self._store_verdict(user_input, correct_answers, direction, accepted)
+        return self._semantic_result(accepted, correct_answers, direction)
+
+    def _embedding_check(
+        self, user_input: str, correct_answers: List[str], direction: str
+    ) -> AnswerCheckResult:
+        expected = prepare_answers(tuple(correct_answers))
+        try:
+            match = self.embedding_matcher.best_match(user_input, expected.normalized)
         except Exception:
             return AnswerCheckResult(accepted=False, method="fallback_exact")
+
+        accepted = match is not None
+        self._store_verdict(user_input, correct_answers, direction, accepted)
+        return self._semantic_result(accepted, correct_answers, direction)
@@ -0,0 +1,187 @@
+"""Embedding-based semantic answer matching.
+
+An alternative to asking the chat model for a verdict: the answer and the
+expected meanings are embedded with a local Ollama embedding model and
+compared by cosine similarity against a calibrated threshold. Vectors of
+the expected meanings are computed once (at import time, or on first use)
+and stored in the meaning_embeddings table, so checking an answer costs
+one embedding request plus a dot product per expected meaning.
+"""
+
+import sqlite3
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from nihon_cli.core.answer_checker import get_ollama_health
+from nihon_cli.infra.config import (
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_EMBEDDING_THRESHOLD,
+    load_embedding_settings,
+)
+from nihon_cli.infra.embedding_store import EmbeddingStore, decode_vector, normalize_vector
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+# Texts per embedding request when precomputing
+_EMBED_BATCH_SIZE = 64
+
+
+def _dot_products(query: array, vectors: Sequence[array]) -> List[float]:
+    """Dot product of one unit vector with many; equals cosine similarity."""
+    if _NUMPY_AVAILABLE:
+        matrix = np.vstack([np.frombuffer(v, dtype=np.float32) for v in vectors])
+        return (matrix @ np.frombuffer(query, dtype=np.float32)).tolist()
+    return [sum(a * b for a, b in zip(query, v)) for v in vectors]
+
+
+class EmbeddingMatcher:
+    """Semantic matcher comparing embeddings by cosine similarity.
+
+    Embedding requests go through the process-wide OllamaHealth client and
+    count towards its circuit breaker; failures raise, so the caller can
+    fall back like for a failed chat request.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        threshold: float = DEFAULT_EMBEDDING_THRESHOLD,
+        store: Optional[EmbeddingStore] = None,
+    ):
+        """Initialize the matcher.
+
+        Args:
+            model: Ollama embedding model
+            threshold: Cosine similarity at which an answer matches
+            store: Store of precomputed vectors, opened on first use if None
+        """
+        self.model = model
+        self.threshold = threshold
+        self._store = store
+        self._store_failed = False
+        # Decoded vectors of expected meanings seen in this process
+        self._vectors: Dict[str, array] = {}
+
+    @classmethod
+    def from_config(cls) -> "EmbeddingMatcher":
+        """Create a matcher with the configured model and threshold."""
+        model, threshold = load_embedding_settings()
+        return cls(model, threshold)
+
+    def best_match(
+        self, answer: str, candidates: Sequence[str]
+    ) -> Optional[Tuple[int, float]]:
+        """Find the expected meaning most similar to an answer.
+
+        Args:
+            answer: The normalized user answer
+            candidates: Normalized expected answers
+
+        Returns:
+            (index, similarity) of the most similar candidate, or None if
+            no candidate reaches the threshold
+
+        Raises:
+            Exception: If Ollama cannot compute an embedding
+        """
+        vectors = self._expected_vectors(candidates)
+        query = self._embed([answer])[0]
+        similarities = _dot_products(query, [vectors[c] for c in candidates])
+
+        best = max(range(len(candidates)), key=similarities.__getitem__)
+        if similarities[best] < self.threshold:
+            return None
+        return best, similarities[best]
+
+    def precompute(self, texts: Iterable[str]) -> int:
+        """Compute and store the vectors of meanings that have none yet.
+
+        Args:
+            texts: Expected answers; normalized like in the quiz
+
+        Returns:
+            Number of newly stored vectors
+
+        Raises:
+            Exception: If Ollama cannot compute an embedding
+        """
+        texts = [t.strip().lower() for t in texts if t.strip()]
+        store = self._get_store()
+        missing = store.missing(self.model, texts) if store else list(dict.fromkeys(texts))
+
+        for start in range(0, len(missing), _EMBED_BATCH_SIZE):
+            chunk = missing[start:start + _EMBED_BATCH_SIZE]
+            self._remember(list(zip(chunk, self._embed(chunk))))
+        return len(missing)
+
+    def prewarm(self) -> None:
+        """Load the embedding model into Ollama's memory."""
+        get_ollama_health().client().embed(model=self.model, input="")
+
+    def _expected_vectors(self, texts: Sequence[str]) -> Dict[str, array]:
+        """Vectors of the expected meanings: memory, then store, then Ollama."""
+        missing = [t for t in dict.fromkeys(texts) if t not in self._vectors]
+        store = self._get_store()
+        if missing and store is not None:
+            try:
+                for text, blob in store.get_many(self.model, missing).items():
+                    self._vectors[text] = decode_vector(blob)
+            except sqlite3.Error:
+                pass
+            missing = [t for t in missing if t not in self._vectors]
+        if missing:
+            self._remember(list(zip(missing, self._embed(missing))))
+        return self._vectors
+
+    def _embed(self, texts: List[str]) -> List[array]:
+        """Embed texts with Ollama, recording the outcome for the breaker."""
+        health = get_ollama_health()
+        try:
+            response = health.client().embed(model=self.model, input=texts)
+            embeddings = response["embeddings"]
+        except Exception:
+            health.record_failure()
+            raise
+        health.record_success()
+        return [normalize_vector(e) for e in embeddings]
+
+    def _remember(self, vectors: List[Tuple[str, array]]) -> None:
+        """Keep new vectors in memory and in the store."""
+        self._vectors.update(vectors)
+        store = self._get_store()
+        if store is not None:
+            try:
+                store.put_many(self.model, vectors)
+            except sqlite3.Error:
+                pass
+
+    def _get_store(self) -> Optional[EmbeddingStore]:
+        """The embedding store, opened on first use; None if it cannot be."""
+        if self._store is None and not self._store_failed:
+            try:
+                self._store = EmbeddingStore()
+            except (sqlite3.Error, OSError):
+                self._store_failed = True
+        return self._store
+
+
+def precompute_embeddings(texts: Iterable[str]) -> Optional[int]:
+    """Store vectors for imported meanings with the configured model.
+
+    Args:
+        texts: German and Japanese meanings of the imported items
+
+    Returns:
+        Number of newly stored vectors, or None if Ollama is unavailable
+    """
+    if not get_ollama_health().is_available():
+        return None
+    try:
+        return EmbeddingMatcher.from_config().precompute(texts)
+    except Exception:
+        return None
@@ -3,8 +3,11 @@
 Handles varying column layouts by detecting headers dynamically.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from nihon_cli.core.vocabulary import VocabularyItem
 
@@ -25,6 +28,33 @@ _VOCAB_TYPE_MAP = {
     "あいさつ": "pattern",
 }
 
+# Rows searched for the header at the top of a sheet
+_HEADER_SEARCH_ROWS = 5
+
+# Sheets parsed ahead of the consumer per worker in parallel mode; bounds
+# the number of parsed sheets held in memory
+_SHEETS_AHEAD_PER_WORKER = 2
+
+# Parser of a worker process, holding that process's open workbook
+_worker_parser: Optional["ExcelVocabParser"] = None
+
+# (japanese_vocab, german_vocab, vocab_type) of a parsed row. Workers send
+# these plain tuples, which pickle about three times faster than items.
+_ItemFields = Tuple[List[str], List[str], Optional[str]]
+
+
+def _make_item(fields: _ItemFields) -> VocabularyItem:
+    """Build a new VocabularyItem from parsed row fields."""
+    japanese, german, vocab_type = fields
+    return VocabularyItem(
+        id=0,
+        japanese_vocab=japanese,
+        german_vocab=german,
+        source_file=None,
+        upload_tag=None,
+        vocab_type=vocab_type,
+    )
+
 
 def _detect_vocab_type(raw_type: Optional[str]) -> Optional[str]:
     """Map a Japanese word type label like '01 名詞' to an internal type."""
@@ -37,11 +67,118 @@ def _detect_vocab_type(raw_type: Optional[str]) -> Optional[str]:
 
 
 class ExcelVocabParser:
-    """Parse vocabulary from まるごと-style Excel workbooks."""
+    """Parse vocabulary from まるごと-style Excel workbooks.
+
+    Sheets are read as streams: rows are pulled from openpyxl's read-only
+    worksheets one at a time and turned into items lazily, so memory use
+    does not grow with the size of the workbook.
+
+    Loading a workbook parses its shared string table, which dominates the
+    start-up time for large files. The workbook opened by list_sheets() is
+    therefore kept for a following iter_sheets() on the same file.
+    """
+
+    # Stored with every import; bump when parsing results change, so
+    # that unchanged files are read again
+    PARSER_VERSION = 1
+
+    def __init__(self):
+        """Initialize the parser without an open workbook."""
+        self._workbook = None
+        self._workbook_path: Optional[Path] = None
+
+    def list_sheets(self, file_path: Path) -> List[Tuple[str, Optional[int]]]:
+        """List the sheets of an Excel file without reading their rows.
+
+        Args:
+            file_path: Path to the .xlsx file
+
+        Returns:
+            (sheet name, estimated row count) per sheet, in workbook order.
+            The estimate comes from the sheet's stored dimensions and is
+            None if the file does not record them.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        wb = self._open(file_path)
+        return [(ws.title, ws.max_row) for ws in wb.worksheets]
+
+    def iter_sheets(
+        self, file_path: Path, sheet_names: List[str], workers: int = 1
+    ) -> Iterator[Tuple[str, Iterator[VocabularyItem]]]:
+        """Stream the items of several sheets of an Excel file.
+
+        The workbook is opened once (or reused from list_sheets()). Each
+        sheet's items should be consumed before advancing to the next
+        sheet; the workbook is closed when this generator finishes.
+
+        With more than one worker, sheets are parsed in a process pool
+        instead (see _iter_sheets_parallel()); the sheets are still
+        yielded in the requested order.
+
+        Args:
+            file_path: Path to the .xlsx file
+            sheet_names: Sheets to read, in the order to read them
+            workers: Number of worker processes; 1 parses in this process
+
+        Yields:
+            (sheet name, iterator over the sheet's VocabularyItem objects).
+            Sheets without a recognizable header yield no items.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if workers > 1 and len(sheet_names) > 1:
+            self.close()
+            yield from self._iter_sheets_parallel(file_path, sheet_names, workers)
+            return
+
+        wb = self._open(file_path)
+        try:
+            for sheet_name in sheet_names:
+                yield sheet_name, self._iter_sheet(wb[sheet_name])
+        finally:
+            self.close()
+
+    @staticmethod
+    def _iter_sheets_parallel(
+        file_path: Path, sheet_names: List[str], workers: int
+    ) -> Iterator[Tuple[str, Iterator[VocabularyItem]]]:
+        """Parse sheets in worker processes, yielding them in order.
+
+        Every worker opens the workbook once, in its initializer, and
+        parses whole sheets from it. At most _SHEETS_AHEAD_PER_WORKER
+        sheets per worker are submitted ahead of the one being consumed.
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Datei nicht gefunden: {file_path}")
+
+        workers = min(workers, len(sheet_names))
+        names = iter(sheet_names)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(file_path,),
+        ) as executor:
+            pending = deque(
+                (name, executor.submit(_parse_sheet_in_worker, name))
+                for name in islice(names, workers * _SHEETS_AHEAD_PER_WORKER)
+            )
+            while pending:
+                name, future = pending.popleft()
+                fields = future.result()
+                for next_name in islice(names, 1):
+                    pending.append(
+                        (next_name, executor.submit(_parse_sheet_in_worker, next_name))
+                    )
+                yield name, map(_make_item, fields)
 
     def parse(self, file_path: Path) -> dict[str, List[VocabularyItem]]:
         """Parse all themed sheets from an Excel file.
 
+        Materializes every sheet; prefer iter_sheets() for large files.
+
         Args:
             file_path: Path to the .xlsx file
 
@@ -54,45 +191,66 @@ class ExcelVocabParser:
             FileNotFoundError: If the file does not exist
             ValueError: If no vocabulary could be parsed
         """
-        import openpyxl
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Datei nicht gefunden: {file_path}")
-
-        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        sheet_names = [name for name, _ in self.list_sheets(file_path)]
         result: dict[str, List[VocabularyItem]] = {}
 
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            items = self._parse_sheet(ws)
-            if items:
-                result[sheet_name] = items
-
-        wb.close()
+        for sheet_name, items in self.iter_sheets(file_path, sheet_names):
+            sheet_items = list(items)
+            if sheet_items:
+                result[sheet_name] = sheet_items
 
         if not result:
             raise ValueError("Keine Vokabeln in der Excel-Datei gefunden.")
 
         return result
 
-    def _parse_sheet(self, ws) -> List[VocabularyItem]:
-        """Parse a single worksheet."""
-        rows = list(ws.iter_rows(values_only=True))
-        if len(rows) < 3:
-            return []
+    def close(self) -> None:
+        """Close the workbook kept open by list_sheets(), if any."""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+            self._workbook_path = None
+
+    def _open(self, file_path: Path):
+        """Open a workbook in read-only (streaming) mode, reusing an open one."""
+        import openpyxl
+
+        if self._workbook is not None and self._workbook_path == file_path:
+            return self._workbook
+        self.close()
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Datei nicht gefunden: {file_path}")
+
+        self._workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        self._workbook_path = file_path
+        return self._workbook
+
+    def _iter_sheet(self, ws) -> Iterator[VocabularyItem]:
+        """Parse a single worksheet row by row."""
+        return map(_make_item, self._iter_sheet_fields(ws))
+
+    def _iter_sheet_fields(self, ws) -> Iterator[_ItemFields]:
+        """Parse a single worksheet row by row into item fields."""
+        rows = ws.iter_rows(values_only=True)
+
+        # Only the header search window is buffered
+        head = list(islice(rows, _HEADER_SEARCH_ROWS))
+        if len(head) < 3:
+            return
 
         # Find header row by looking for '語彙' or 'ドイツ語訳'
         header_idx = None
-        for i, row in enumerate(rows[:5]):
+        for i, row in enumerate(head):
             row_strs = [str(c) if c else "" for c in row]
             if any("語彙" in s for s in row_strs) or any("ドイツ語訳" in s for s in row_strs):
                 header_idx = i
                 break
 
         if header_idx is None:
-            return []
+            return
 
-        headers = [str(c).strip() if c else "" for c in rows[header_idx]]
+        headers = [str(c).strip() if c else "" for c in head[header_idx]]
 
         # Detect column indices
         col_kana = self._find_col(headers, "かな")
@@ -101,51 +259,54 @@ class ExcelVocabParser:
         col_type = self._find_col(headers, "品詞")
 
         if col_kana is None or col_german is None:
-            return []
-
-        items: List[VocabularyItem] = []
-        for row in rows[header_idx + 1:]:
-            if not row or len(row) <= max(col_kana, col_german):
-                continue
-
-            kana = str(row[col_kana]).strip() if row[col_kana] else None
-            if not kana or kana == "None":
-                continue
-
-            kanji = None
-            if col_kanji is not None and len(row) > col_kanji and row[col_kanji]:
-                kanji_raw = str(row[col_kanji]).strip()
-                if kanji_raw and kanji_raw != kana and kanji_raw != "None":
-                    kanji = kanji_raw
-
-            german = str(row[col_german]).strip() if row[col_german] else None
-            if not german or german == "None":
-                continue
-
-            # Build japanese vocab list: kanji form + kana reading
-            japanese = [kanji] if kanji else [kana]
-            if kanji and kanji != kana:
-                japanese.append(kana)
+            return
 
-            # German may have multiple meanings separated by comma
-            german_list = [g.strip() for g in german.split(",") if g.strip()]
+        for row in chain(head[header_idx + 1:], rows):
+            fields = self._parse_row(row, col_kana, col_kanji, col_german, col_type)
+            if fields is not None:
+                yield fields
 
-            raw_type = None
-            if col_type is not None and len(row) > col_type:
-                raw_type = str(row[col_type]) if row[col_type] else None
-
-            vocab_type = _detect_vocab_type(raw_type)
-
-            items.append(VocabularyItem(
-                id=0,
-                japanese_vocab=japanese,
-                german_vocab=german_list,
-                source_file=None,
-                upload_tag=None,
-                vocab_type=vocab_type,
-            ))
-
-        return items
+    @staticmethod
+    def _parse_row(
+        row: tuple,
+        col_kana: int,
+        col_kanji: Optional[int],
+        col_german: int,
+        col_type: Optional[int],
+    ) -> Optional[_ItemFields]:
+        """Turn one data row into item fields; None for incomplete rows."""
+        if not row or len(row) <= max(col_kana, col_german):
+            return None
+
+        kana = str(row[col_kana]).strip() if row[col_kana] else None
+        if not kana or kana == "None":
+            return None
+
+        kanji = None
+        if col_kanji is not None and len(row) > col_kanji and row[col_kanji]:
+            kanji_raw = str(row[col_kanji]).strip()
+            if kanji_raw and kanji_raw != kana and kanji_raw != "None":
+                kanji = kanji_raw
+
+        german = str(row[col_german]).strip() if row[col_german] else None
+        if not german or german == "None":
+            return None
+
+        # Build japanese vocab list: kanji form + kana reading
+        japanese = [kanji] if kanji else [kana]
+        if kanji and kanji != kana:
+            japanese.append(kana)
+
+        # German may have multiple meanings separated by comma
+        german_list = [g.strip() for g in german.split(",") if g.strip()]
+
+        raw_type = None
+        if col_type is not None and len(row) > col_type:
+            raw_type = str(row[col_type]) if row[col_type] else None
+
+        vocab_type = _detect_vocab_type(raw_type)
+
+        return japanese, german_list, vocab_type
 
     @staticmethod
     def _find_col(headers: List[str], keyword: str) -> Optional[int]:
@@ -154,3 +315,15 @@ class ExcelVocabParser:
             if keyword in h:
                 return i
         return None
+
+
+def _init_worker(file_path: Path) -> None:
+    """Open the workbook once per worker process."""
+    global _worker_parser
+    _worker_parser = ExcelVocabParser()
+    _worker_parser._open(file_path)
+
+
+def _parse_sheet_in_worker(sheet_name: str) -> List[_ItemFields]:
+    """Parse one sheet of the worker's workbook."""
+    return list(_worker_parser._iter_sheet_fields(_worker_parser._workbook[sheet_name]))
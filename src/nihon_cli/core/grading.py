@@ -0,0 +1,295 @@
+"""Answer grading strategies for the vocabulary quiz loops.
+
+SyncGrader checks every answer completely before the quiz continues.
+AsyncGrader returns the result of the local checks (exact, typo, prefix,
+cached verdict) at once and runs semantic checks on a background worker,
+so the learner never waits for the LLM. BatchGrader collects the answers
+that need the LLM and judges them all with one prompt at the end of the
+session. Late verdicts are handed back in the quiz's own thread via
+deliver_ready() and finish(), which keeps all progress bookkeeping
+single-threaded. When the learner interrupts a session, cancel() waits
+only briefly and drops the verdicts that are still outstanding.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Imported lazily: the CLI reads GRADING_MODES at start-up and should
+    # not pay for loading the Ollama client
+    from nihon_cli.core.answer_checker import AnswerChecker, AnswerCheckResult
+
+# Available values for the --grading option
+GRADING_MODES = ("sync", "async", "end")
+DEFAULT_GRADING_MODE = "sync"
+
+GradeCallback = Callable[["AnswerCheckResult"], None]
+
+# Seconds an interrupted session waits for outstanding semantic checks
+INTERRUPT_GRACE_SECONDS = 2.0
+
+
+class SyncGrader:
+    """Grades each answer completely before returning."""
+
+    # Shown for an answer whose result is pending
+    pending_notice = ""
+
+    def __init__(self, answer_checker: "AnswerChecker"):
+        """Initialize the grader.
+
+        Args:
+            answer_checker: Checker used for all answers
+        """
+        self.answer_checker = answer_checker
+
+    def prewarm(self) -> None:
+        """Prepare the semantic checker; the blocking grader skips this."""
+
+    def grade(
+        self,
+        user_input: str,
+        correct_answers: List[str],
+        direction: str,
+        on_result: GradeCallback,
+    ) -> Optional["AnswerCheckResult"]:
+        """Grade an answer and pass the result to on_result.
+
+        Args:
+            user_input: The user's answer
+            correct_answers: Expected answers
+            direction: Query direction ("jp_to_de" or "de_to_jp")
+            on_result: Called with the result, in the calling thread
+
+        Returns:
+            The result if it is already known, None if it is pending
+        """
+        result = self.answer_checker.check(user_input, correct_answers, direction)
+        on_result(result)
+        return result
+
+    def deliver_ready(self) -> None:
+        """Deliver pending results that are available by now."""
+
+    def finish(self) -> None:
+        """Wait for and deliver all pending results."""
+
+    def cancel(self, timeout: float = INTERRUPT_GRACE_SECONDS) -> int:
+        """Deliver the results available within timeout, drop the others.
+
+        Used instead of finish() when the session is interrupted. Answers
+        whose result is dropped are neither counted nor recorded.
+
+        Args:
+            timeout: Seconds to wait for pending results
+
+        Returns:
+            Number of dropped results
+        """
+        return 0
+
+
+class AsyncGrader(SyncGrader):
+    """Grades locally at once and semantically in the background."""
+
+    pending_notice = "⏳ Antwort wird im Hintergrund geprüft..."
+
+    def __init__(self, answer_checker: "AnswerChecker", max_workers: int = 1):
+        """Initialize the grader.
+
+        Worker threads are started with the first check of a session and
+        stopped by finish() or cancel(). They are daemon threads, unlike
+        those of a ThreadPoolExecutor, so a check still running after
+        cancel() does not keep the process alive until the request times
+        out.
+
+        Args:
+            answer_checker: Checker used for all answers
+            max_workers: Number of concurrent semantic checks
+        """
+        super().__init__(answer_checker)
+        self._max_workers = max_workers
+        self._queue: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], tuple]]]" = \
+            queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._pending: List[Tuple[Future, GradeCallback]] = []
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue a call for the workers, starting them if needed."""
+        if not self._workers:
+            # A fresh queue, so workers left running by _stop_workers()
+            # only ever see their own stop sentinel
+            self._queue = queue.Queue()
+            self._workers = [
+                threading.Thread(
+                    target=self._work, args=(self._queue,), name=f"grader_{i}", daemon=True
+                )
+                for i in range(self._max_workers)
+            ]
+            for worker in self._workers:
+                worker.start()
+        future: Future = Future()
+        self._queue.put((future, fn, args))
+        return future
+
+    def _stop_workers(self, timeout: float) -> None:
+        """Stop the workers once the queued calls are done.
+
+        Waits at most timeout seconds; a worker still busy then exits
+        after its current call.
+        """
+        workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(None)
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+
+    @staticmethod
+    def _work(tasks: "queue.Queue") -> None:
+        """Run queued calls until a stop sentinel; cancelled ones are skipped."""
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def prewarm(self) -> None:
+        """Load the model in the background while the first question is shown."""
+        self._submit(self.answer_checker.prewarm)
+
+    def grade(
+        self,
+        user_input: str,
+        correct_answers: List[str],
+        direction: str,
+        on_result: GradeCallback,
+    ) -> Optional["AnswerCheckResult"]:
+        result = self.answer_checker.check_local(user_input, correct_answers, direction)
+        if result is not None:
+            on_result(result)
+            return result
+
+        future = self._submit(
+            self.answer_checker.check_semantic, user_input, list(correct_answers), direction
+        )
+        self._pending.append((future, on_result))
+        return None
+
+    def deliver_ready(self) -> None:
+        pending, self._pending = self._pending, []
+        for future, on_result in pending:
+            if future.done():
+                on_result(self._result(future))
+            else:
+                self._pending.append((future, on_result))
+
+    def finish(self) -> None:
+        pending, self._pending = self._pending, []
+        for future, on_result in pending:
+            on_result(self._result(future))
+        # Only a prewarm can still be running
+        self._stop_workers(INTERRUPT_GRACE_SECONDS)
+
+    def cancel(self, timeout: float = INTERRUPT_GRACE_SECONDS) -> int:
+        deadline = time.monotonic() + timeout
+        pending, self._pending = self._pending, []
+        done, _ = wait([future for future, _ in pending], timeout=timeout)
+        dropped = 0
+        for future, on_result in pending:
+            if future in done:
+                on_result(self._result(future))
+            else:
+                # Not started yet: never runs. Running: its result is ignored
+                future.cancel()
+                dropped += 1
+        self._stop_workers(max(0.0, deadline - time.monotonic()))
+        return dropped
+
+    @staticmethod
+    def _result(future: Future) -> "AnswerCheckResult":
+        """Result of a semantic check; a failed check rejects the answer."""
+        from nihon_cli.core.answer_checker import AnswerCheckResult
+
+        try:
+            return future.result()
+        except Exception:
+            return AnswerCheckResult(accepted=False, method="fallback_exact")
+
+
+class BatchGrader(SyncGrader):
+    """Grades locally at once and semantically in one batch at the end."""
+
+    pending_notice = "⏳ Antwort wird am Ende der Sitzung geprüft..."
+
+    def __init__(self, answer_checker: "AnswerChecker"):
+        """Initialize the grader.
+
+        Args:
+            answer_checker: Checker used for all answers
+        """
+        super().__init__(answer_checker)
+        self._pending: List[Tuple[str, List[str], str, GradeCallback]] = []
+
+    def grade(
+        self,
+        user_input: str,
+        correct_answers: List[str],
+        direction: str,
+        on_result: GradeCallback,
+    ) -> Optional["AnswerCheckResult"]:
+        result = self.answer_checker.check_local(user_input, correct_answers, direction)
+        if result is not None:
+            on_result(result)
+            return result
+
+        self._pending.append((user_input, list(correct_answers), direction, on_result))
+        return None
+
+    def finish(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        print(f"\n🔎 Prüfe {len(pending)} Antwort(en) mit dem Sprachmodell...")
+        results = self.answer_checker.check_semantic_batch(
+            [(user_input, answers, direction) for user_input, answers, direction, _ in pending]
+        )
+        for (_, _, _, on_result), result in zip(pending, results):
+            on_result(result)
+
+    def cancel(self, timeout: float = INTERRUPT_GRACE_SECONDS) -> int:
+        # The batch is one model call that cannot be cut short
+        pending, self._pending = self._pending, []
+        return len(pending)
+
+
+def create_grader(mode: str, answer_checker: "AnswerChecker") -> SyncGrader:
+    """Create the grader for a grading mode.
+
+    Args:
+        mode: One of GRADING_MODES
+        answer_checker: Checker used for all answers
+
+    Returns:
+        The grader
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode == "sync":
+        return SyncGrader(answer_checker)
+    if mode == "async":
+        return AsyncGrader(answer_checker)
+    if mode == "end":
+        return BatchGrader(answer_checker)
+    raise ValueError(f"Unknown grading mode: {mode}")
@@ -0,0 +1,158 @@
+# src/nihon_cli/core/kana_normalizer.py
+"""
+Normalization of Japanese answers for comparison.
+
+Answers to de_to_jp questions may be typed in hiragana, katakana, romaji,
+half-width or full-width characters. normalize_japanese() maps all of
+these to one hiragana form, so that equal words compare equal as strings.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from nihon_cli.core.romaji_converter import convert_romaji_word_to_kana
+from nihon_cli.data.hiragana_advanced import HIRAGANA_ADVANCED_CHARACTERS
+from nihon_cli.data.hiragana_basic import HIRAGANA_BASIC_CHARACTERS
+
+# Katakana ァ..ヶ lie exactly 0x60 code points above their hiragana
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
+# Romaji long vowels written with macrons or circumflexes
+_ROMAJI_LONG_VOWELS = str.maketrans({
+    "ā": "aa", "ī": "ii", "ū": "uu", "ē": "ei", "ō": "ou",
+    "â": "aa", "î": "ii", "û": "uu", "ê": "ei", "ô": "ou",
+})
+
+# Vowel kana and the vowel they stand for
+_VOWEL_KANA = {"あ": "a", "い": "i", "う": "u", "え": "e", "お": "o"}
+
+# Vowels a following vowel kana lengthens: the vowel itself, and the usual
+# hiragana spellings of long e and o (せんせい, とうきょう)
+_LENGTHENED_BY = {
+    "a": frozenset("a"), "i": frozenset("i"), "u": frozenset("u"),
+    "e": frozenset("ei"), "o": frozenset("ou"),
+}
+
+_LONG_VOWEL_MARK = "ー"
+
+# Possessive prefixes dropped with strip_qualifiers ("わたしのはは" -> "はは")
+_POSSESSIVE_PREFIXES = (
+    "わたしの", "わたくしの", "ぼくの", "おれの", "あなたの", "きみの",
+    "わたしたちの", "かれの", "かのじょの",
+)
+
+# Kinship terms whose さん is an honorific ("おかあさん" -> "おかあ"). Other
+# words ending in さん (たくさん, みなさん) are left alone.
+_HONORIFIC = "さん"
+_KINSHIP_STEMS = (
+    "おかあ", "おとう", "おにい", "おねえ", "おばあ", "おじい", "おば", "おじ",
+    "おく", "おとうと", "いもうと", "むすこ", "むすめ", "おこ",
+)
+
+# Cache size for prepared expected answer sets
+_PREPARED_CACHE_SIZE = 1024
+
+
+def _build_vowel_table() -> Dict[str, str]:
+    """Map each hiragana to the vowel it ends in."""
+    table = {"ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
+             "ゃ": "a", "ゅ": "u", "ょ": "o"}
+    for char in HIRAGANA_BASIC_CHARACTERS + HIRAGANA_ADVANCED_CHARACTERS:
+        if char.romaji[-1] in _LENGTHENED_BY:
+            table[char.symbol[-1]] = char.romaji[-1]
+    return table
+
+
+_VOWEL_OF_KANA = _build_vowel_table()
+
+
+def _fold_long_vowels(kana: str) -> str:
+    """Write every long vowel as ー.
+
+    A vowel kana that lengthens the kana before it (こお, こう, けえ, けい)
+    becomes ー, so that コーヒー, こおひい and こうひい all read こーひー.
+    """
+    result = []
+    vowel = None
+    for char in kana:
+        if char == _LONG_VOWEL_MARK:
+            result.append(char)
+            continue
+        if vowel is not None and _VOWEL_KANA.get(char, "") in _LENGTHENED_BY[vowel]:
+            result.append(_LONG_VOWEL_MARK)
+            continue
+        result.append(char)
+        vowel = _VOWEL_OF_KANA.get(char)
+    return "".join(result)
+
+
+# Stems in folded form, as the honorific is stripped after folding
+_FOLDED_KINSHIP_STEMS = frozenset(_fold_long_vowels(stem) for stem in _KINSHIP_STEMS)
+
+
+def _strip_possessive(kana: str) -> str:
+    """Drop a known possessive prefix such as わたしの."""
+    for prefix in _POSSESSIVE_PREFIXES:
+        if kana.startswith(prefix) and len(kana) > len(prefix):
+            return kana[len(prefix):]
+    return kana
+
+
+def _strip_honorific(folded: str) -> str:
+    """Drop the さん of a kinship term; folded is long-vowel folded."""
+    stem = folded[:-len(_HONORIFIC)]
+    if folded.endswith(_HONORIFIC) and stem in _FOLDED_KINSHIP_STEMS:
+        return stem
+    return folded
+
+
+def normalize_japanese(text: str, strip_qualifiers: bool = False) -> str:
+    """
+    Normalize a Japanese answer to a comparable hiragana form.
+
+    Applies NFKC (full/half width), lower-casing, romaji to kana
+    conversion ("-" as long vowel mark, "n'" as syllabic n), katakana to
+    hiragana folding and long vowel folding.
+
+    Args:
+        text (str): The answer as typed or stored.
+        strip_qualifiers (bool): Also remove possessive prefixes ("わたしの")
+                                 and the "さん" of kinship terms.
+
+    Returns:
+        str: The normalized form; text that cannot be converted is kept
+             in its NFKC lower-case form.
+    """
+    normalized = "".join(unicodedata.normalize("NFKC", text).lower().split())
+
+    romaji = normalized.translate(_ROMAJI_LONG_VOWELS)
+    if romaji.isascii() and romaji.replace("-", "").replace("'", "").isalpha():
+        normalized = convert_romaji_word_to_kana(romaji) or normalized
+
+    normalized = normalized.translate(_KATAKANA_TO_HIRAGANA)
+    if not strip_qualifiers:
+        return _fold_long_vowels(normalized)
+    # The prefix goes first: の would lengthen a following お
+    return _strip_honorific(_fold_long_vowels(_strip_possessive(normalized)))
+
+
+@lru_cache(maxsize=_PREPARED_CACHE_SIZE)
+def prepare_kana_answers(
+    answers: Tuple[str, ...], strip_qualifiers: bool = False
+) -> Dict[str, str]:
+    """
+    Normalize an expected answer set once; repeated questions reuse it.
+
+    Args:
+        answers (Tuple[str, ...]): Expected Japanese answers of an item.
+        strip_qualifiers (bool): Passed on to normalize_japanese().
+
+    Returns:
+        Dict[str, str]: Normalized form mapped to the first original answer
+                        with that form.
+    """
+    prepared: Dict[str, str] = {}
+    for answer in answers:
+        prepared.setdefault(normalize_japanese(answer, strip_qualifiers), answer)
+    return prepared
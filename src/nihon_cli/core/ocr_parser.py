@@ -1,21 +1,115 @@
 """OCR parser for extracting vocabulary from images using OpenAI Vision API.
 
 This module provides the OpenAIVisionParser class for processing images
-and extracting Japanese-German vocabulary with structured data.
+and extracting Japanese-German vocabulary with structured data. Several
+images can be extracted concurrently; rate-limited requests and transient
+server errors are retried with exponential backoff.
 """
 
 import base64
+import glob
 import json
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import APIConnectionError, APIStatusError, OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# HTTP statuses after which a request is sent again with backoff: request
+# timeout, conflict, rate limit and server errors (as the SDK's own retries)
+_RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+# Images extracted at the same time by extract_vocabulary_from_images()
+DEFAULT_OCR_WORKERS = 4
+
+# File suffixes picked up when a directory is given
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
+# Attempts per image request, and bounds of the exponential backoff in seconds
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 30.0
+
+
+@dataclass
+class ImageExtraction:
+    """Outcome of the vocabulary extraction from one image.
+
+    Attributes:
+        image_path: The image
+        items: Extracted vocabulary, as returned by extract_vocabulary_from_image()
+        error: Error message if the extraction failed, None otherwise
+        attempts: Number of API requests sent for the image
+    """
+
+    image_path: Path
+    items: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+def collect_image_paths(patterns: Iterable[str]) -> List[Path]:
+    """Expand command-line image arguments into image files.
+
+    A directory contributes the image files directly inside it, a glob
+    pattern the image files it matches. Other arguments are kept as given,
+    so that missing files can be reported by the caller.
+
+    Args:
+        patterns: Files, directories or glob patterns
+
+    Returns:
+        Image paths in argument order (sorted within a directory or
+        pattern), without duplicates
+    """
+    paths: List[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = path.iterdir()
+        elif not path.exists() and any(char in pattern for char in "*?["):
+            candidates = (Path(match) for match in glob.glob(pattern))
+        else:
+            paths.append(path)
+            continue
+        paths.extend(sorted(
+            p for p in candidates if p.suffix.lower() in IMAGE_SUFFIXES and p.is_file()
+        ))
+    return list(dict.fromkeys(paths))
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request may succeed when sent again."""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code in _RETRYABLE_STATUSES or error.status_code >= 500
+    return False
+
+
+def _backoff_delay(attempt: int, error: Exception) -> float:
+    """Seconds to wait before the next attempt.
+
+    Uses the server's Retry-After header if present, otherwise doubles
+    with every attempt; jitter keeps parallel workers from retrying in
+    lockstep.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return min(float(retry_after), _BACKOFF_MAX)
+    except (TypeError, ValueError):
+        delay = min(_BACKOFF_BASE * 2 ** (attempt - 1), _BACKOFF_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
 
 class OpenAIVisionParser:
     """Parser that uses OpenAI Vision API to extract vocabulary from images.
@@ -48,7 +142,8 @@ class OpenAIVisionParser:
                 "or set the OPENAI_API_KEY environment variable."
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Retries are handled by _create_completion(), with backoff
+        self.client = OpenAI(api_key=self.api_key, max_retries=0)
 
     def extract_vocabulary_from_image(self, image_path: Path) -> List[Dict]:
         """Extract vocabulary items from an image using OpenAI Vision API.
@@ -63,6 +158,61 @@ class OpenAIVisionParser:
             - vocab_type: str - 'noun', 'adjective', or 'pattern'
             - base_form: Optional[str] - Base form if word is conjugated
 
+        Raises:
+            FileNotFoundError: If image file doesn't exist
+            ValueError: If image processing fails or response is invalid
+        """
+        return self._extract(image_path)[0]
+
+    def extract_vocabulary_from_images(
+        self,
+        image_paths: Iterable[Path],
+        max_workers: int = DEFAULT_OCR_WORKERS,
+        on_done: Optional[Callable[[ImageExtraction], None]] = None,
+    ) -> List[ImageExtraction]:
+        """Extract vocabulary from several images concurrently.
+
+        At most max_workers requests are in flight at a time. A failing
+        image does not stop the others; its error is recorded in the
+        result instead.
+
+        Args:
+            image_paths: Paths to the image files
+            max_workers: Number of concurrent API requests
+            on_done: Called in the calling thread as each image finishes
+
+        Returns:
+            One result per distinct image, in the order of image_paths
+        """
+        image_paths = list(dict.fromkeys(image_paths))
+        results: Dict[Path, ImageExtraction] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="ocr"
+        ) as executor:
+            futures = {executor.submit(self._extract_safely, path): path for path in image_paths}
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if on_done is not None:
+                    on_done(result)
+
+        return [results[path] for path in image_paths]
+
+    def _extract_safely(self, image_path: Path) -> ImageExtraction:
+        """Extract vocabulary from one image, capturing a failure as result."""
+        try:
+            items, attempts = self._extract(image_path)
+        except (FileNotFoundError, ValueError) as e:
+            return ImageExtraction(image_path, error=str(e))
+        return ImageExtraction(image_path, items, attempts=attempts)
+
+    def _extract(self, image_path: Path) -> Tuple[List[Dict], int]:
+        """Extract vocabulary from an image.
+
+        Returns:
+            Extracted items and the number of API requests it took
+
         Raises:
             FileNotFoundError: If image file doesn't exist
             ValueError: If image processing fails or response is invalid
@@ -75,7 +225,7 @@ class OpenAIVisionParser:
 
         # Call OpenAI Vision API
         try:
-            response = self.client.chat.completions.create(
+            response, attempts = self._create_completion(
                 model="gpt-4o",  # Using GPT-4 Turbo with vision
                 messages=[
                     {
@@ -108,11 +258,31 @@ class OpenAIVisionParser:
             # Try to extract JSON from response (might be wrapped in markdown code blocks)
             extracted_items = self._parse_json_response(content)
 
-            return extracted_items
+            return extracted_items, attempts
 
         except Exception as e:
             raise ValueError(f"Failed to extract vocabulary from image: {e}") from e
 
+    def _create_completion(self, **request: Any) -> Tuple[Any, int]:
+        """Send a chat completion request, retrying transient errors with backoff.
+
+        Returns:
+            The response and the number of attempts it took
+
+        Raises:
+            Exception: The last error once all attempts are used up, or
+                       any non-retryable error at once
+        """
+        attempt = 1
+        while True:
+            try:
+                return self.client.chat.completions.create(**request), attempt
+            except Exception as e:
+                if attempt >= _MAX_ATTEMPTS or not _is_retryable(e):
+                    raise
+                time.sleep(_backoff_delay(attempt, e))
+                attempt += 1
+
     def _encode_image(self, image_path: Path) -> str:
         """Encode image to base64 string.
 
@@ -6,7 +6,7 @@ vocabulary tables with Japanese and German translations.
 
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from nihon_cli.core.vocabulary import VocabularyItem
 
@@ -19,26 +19,36 @@ class MarkdownVocabParser:
     |-----------|---------|
     | こんにちは | Hallo, Guten Tag |
     | ありがとう | Danke |
-    """
     
-    # Regex pattern to match table rows (excluding header and separator)
-    TABLE_ROW_PATTERN = re.compile(
-        r'^\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*$'
-    )
+    A file may contain any number of tables between other text. A table
+    starts at a header row naming both the Japanese and the German column
+    (case-insensitive, in any position among further columns) and ends at
+    the next non-empty line that is not a table row. Data rows must have
+    as many cells as their header.
     
-    # Pattern to identify header row
-    HEADER_PATTERN = re.compile(
-        r'^\s*\|\s*Japanisch\s*\|\s*Deutsch\s*\|\s*$',
-        re.IGNORECASE
-    )
+    The file is scanned line by line from an open handle; each line is
+    classified by a small state machine using string operations and one
+    precompiled pattern for header candidates.
+    """
     
-    # Pattern to identify separator row
-    SEPARATOR_PATTERN = re.compile(
-        r'^\s*\|[\s\-:]+\|[\s\-:]+\|\s*$'
-    )
+    # Stored with every import; bump when parsing results change, so
+    # that unchanged files are read again
+    PARSER_VERSION = 2
     
-    @staticmethod
-    def parse(file_path: Path) -> List[VocabularyItem]:
+    def __init__(self, japanese_column: str = "Japanisch", german_column: str = "Deutsch"):
+        """Initialize the parser with the header names of the columns to read.
+        
+        Args:
+            japanese_column: Header of the column with the Japanese words
+            german_column: Header of the column with the German meanings
+        """
+        self.japanese_column = japanese_column.strip().lower()
+        self.german_column = german_column.strip().lower()
+        self._header_cell = re.compile(
+            r'\|\s*' + re.escape(self.japanese_column) + r'\s*\|', re.IGNORECASE
+        )
+    
+    def parse(self, file_path: Path) -> List[VocabularyItem]:
         """Parse a Markdown file and extract vocabulary items.
         
         Args:
@@ -51,85 +61,111 @@ class MarkdownVocabParser:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file format is invalid or required columns are missing
         """
+        items = list(self.iter_items(file_path))
+        
+        if not items:
+            raise ValueError(
+                "No valid vocabulary entries found. "
+                f"Expected a table with '{self.japanese_column.capitalize()}' and "
+                f"'{self.german_column.capitalize()}' columns."
+            )
+        
+        return items
+    
+    def iter_items(self, file_path: Path) -> Iterator[VocabularyItem]:
+        """Stream the vocabulary items of a Markdown file.
+        
+        Args:
+            file_path: Path to the Markdown file to parse
+            
+        Yields:
+            VocabularyItem objects in file order
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the path is not a file or not UTF-8 encoded
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
         if not file_path.is_file():
             raise ValueError(f"Path is not a file: {file_path}")
         
+        source_file = file_path.name
+        split = self._split_multiple_meanings
         try:
-            content = file_path.read_text(encoding='utf-8')
+            with open(file_path, encoding='utf-8') as f:
+                for japanese, german in self._scan(f):
+                    yield VocabularyItem(
+                        id=0,  # Will be set by database
+                        japanese_vocab=split(japanese),
+                        german_vocab=split(german),
+                        source_file=source_file,
+                        upload_tag="",  # Will be set by caller
+                        correct_german=0,
+                        correct_japanese=0,
+                        completed=False
+                    )
         except UnicodeDecodeError as e:
             raise ValueError(f"Failed to read file as UTF-8: {e}") from e
-        
-        # Parse the content
-        vocab_pairs = MarkdownVocabParser._extract_vocab_pairs(content)
-        
-        if not vocab_pairs:
-            raise ValueError(
-                "No valid vocabulary entries found. "
-                "Expected a table with 'Japanisch' and 'Deutsch' columns."
-            )
-        
-        # Convert to VocabularyItem objects
-        items = []
-        for japanese, german in vocab_pairs:
-            item = VocabularyItem(
-                id=0,  # Will be set by database
-                japanese_vocab=MarkdownVocabParser._split_multiple_meanings(japanese),
-                german_vocab=MarkdownVocabParser._split_multiple_meanings(german),
-                source_file=file_path.name,
-                upload_tag="",  # Will be set by caller
-                correct_german=0,
-                correct_japanese=0,
-                completed=False
-            )
-            items.append(item)
-        
-        return items
     
-    @staticmethod
-    def _extract_vocab_pairs(content: str) -> List[Tuple[str, str]]:
-        """Extract vocabulary pairs from Markdown content.
+    def _scan(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """Extract vocabulary pairs from Markdown lines.
+        
+        States: outside a table (columns is None) or inside one (columns
+        holds the header's cell count and the two column indexes). Only
+        the two mapped cells of a data row are stripped.
         
         Args:
-            content: The Markdown file content
+            lines: Lines of Markdown, with or without line endings
             
-        Returns:
-            List of (japanese, german) tuples
+        Yields:
+            (japanese, german) tuples
         """
-        lines = content.split('\n')
-        vocab_pairs = []
-        in_table = False
-        header_found = False
+        columns: Optional[Tuple[int, int, int]] = None
+        header_cell = self._header_cell.search
         
         for line in lines:
-            # Check for header row
-            if MarkdownVocabParser.HEADER_PATTERN.match(line):
-                header_found = True
-                in_table = True
+            stripped = line.strip()
+            
+            if not stripped.startswith('|'):
+                # Blank lines are allowed inside a table, text ends it
+                if stripped:
+                    columns = None
+                continue
+            
+            if len(stripped) < 2 or not stripped.endswith('|'):
                 continue
+            cells = stripped[1:-1].split('|')
+            
+            # Only rows with a cell named like the Japanese column can be headers
+            if header_cell(stripped):
+                header = self._header_columns(cells)
+                if header is not None:
+                    columns = header
+                    continue
             
-            # Check for separator row
-            if in_table and MarkdownVocabParser.SEPARATOR_PATTERN.match(line):
+            if columns is None or len(cells) != columns[0]:
                 continue
             
-            # If we're in a table and found the header, try to parse data rows
-            if in_table and header_found:
-                match = MarkdownVocabParser.TABLE_ROW_PATTERN.match(line)
-                if match:
-                    japanese = match.group(1).strip()
-                    german = match.group(2).strip()
-                    
-                    # Skip empty rows
-                    if japanese and german:
-                        vocab_pairs.append((japanese, german))
-                elif line.strip() and not line.strip().startswith('|'):
-                    # End of table (non-table line encountered)
-                    in_table = False
-                    header_found = False
+            japanese = cells[columns[1]].strip()
+            german = cells[columns[2]].strip()
+            
+            # Skip empty rows and the separator row
+            if japanese and german and not _is_separator(japanese):
+                yield japanese, german
+    
+    def _header_columns(self, cells: List[str]) -> Optional[Tuple[int, int, int]]:
+        """Column layout of a header row, or None if cells is no header.
         
-        return vocab_pairs
+        Returns:
+            (cell count, Japanese column index, German column index)
+        """
+        names = [cell.strip().lower() for cell in cells]
+        try:
+            return len(cells), names.index(self.japanese_column), names.index(self.german_column)
+        except ValueError:
+            return None
     
     @staticmethod
     def _split_multiple_meanings(text: str) -> List[str]:
@@ -141,10 +177,12 @@ class MarkdownVocabParser:
         Returns:
             List of individual meanings, stripped of whitespace
         """
-        return [item.strip() for item in text.split(',') if item.strip()]
+        if ',' not in text:
+            stripped = text.strip()
+            return [stripped] if stripped else []
+        return [item for item in (part.strip() for part in text.split(',')) if item]
     
-    @staticmethod
-    def validate_table_format(content: str) -> bool:
+    def validate_table_format(self, content: str) -> bool:
         """Validate that the content contains a properly formatted table.
         
         Args:
@@ -153,23 +191,9 @@ class MarkdownVocabParser:
         Returns:
             True if the content contains a valid vocabulary table, False otherwise
         """
-        lines = content.split('\n')
-        
-        # Check for header
-        has_header = any(
-            MarkdownVocabParser.HEADER_PATTERN.match(line) 
-            for line in lines
-        )
-        
-        if not has_header:
-            return False
-        
-        # Check for at least one data row
-        has_data = any(
-            MarkdownVocabParser.TABLE_ROW_PATTERN.match(line) 
-            and not MarkdownVocabParser.HEADER_PATTERN.match(line)
-            and not MarkdownVocabParser.SEPARATOR_PATTERN.match(line)
-            for line in lines
-        )
-        
-        return has_data
\ No newline at end of file
+        return next(self._scan(content.splitlines()), None) is not None
+
+
+def _is_separator(cell: str) -> bool:
+    """Whether a table cell belongs to a separator row like |---|:--:|."""
+    return not cell.strip('-: ')
@@ -5,10 +5,13 @@ vocabulary learning sessions with adaptive query direction.
 """
 
 import random
-from typing import List, Optional
+from functools import partial
+from typing import List, Optional, Set
 
 from nihon_cli.core.answer_checker import AnswerChecker, AnswerCheckResult
+from nihon_cli.core.grading import DEFAULT_GRADING_MODE, create_grader
 from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.progress_journal import ProgressJournal
 from nihon_cli.infra.repository import VocabRepository
 from nihon_cli.ui.formatting import draw_box, COLOR_GREEN, COLOR_RED, COLOR_RESET
 
@@ -24,14 +27,23 @@ class VocabQuiz:
     - Providing session statistics
     """
     
-    def __init__(self, repository: VocabRepository):
+    def __init__(
+        self,
+        repository: VocabRepository,
+        grading: str = DEFAULT_GRADING_MODE
+    ):
         """Initialize the quiz engine.
         
         Args:
             repository: VocabRepository instance for database operations
+            grading: Grading mode, "sync", "async" or "end" (see core.grading)
         """
         self.repository = repository
+        self.progress = ProgressJournal(repository)
         self.answer_checker = AnswerChecker()
+        self.grader = create_grader(grading, self.answer_checker)
+        # Items whose answer is still being checked in the background
+        self._awaiting_verdict: Set[int] = set()
         self.current_session: List[VocabularyItem] = []
         self.session_stats = {
             'correct': 0,
@@ -78,8 +90,19 @@ class VocabQuiz:
         )
         print("\n" + draw_box(session_info, title="📚 Vokabel-Lernsitzung"))
         
-        # Run the quiz loop
-        self._run_quiz_loop()
+        # Load the semantic check model while the first question is shown
+        self.grader.prewarm()
+
+        # Run the quiz loop; progress is written back once at the end,
+        # also when the session is interrupted
+        interrupted = True
+        try:
+            interrupted = self._run_quiz_loop()
+        finally:
+            try:
+                self._finish_grading(interrupted)
+            finally:
+                self.progress.flush()
         
         # Display summary
         self._display_summary()
@@ -97,23 +120,47 @@ class VocabQuiz:
         """
         self.run_session(limit)
     
-    def _run_quiz_loop(self) -> None:
-        """Execute the main quiz loop for all vocabulary items."""
+    def _finish_grading(self, interrupted: bool) -> None:
+        """Deliver the outstanding verdicts before progress is written back.
+
+        After Ctrl+C the grader waits only briefly; answers still being
+        checked then are dropped and do not count.
+
+        Args:
+            interrupted: Whether the session was interrupted
+        """
+        if not interrupted:
+            self.grader.finish()
+            return
+        dropped = self.grader.cancel()
+        self._awaiting_verdict.clear()
+        if dropped:
+            print(f"⚠️  {dropped} Antwort(en) nicht mehr geprüft, sie werden nicht gewertet.")
+
+    def _run_quiz_loop(self) -> bool:
+        """Execute the main quiz loop for all vocabulary items.
+        
+        Returns:
+            True if the learner interrupted the session with Ctrl+C
+        """
         total = len(self.current_session)
         
         for index, item in enumerate(self.current_session, 1):
             # Determine query direction
             direction = item.current_direction
             
+            # Show verdicts of background checks that arrived meanwhile
+            self.grader.deliver_ready()
+
             # Display question
             self._display_question(item, index, total, direction)
             
             # Get user input
             try:
                 user_answer = input("\n> ").strip()
-            except (KeyboardInterrupt, EOFError):
+            except (KeyboardInterrupt, EOFError) as e:
                 print("\n\n⚠️  Lernsitzung abgebrochen.")
-                return
+                return isinstance(e, KeyboardInterrupt)
             
             # Increment questions asked counter
             self.questions_asked += 1
@@ -124,16 +171,17 @@ class VocabQuiz:
             else:  # de_to_jp
                 correct_answers = item.japanese_vocab
             
-            result = self.answer_checker.check(user_answer, correct_answers, direction)
-            is_correct = result.accepted
-
-            # Update progress
-            self._update_progress(item, direction, is_correct)
-
-            # Display feedback
-            self._display_feedback(result, user_answer, correct_answers, item)
+            result = self.grader.grade(
+                user_answer, correct_answers, direction,
+                partial(self._apply_result, item, direction, user_answer, correct_answers)
+            )
+            if result is None:
+                self._awaiting_verdict.add(item.id)
+                print(self.grader.pending_notice)
             
             print()  # Empty line for spacing
+
+        return False
     
     def _display_question(
         self,
@@ -162,13 +210,46 @@ class VocabQuiz:
         title = f"Frage {current}/{total}"
         print("\n" + draw_box(content, title=title))
     
+    def _apply_result(
+        self,
+        item: VocabularyItem,
+        direction: str,
+        user_answer: str,
+        correct_answers: List[str],
+        result: AnswerCheckResult
+    ) -> None:
+        """Record and display the result of an answer.
+
+        Called by the grader, right away or, for answers checked in the
+        background, once the verdict has arrived.
+
+        Args:
+            item: The vocabulary item that was quizzed
+            direction: The query direction used
+            user_answer: The user's answer
+            correct_answers: List of correct answers
+            result: The answer check result
+        """
+        if item.id in self._awaiting_verdict:
+            self._awaiting_verdict.discard(item.id)
+            print(f"\n🔎 Nachträglich geprüft: '{user_answer}'")
+
+        # Update progress
+        self._update_progress(item, direction, result.accepted)
+
+        # Display feedback
+        self._display_feedback(result, user_answer, correct_answers, item)
+
     def _update_progress(
         self, 
         item: VocabularyItem, 
         direction: str, 
         correct: bool
     ) -> None:
-        """Update the learning progress in the database.
+        """Record the learning progress in the progress journal.
+        
+        The journal writes the buffered updates to the database in one
+        transaction when the session ends.
         
         Args:
             item: The vocabulary item that was quizzed
@@ -176,19 +257,19 @@ class VocabQuiz:
             correct: Whether the answer was correct
         """
         if correct:
-            # Update progress counter
-            self.repository.update_progress(item.id, direction, True)
-            self.session_stats['correct'] += 1
-            
             # Update local item for accurate feedback
             if direction == "jp_to_de":
                 item.correct_german += 1
             else:
                 item.correct_japanese += 1
-            
+
+            # Update progress counter
+            self.progress.record_progress(item.id, direction)
+            self.session_stats['correct'] += 1
+
             # Check if item is now completed
             if item.is_ready_for_completion:
-                self.repository.mark_completed(item.id)
+                self.progress.record_completed(item.id)
                 self.session_stats['completed_items'] += 1
                 item.completed = True
         else:
@@ -210,7 +291,7 @@ class VocabQuiz:
             item: The vocabulary item
         """
         if result.accepted:
-            if result.method in ("semantic", "typo"):
+            if result.method in ("semantic", "typo", "kana"):
                 feedback = f"{COLOR_GREEN}✅ Richtig! ({result.feedback}){COLOR_RESET}"
             else:
                 feedback = f"{COLOR_GREEN}✅ Richtig!{COLOR_RESET}"
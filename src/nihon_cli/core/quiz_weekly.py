@@ -5,10 +5,13 @@ vocabulary learning sessions with weekly progress tracking and adjective
 opposite pairing.
 """
 
-from typing import List
+from functools import partial
+from typing import List, Set
 
 from nihon_cli.core.answer_checker import AnswerChecker, AnswerCheckResult
+from nihon_cli.core.grading import DEFAULT_GRADING_MODE, create_grader
 from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.progress_journal import ProgressJournal
 from nihon_cli.infra.repository import VocabRepository
 from nihon_cli.infra.weekly_session_repository import WeeklySessionRepository
 from nihon_cli.ui.formatting import draw_box, COLOR_GREEN, COLOR_RED, COLOR_RESET
@@ -28,17 +31,23 @@ class WeeklySessionQuiz:
     def __init__(
         self,
         vocab_repository: VocabRepository,
-        session_repository: WeeklySessionRepository
+        session_repository: WeeklySessionRepository,
+        grading: str = DEFAULT_GRADING_MODE
     ):
         """Initialize the weekly quiz engine.
 
         Args:
             vocab_repository: VocabRepository instance for vocab operations
             session_repository: WeeklySessionRepository for session operations
+            grading: Grading mode, "sync", "async" or "end" (see core.grading)
         """
         self.vocab_repo = vocab_repository
         self.session_repo = session_repository
+        self.progress = ProgressJournal(vocab_repository)
         self.answer_checker = AnswerChecker()
+        self.grader = create_grader(grading, self.answer_checker)
+        # Items whose answer is still being checked in the background
+        self._awaiting_verdict: Set[int] = set()
         self.session_stats = {
             'correct': 0,
             'incorrect': 0
@@ -86,8 +95,19 @@ class WeeklySessionQuiz:
         )
         print("\n" + draw_box(session_info, title="📚 Weekly Session"))
 
-        # Run the quiz loop
-        self._run_quiz_loop(quiz_sequence)
+        # Load the semantic check model while the first question is shown
+        self.grader.prewarm()
+
+        # Run the quiz loop; progress is written back once at the end,
+        # also when the session is interrupted
+        interrupted = True
+        try:
+            interrupted = self._run_quiz_loop(quiz_sequence)
+        finally:
+            try:
+                self._finish_grading(interrupted)
+            finally:
+                self.progress.flush()
 
         # Display summary
         self._display_summary()
@@ -105,7 +125,7 @@ class WeeklySessionQuiz:
         - Iterate through items
         - If adjective with opposite_id:
           - Add item to sequence
-          - Load opposite and add immediately after (if room available and in session)
+          - Add opposite immediately after (if room available and in session)
           - Mark opposite as "processed" to avoid duplicates
         - Else: Add item normally
         - Stop when max_items limit is reached
@@ -120,8 +140,8 @@ class WeeklySessionQuiz:
         sequence = []
         processed_ids = set()
 
-        # Create set of all IDs in this session for validation
-        session_item_ids = {item.id for item in items}
+        # Opposites are resolved from the session's own items, no queries
+        session_items_by_id = {item.id: item for item in items}
 
         for item in items:
             # Stop if we've reached the limit
@@ -137,21 +157,40 @@ class WeeklySessionQuiz:
             # Check for opposite adjective (only add if we still have room and it's in session)
             if item.vocab_type == 'adjective' and item.opposite_id and len(sequence) < max_items:
                 # Only add opposite if it's part of this session
-                if item.opposite_id in session_item_ids:
-                    opposite = self.vocab_repo.get_adjective_opposite(item.id)
-                    if opposite and opposite.id not in processed_ids:
-                        sequence.append(opposite)
-                        processed_ids.add(opposite.id)
+                opposite = session_items_by_id.get(item.opposite_id)
+                if opposite and opposite.id not in processed_ids:
+                    sequence.append(opposite)
+                    processed_ids.add(opposite.id)
 
         return sequence
 
-    def _run_quiz_loop(self, items: List[VocabularyItem]) -> None:
+    def _finish_grading(self, interrupted: bool) -> None:
+        """Deliver the outstanding verdicts before progress is written back.
+
+        After Ctrl+C the grader waits only briefly; answers still being
+        checked then are dropped and do not count.
+
+        Args:
+            interrupted: Whether the session was interrupted
+        """
+        if not interrupted:
+            self.grader.finish()
+            return
+        dropped = self.grader.cancel()
+        self._awaiting_verdict.clear()
+        if dropped:
+            print(f"⚠️  {dropped} Antwort(en) nicht mehr geprüft, sie werden nicht gewertet.")
+
+    def _run_quiz_loop(self, items: List[VocabularyItem]) -> bool:
         """Execute the main quiz loop for all vocabulary items.
 
         Uses weekly_direction property (2x rule) for direction determination.
 
         Args:
             items: List of vocabulary items to quiz
+
+        Returns:
+            True if the learner interrupted the session with Ctrl+C
         """
         total = len(items)
 
@@ -159,15 +198,18 @@ class WeeklySessionQuiz:
             # Use weekly direction (2x rule)
             direction = item.weekly_direction
 
+            # Show verdicts of background checks that arrived meanwhile
+            self.grader.deliver_ready()
+
             # Display question
             self._display_question(item, index, total, direction)
 
             # Get user input
             try:
                 user_answer = input("\n> ").strip()
-            except (KeyboardInterrupt, EOFError):
+            except (KeyboardInterrupt, EOFError) as e:
                 print("\n\n⚠️  Lernsitzung abgebrochen.")
-                return
+                return isinstance(e, KeyboardInterrupt)
 
             # Increment questions asked counter
             self.questions_asked += 1
@@ -178,26 +220,56 @@ class WeeklySessionQuiz:
             else:  # de_to_jp
                 correct_answers = item.japanese_vocab
 
-            result = self.answer_checker.check(user_answer, correct_answers, direction)
-            is_correct = result.accepted
+            result = self.grader.grade(
+                user_answer, correct_answers, direction,
+                partial(self._apply_result, item, direction, user_answer, correct_answers)
+            )
+            if result is None:
+                self._awaiting_verdict.add(item.id)
+                print(self.grader.pending_notice)
 
-            # Update weekly progress
-            self.vocab_repo.update_weekly_progress(item.id, direction, is_correct)
+            print()  # Empty line for spacing
 
-            # Update local item for accurate feedback
-            if is_correct:
-                if direction == "jp_to_de":
-                    item.weekly_correct_german += 1
-                else:
-                    item.weekly_correct_japanese += 1
-                self.session_stats['correct'] += 1
-            else:
-                self.session_stats['incorrect'] += 1
+        return False
 
-            # Display feedback with base form
-            self._display_feedback(result, user_answer, correct_answers, item)
+    def _apply_result(
+        self,
+        item: VocabularyItem,
+        direction: str,
+        user_answer: str,
+        correct_answers: List[str],
+        result: AnswerCheckResult
+    ) -> None:
+        """Record and display the result of an answer.
 
-            print()  # Empty line for spacing
+        Called by the grader, right away or, for answers checked in the
+        background, once the verdict has arrived.
+
+        Args:
+            item: The vocabulary item that was quizzed
+            direction: The query direction used
+            user_answer: The user's answer
+            correct_answers: List of correct answers
+            result: The answer check result
+        """
+        if item.id in self._awaiting_verdict:
+            self._awaiting_verdict.discard(item.id)
+            print(f"\n🔎 Nachträglich geprüft: '{user_answer}'")
+
+        # Update local item for accurate feedback and record the
+        # weekly progress in the journal
+        if result.accepted:
+            self.progress.record_weekly_progress(item.id, direction)
+            if direction == "jp_to_de":
+                item.weekly_correct_german += 1
+            else:
+                item.weekly_correct_japanese += 1
+            self.session_stats['correct'] += 1
+        else:
+            self.session_stats['incorrect'] += 1
+
+        # Display feedback with base form
+        self._display_feedback(result, user_answer, correct_answers, item)
 
     def _display_question(
         self,
@@ -242,7 +314,7 @@ class WeeklySessionQuiz:
             item: The vocabulary item
         """
         if result.accepted:
-            if result.method in ("semantic", "typo"):
+            if result.method in ("semantic", "typo", "kana"):
                 feedback = f"{COLOR_GREEN}✅ Richtig! ({result.feedback}){COLOR_RESET}"
             else:
                 feedback = f"{COLOR_GREEN}✅ Richtig!{COLOR_RESET}"
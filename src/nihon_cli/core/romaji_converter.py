@@ -6,11 +6,41 @@ This module provides functionality to convert romanized Japanese text (romaji)
 to the corresponding Hiragana or Katakana characters.
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from nihon_cli.data.hiragana_basic import HIRAGANA_BASIC_CHARACTERS
 from nihon_cli.data.hiragana_advanced import HIRAGANA_ADVANCED_CHARACTERS
 from nihon_cli.data.katakana_basic import KATAKANA_BASIC_CHARACTERS
 from nihon_cli.data.katakana_advanced import KATAKANA_ADVANCED_CHARACTERS
+from nihon_cli.data.words import find_word_by_romaji
+
+# Trie key of the (hiragana, katakana) pair that ends at a node
+_TERMINAL = ""
+
+# Alternative (Kunrei/Nihon-shiki) spellings mapped to the syllables used
+# in the character data
+_ROMAJI_ALIASES = {
+    "si": "shi", "ti": "chi", "tu": "tsu", "hu": "fu", "zi": "ji",
+    "sya": "sha", "syu": "shu", "syo": "sho",
+    "tya": "cha", "tyu": "chu", "tyo": "cho",
+    "zya": "ja", "zyu": "ju", "zyo": "jo",
+    "jya": "ja", "jyu": "ju", "jyo": "jo",
+}
+
+# Macron vowels are written as the vowel plus a long vowel mark
+_LONG_VOWEL_MARK = "ー"
+_MACRON_VOWELS = str.maketrans({
+    "ā": "a-", "ī": "i-", "ū": "u-", "ē": "e-", "ō": "o-",
+    "â": "a-", "î": "i-", "û": "u-", "ê": "e-", "ô": "o-",
+})
+
+# (hiragana, katakana) forms of small tsu and syllabic n
+_SOKUON = ("っ", "ッ")
+_SYLLABIC_N = ("ん", "ン")
+
+# A doubled letter of these is written with small tsu
+_CONSONANTS = frozenset("bcdfghjkmpqrstvwxz")
+# "n" followed by one of these starts a syllable instead of being ん
+_VOWELS_AND_Y = frozenset(("a", "e", "i", "o", "u", "y"))
 
 
 class RomajiConverter:
@@ -19,28 +49,53 @@ class RomajiConverter:
     
     This class builds mapping dictionaries from the existing character data
     and provides methods to convert romaji strings to their corresponding
-    Japanese characters.
+    Japanese characters. Words are tokenized in one left-to-right pass over
+    a trie of all syllables, taking the longest match at each position.
     """
     
     def __init__(self):
         """Initialize the converter with romaji-to-kana mappings."""
         self._hiragana_map: Dict[str, str] = {}
         self._katakana_map: Dict[str, str] = {}
+        # Nested dicts keyed by romaji letters; _TERMINAL holds (hiragana, katakana)
+        self._trie: Dict[str, Any] = {}
         self._build_mappings()
+        self._build_trie()
     
     def _build_mappings(self) -> None:
         """
         Build romaji-to-kana mapping dictionaries from character data.
+        
+        The first character with a given romaji wins, so "ji" and "zu"
+        map to じ and ず rather than the rarer ぢ and づ.
         """
         # Build Hiragana mapping
         all_hiragana = HIRAGANA_BASIC_CHARACTERS + HIRAGANA_ADVANCED_CHARACTERS
         for char in all_hiragana:
-            self._hiragana_map[char.romaji] = char.symbol
+            self._hiragana_map.setdefault(char.romaji, char.symbol)
         
         # Build Katakana mapping
         all_katakana = KATAKANA_BASIC_CHARACTERS + KATAKANA_ADVANCED_CHARACTERS
         for char in all_katakana:
-            self._katakana_map[char.romaji] = char.symbol
+            self._katakana_map.setdefault(char.romaji, char.symbol)
+    
+    def _build_trie(self) -> None:
+        """
+        Build the syllable trie from the mappings and alternative spellings.
+        """
+        syllables = {
+            romaji: (self._hiragana_map[romaji], self._katakana_map[romaji])
+            for romaji in self._hiragana_map.keys() & self._katakana_map.keys()
+        }
+        for alias, romaji in _ROMAJI_ALIASES.items():
+            if romaji in syllables:
+                syllables.setdefault(alias, syllables[romaji])
+        
+        for romaji, kana in syllables.items():
+            node = self._trie
+            for letter in romaji:
+                node = node.setdefault(letter, {})
+            node[_TERMINAL] = kana
     
     def romaji_to_hiragana(self, romaji: str) -> Optional[str]:
         """
@@ -93,8 +148,12 @@ class RomajiConverter:
         """
         Convert a romaji word to kana by breaking it into syllables.
         
-        This method attempts to parse the romaji word into individual syllables
-        and convert each to the corresponding kana character.
+        Takes the longest syllable at each position. Besides the syllables
+        of the character data it handles:
+        - doubled consonants as small tsu ("kitte" -> きって, "matcha" -> まっちゃ)
+        - syllabic n before consonants, at the end, as "n'" ("kan'i" -> かんい)
+          and as "nn" ("konnnichiha" -> こんにちは, "onnna" -> おんな)
+        - "-" and macron vowels as long vowel mark ("kōhī" -> こーひー)
         
         Args:
             romaji_word (str): The romaji word to convert.
@@ -105,36 +164,77 @@ class RomajiConverter:
         """
         if not romaji_word:
             return None
-            
-        # First try direct conversion (for single syllables)
-        direct_result = self.romaji_to_kana(romaji_word, prefer_hiragana)
-        if direct_result:
-            return direct_result
         
-        # Try syllable-by-syllable conversion
-        result = ""
+        text = romaji_word.lower().translate(_MACRON_VOWELS)
+        script = 0 if prefer_hiragana else 1
+        sokuon = _SOKUON[script]
+        trie = self._trie
+        length = len(text)
+        result = []
         i = 0
-        romaji_lower = romaji_word.lower()
         
-        while i < len(romaji_lower):
-            # Try longer syllables first (3 chars, then 2, then 1)
-            found = False
+        while i < length:
+            letter = text[i]
+            following = text[i + 1:i + 2]
+            
+            if letter in _CONSONANTS:
+                if following == letter or (letter == "t" and text.startswith("ch", i + 1)):
+                    result.append(sokuon)
+                    i += 1
+                    continue
+            elif letter == "n":
+                if following not in _VOWELS_AND_Y:
+                    # Syllabic n. As in an IME, "n'" and "nn" are one ん
+                    # ("onnna" -> おんな), except that "nn" before a vowel
+                    # is ん plus a syllable, as in Hepburn ("konnichiha")
+                    result.append(_SYLLABIC_N[script])
+                    if following == "'" or (
+                        following == "n" and text[i + 2:i + 3] not in _VOWELS_AND_Y
+                    ):
+                        i += 2
+                    else:
+                        i += 1
+                    continue
+            elif letter == "-":
+                result.append(_LONG_VOWEL_MARK)
+                i += 1
+                continue
             
-            for length in [3, 2, 1]:
-                if i + length <= len(romaji_lower):
-                    syllable = romaji_lower[i:i + length]
-                    kana = self.romaji_to_kana(syllable, prefer_hiragana)
-                    if kana:
-                        result += kana
-                        i += length
-                        found = True
-                        break
+            # Longest syllable starting at i
+            node = trie
+            kana = None
+            j = i
+            while j < length:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if _TERMINAL in node:
+                    kana = node[_TERMINAL]
+                    i = j
             
-            if not found:
+            if kana is None:
                 # If we can't convert this part, return None
                 return None
+            result.append(kana[script])
         
-        return result if result else None
+        return "".join(result) or None
+    
+    def convert_many(
+        self, romaji_words: Iterable[str], prefer_hiragana: bool = True
+    ) -> List[Optional[str]]:
+        """
+        Convert many romaji words to kana.
+        
+        Args:
+            romaji_words (Iterable[str]): The romaji words to convert.
+            prefer_hiragana (bool): If True, prefer Hiragana over Katakana.
+            
+        Returns:
+            List[Optional[str]]: The kana string (or None) per word, in order.
+        """
+        convert = self.convert_word_to_kana
+        return [convert(word, prefer_hiragana) for word in romaji_words]
     
     def convert_word_to_kana_safe(self, romaji_word: str, prefer_hiragana: bool = True) -> Optional[str]:
         """
@@ -154,18 +254,9 @@ class RomajiConverter:
         if not romaji_word:
             return None
         
-        # Check if this romaji corresponds to a word in the database
-        try:
-            from nihon_cli.data.words import get_words
-            all_words = get_words(include_advanced=True)
-            
-            # If the romaji matches any word's romaji, don't convert (it's a real word)
-            for word in all_words:
-                if word.romaji.lower() == romaji_word.lower():
-                    return None
-        except ImportError:
-            # If we can't import words, fall back to regular conversion
-            pass
+        # If the romaji matches any word's romaji, don't convert (it's a real word)
+        if find_word_by_romaji(romaji_word) is not None:
+            return None
         
         # If it's not a real word, try syllable-based conversion
         return self.convert_word_to_kana(romaji_word, prefer_hiragana)
@@ -227,4 +318,20 @@ def convert_romaji_word_to_kana(romaji_word: str, prefer_hiragana: bool = True)
     Returns:
         Optional[str]: The corresponding kana string, or None if conversion fails.
     """
-    return _converter.convert_word_to_kana(romaji_word, prefer_hiragana)
\ No newline at end of file
+    return _converter.convert_word_to_kana(romaji_word, prefer_hiragana)
+
+
+def convert_romaji_words_to_kana(
+    romaji_words: Iterable[str], prefer_hiragana: bool = True
+) -> List[Optional[str]]:
+    """
+    Convert many romaji words to kana.
+    
+    Args:
+        romaji_words (Iterable[str]): The romaji words to convert.
+        prefer_hiragana (bool): If True, prefer Hiragana over Katakana.
+        
+    Returns:
+        List[Optional[str]]: The kana string (or None) per word, in order.
+    """
+    return _converter.convert_many(romaji_words, prefer_hiragana)
@@ -0,0 +1,26 @@
+"""
+Seed data for the answer alias index: groups of interchangeable answers.
+
+All words of a group are accepted for each other. Entries are written in
+normalized form (lower case), as answers are compared after normalizing.
+"""
+
+SYNONYM_GROUPS: list[tuple[str, ...]] = [
+    # Japanese family terms: own family / someone else's family
+    ("そぼ", "おばあさん"),
+    ("そふ", "おじいさん"),
+    ("あに", "おにいさん"),
+    ("あね", "おねえさん"),
+    ("おとうと", "おとうとさん"),
+    ("いもうと", "いもうとさん"),
+    ("はは", "おかあさん"),
+    ("ちち", "おとうさん"),
+    ("おっと", "ごしゅじん"),
+    ("つま", "おくさん"),
+    ("かぞく", "ごかぞく"),
+    # German colloquial forms
+    ("großvater", "opa"),
+    ("großmutter", "oma"),
+    ("vater", "papa"),
+    ("mutter", "mama"),
+]
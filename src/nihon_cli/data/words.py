@@ -6,7 +6,8 @@ including their Romaji transcriptions and German translations, based on the Word
 This file maintains backward compatibility by combining basic and advanced words.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional
 from nihon_cli.core.word import Word
 from nihon_cli.data.words_basic import WORDS_BASIC
 from nihon_cli.data.words_advanced import WORDS_ADVANCED
@@ -15,6 +16,36 @@ from nihon_cli.data.words_advanced import WORDS_ADVANCED
 WORDS: List[Word] = WORDS_BASIC + WORDS_ADVANCED
 
 
+@lru_cache(maxsize=1)
+def get_romaji_index() -> Dict[str, Word]:
+    """
+    Get the index of all words by lowercase romaji.
+
+    Built on first use and shared afterwards; callers must not modify it.
+    If two words share a romaji, the first one is indexed.
+
+    Returns:
+        Dict[str, Word]: Mapping of lowercase romaji to word.
+    """
+    index: Dict[str, Word] = {}
+    for word in WORDS:
+        index.setdefault(word.romaji.lower(), word)
+    return index
+
+
+def find_word_by_romaji(romaji: str) -> Optional[Word]:
+    """
+    Find a word by its romaji, ignoring case.
+
+    Args:
+        romaji (str): The romaji to look up.
+
+    Returns:
+        Optional[Word]: The word, or None if no word has this romaji.
+    """
+    return get_romaji_index().get(romaji.lower())
+
+
 def get_words(include_advanced: bool = True) -> List[Word]:
     """
     Get all Japanese vocabulary words (basic + advanced combined).
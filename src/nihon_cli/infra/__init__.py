@@ -3,6 +3,12 @@
 This package contains database and other infrastructure-related modules.
 """
 
+from .connection import ConnectionManager, close_all_connections, get_connection_manager
 from .database import init_db
 
-__all__ = ["init_db"]
\ No newline at end of file
+__all__ = [
+    "ConnectionManager",
+    "close_all_connections",
+    "get_connection_manager",
+    "init_db",
+]
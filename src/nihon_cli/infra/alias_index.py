@@ -0,0 +1,237 @@
+"""Index of known answer equivalences.
+
+Answers known to be equivalent to an expected answer are accepted without
+a semantic check. The index combines the synonym groups shipped in
+data.synonyms with aliases learned from accepted semantic verdicts, which
+are stored in the answer_aliases table. It is loaded into memory once, so
+a lookup is a few set membership tests.
+
+A learned alias records the checker that accepted it (backend, model and
+prompt hash or threshold) and is only used while that checker is in use
+and the alias is younger than the verdict cache's TTL, so changing the
+model, prompt or backend invalidates aliases like it invalidates verdicts.
+
+Aliases of Japanese answers are compared in the form normalize_japanese()
+produces, like the kana check does, so "obaasan" and "オバアサン" are
+known aliases of そぼ just as おばあさん is.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from nihon_cli.core.kana_normalizer import normalize_japanese
+from nihon_cli.data.synonyms import SYNONYM_GROUPS
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.database import init_db
+from nihon_cli.infra.verdict_cache import DEFAULT_TTL_SECONDS
+
+# Checker that accepted an alias: (backend, model, prompt hash or threshold)
+AliasSource = Tuple[str, str, str]
+
+# Hiragana, katakana and kanji all lie above this code point
+_FIRST_JAPANESE_CHAR = "\u3040"
+
+
+def _is_japanese(text: str) -> bool:
+    """Whether text contains Japanese script."""
+    return any(char >= _FIRST_JAPANESE_CHAR for char in text)
+
+
+@dataclass
+class LearnedAlias:
+    """A stored alias with the checker that accepted it."""
+
+    expected: str
+    alias: str
+    backend: str
+    model: str
+    verdict_hash: str
+    created_at: float
+
+
+class AliasIndex:
+    """In-memory set of (expected, alias) pairs backed by SQLite.
+
+    expected is either a single normalized expected answer or, for
+    learned aliases, the key of a whole answer set (see expected_key()),
+    because a verdict only says that the answer matches one of the set.
+    Pairs are held under their comparison keys (see _pair_key()); the
+    database keeps the answers as they were given.
+    """
+
+    def __init__(
+        self,
+        seed_groups: Iterable[Tuple[str, ...]] = SYNONYM_GROUPS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        japanese_key: Callable[[str], str] = normalize_japanese,
+    ):
+        """Load the seed groups and the learned aliases.
+
+        Args:
+            seed_groups: Groups of mutually equivalent normalized answers
+            ttl_seconds: Age after which a learned alias is no longer used
+            japanese_key: Comparison form of Japanese answers; pass the
+                normalization the kana check uses
+
+        Raises:
+            sqlite3.Error: If the learned aliases cannot be loaded
+        """
+        self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
+        self._lock = threading.Lock()
+        self._ttl_seconds = ttl_seconds
+        self._japanese_key = japanese_key
+
+        self._seed_pairs: Set[Tuple[str, str]] = {
+            self._pair_key(expected, alias)
+            for group in seed_groups
+            for expected in group
+            for alias in group
+            if expected != alias
+        }
+        # (expected, alias, backend, model, verdict_hash)
+        self._learned: Set[Tuple[str, str, str, str, str]] = self._load_learned()
+
+    def _load_learned(self) -> Set[Tuple[str, str, str, str, str]]:
+        """Keyed rows of the learned aliases younger than the TTL."""
+        with self._connections.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT expected, alias, backend, model, verdict_hash
+                FROM answer_aliases WHERE created_at >= ?
+                """,
+                (time.time() - self._ttl_seconds,)
+            ).fetchall()
+        return {
+            (*self._pair_key(expected, alias), *source)
+            for expected, alias, *source in rows
+        }
+
+    def _pair_key(self, expected: str, alias: str) -> Tuple[str, str]:
+        """Comparison form of an (expected, alias) pair.
+
+        An alias of a Japanese answer is compared as Japanese, whatever
+        script it was typed in; other pairs are compared as they are.
+        """
+        if not _is_japanese(expected):
+            return expected, alias
+        key = self._japanese_key
+        members = expected.split("\n")
+        if len(members) > 1:
+            return self.expected_key([key(member) for member in members]), key(alias)
+        return key(expected), key(alias)
+
+    @staticmethod
+    def expected_key(expected: Sequence[str]) -> str:
+        """Key of a normalized answer set; a single answer is its own key."""
+        return "\n".join(sorted(set(expected)))
+
+    def lookup(
+        self, answer: str, expected: Sequence[str], source: AliasSource
+    ) -> Optional[str]:
+        """Find an expected answer the given answer is a known alias of.
+
+        Args:
+            answer: The normalized user answer
+            expected: Normalized expected answers
+            source: The checker in use; learned aliases of others are ignored
+
+        Returns:
+            The matching expected answer (or answer set key), None if the
+            answer is not a known alias
+        """
+        seed_pairs, learned = self._seed_pairs, self._learned
+        for candidate in expected:
+            pair = self._pair_key(candidate, answer)
+            if pair in seed_pairs or (*pair, *source) in learned:
+                return candidate
+        if len(expected) > 1:
+            key = self.expected_key(expected)
+            if (*self._pair_key(key, answer), *source) in learned:
+                return key
+        return None
+
+    def add(self, answer: str, expected: Sequence[str], source: AliasSource) -> None:
+        """Learn that an answer is acceptable for an answer set.
+
+        Args:
+            answer: The normalized user answer
+            expected: Normalized expected answers it was accepted for
+            source: The checker that accepted it
+
+        Raises:
+            sqlite3.Error: If the alias cannot be stored
+        """
+        expected_key = self.expected_key(expected)
+        keyed = (*self._pair_key(expected_key, answer), *source)
+        with self._lock:
+            if keyed in self._learned:
+                return
+            self._learned.add(keyed)
+
+        with self._connections.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO answer_aliases (
+                    expected, alias, backend, model, verdict_hash, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (expected_key, answer, *source, time.time())
+            )
+
+    def list_learned(self, search: Optional[str] = None) -> List[LearnedAlias]:
+        """All stored aliases, newest first.
+
+        Args:
+            search: Only aliases whose alias or expected answer contains this
+
+        Raises:
+            sqlite3.Error: If the aliases cannot be read
+        """
+        query = """
+            SELECT expected, alias, backend, model, verdict_hash, created_at
+            FROM answer_aliases
+        """
+        params: Tuple[str, ...] = ()
+        if search:
+            query += " WHERE instr(alias, ?) > 0 OR instr(expected, ?) > 0"
+            params = (search, search)
+        with self._connections.transaction() as conn:
+            rows = conn.execute(query + " ORDER BY created_at DESC", params).fetchall()
+        return [LearnedAlias(*row) for row in rows]
+
+    def delete(self, alias: str, expected: Optional[str] = None) -> int:
+        """Forget a learned alias, so the answer is judged again.
+
+        The accepting verdicts the alias came from are removed from the
+        verdict cache as well.
+
+        Args:
+            alias: The normalized alias
+            expected: Only for this expected answer; all if None
+
+        Returns:
+            Number of alias rows removed
+
+        Raises:
+            sqlite3.Error: If the aliases cannot be removed
+        """
+        # An expected answer also selects the answer sets containing it
+        scope = "" if expected is None else \
+            " AND instr(char(10) || expected || char(10), char(10) || ? || char(10)) > 0"
+        params: Tuple[str, ...] = (alias,) if expected is None else (alias, expected)
+        with self._connections.transaction() as conn:
+            removed = conn.execute(
+                f"DELETE FROM answer_aliases WHERE alias = ?{scope}", params
+            ).rowcount
+            conn.execute(
+                f"DELETE FROM semantic_verdicts WHERE accepted = 1 AND answer = ?{scope}",
+                params
+            )
+
+        learned = self._load_learned()
+        with self._lock:
+            self._learned = learned
+        return removed
@@ -7,7 +7,41 @@ stored in the user's home directory at ~/.nihon-cli/config.toml.
 import tomli
 import tomli_w
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
+
+# SQLite pragmas applied to every connection, per storage profile.
+# "fast" uses a write-ahead log with relaxed syncing: a power loss can
+# drop the last transactions but never corrupts the database. "safe"
+# keeps SQLite's durable defaults (rollback journal, full fsync).
+DB_PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -16 * 1024,  # negative: size in KiB
+        "temp_store": "MEMORY",
+    },
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -16 * 1024,
+        "temp_store": "DEFAULT",
+    },
+}
+
+# Durable unless the user opts into "fast" with 'config set db_profile fast'
+DEFAULT_DB_PROFILE = "safe"
+
+# Backends of the semantic answer check: "chat" asks the LLM for a verdict,
+# "embedding" compares embedding vectors of answer and expected meanings
+SEMANTIC_BACKENDS = ("chat", "embedding")
+DEFAULT_SEMANTIC_BACKEND = "chat"
+
+# Multilingual embedding model and the cosine similarity at which an
+# answer counts as a match; calibrate per model with real answers
+DEFAULT_EMBEDDING_MODEL = "bge-m3"
+DEFAULT_EMBEDDING_THRESHOLD = 0.8
 
 
 def _get_config_path() -> Path:
@@ -75,4 +109,75 @@ def load_config(key: str) -> Optional[str]:
     # Load and return the value
     with open(config_path, "rb") as f:
         config = tomli.load(f)
-        return config.get(key)
\ No newline at end of file
+        return config.get(key)
+
+
+def load_db_profile() -> Dict[str, Union[int, str]]:
+    """Load the SQLite pragmas of the configured storage profile.
+    
+    The profile is selected with the 'db_profile' key ("fast" or "safe")
+    and defaults to "safe".
+    
+    Returns:
+        Mapping of pragma names to values
+        
+    Raises:
+        ValueError: If the configured profile is unknown
+    """
+    profile = load_config('db_profile') or DEFAULT_DB_PROFILE
+    if profile not in DB_PROFILES:
+        raise ValueError(
+            f"Unknown db_profile '{profile}', expected one of: "
+            f"{', '.join(DB_PROFILES)}"
+        )
+    return DB_PROFILES[profile]
+
+
+def load_semantic_backend() -> str:
+    """Load the configured semantic check backend.
+    
+    The backend is selected with the 'semantic_backend' key ("chat" or
+    "embedding") and defaults to "chat".
+    
+    Returns:
+        The backend name
+        
+    Raises:
+        ValueError: If the configured backend is unknown
+    """
+    backend = load_config('semantic_backend') or DEFAULT_SEMANTIC_BACKEND
+    if backend not in SEMANTIC_BACKENDS:
+        raise ValueError(
+            f"Unknown semantic_backend '{backend}', expected one of: "
+            f"{', '.join(SEMANTIC_BACKENDS)}"
+        )
+    return backend
+
+
+def load_embedding_settings() -> Tuple[str, float]:
+    """Load the embedding model and similarity threshold.
+    
+    Read from the 'embedding_model' and 'embedding_threshold' keys.
+    
+    Returns:
+        Tuple of (model name, threshold)
+        
+    Raises:
+        ValueError: If the threshold is not a number between 0 and 1
+    """
+    model = load_config('embedding_model') or DEFAULT_EMBEDDING_MODEL
+    threshold = float(load_config('embedding_threshold') or DEFAULT_EMBEDDING_THRESHOLD)
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError(f"embedding_threshold must be between 0 and 1, got {threshold}")
+    return model, threshold
+
+
+def load_strip_qualifiers() -> bool:
+    """Load whether possessive prefixes and kinship さん are ignored in Japanese answers.
+    
+    Enabled by setting the 'jp_strip_qualifiers' key to "true".
+    
+    Returns:
+        True if qualifiers are stripped before comparing
+    """
+    return str(load_config('jp_strip_qualifiers')).lower() in ("true", "1", "yes")
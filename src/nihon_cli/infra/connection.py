@@ -0,0 +1,146 @@
+"""Shared SQLite connection management for the vocabulary database.
+
+This module keeps one long-lived connection per database file and thread,
+so that all repositories of a process share a warm connection with its
+prepared statement cache instead of reconnecting for every operation.
+"""
+
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from nihon_cli.infra.config import load_db_profile
+
+# Number of prepared statements kept per connection
+_STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionManager:
+    """Manages long-lived SQLite connections for a single database file.
+
+    Each thread gets its own connection, which is opened lazily on first use
+    and configured exactly once. Work is grouped into explicit units of work
+    via transaction(); nested units of work join the outermost transaction.
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize the connection manager.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection.
+
+        Applies the pragmas of the configured storage profile (see
+        config.DB_PROFILES) once per connection.
+
+        Returns:
+            sqlite3.Connection: Connection with pragmas and row factory set
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        for pragma, value in load_db_profile().items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection owned by the calling thread.
+
+        Returns:
+            sqlite3.Connection: Open connection for the current thread
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a unit of work on the thread's connection.
+
+        The outermost unit of work commits on success and rolls back on any
+        exception. Nested calls share the outer transaction.
+
+        Yields:
+            sqlite3.Connection: The thread's connection
+
+        Raises:
+            sqlite3.Error: If database operations fail
+        """
+        conn = self.connection
+        depth = self._local.depth
+        self._local.depth = depth + 1
+        try:
+            yield conn
+            if depth == 0:
+                conn.commit()
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+
+    def close(self) -> None:
+        """Close all connections opened by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+_managers: Dict[Path, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: Path) -> ConnectionManager:
+    """Get the process-wide connection manager for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        ConnectionManager: Shared manager for this database
+    """
+    key = Path(db_path).resolve()
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = ConnectionManager(key)
+            _managers[key] = manager
+        return manager
+
+
+def close_all_connections() -> None:
+    """Close every connection opened through get_connection_manager()."""
+    with _managers_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+    for manager in managers:
+        manager.close()
+
+
+atexit.register(close_all_connections)
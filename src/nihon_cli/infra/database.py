@@ -6,26 +6,28 @@ storing vocabulary items and their learning progress.
 
 import sqlite3
 from pathlib import Path
+from typing import Set
 
 from nihon_cli.infra.config import load_config
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.migrations import SCHEMA_VERSION, MigrationManager
 
+# Database files whose schema was already verified by this process
+_initialized_paths: Set[Path] = set()
+
+
+def _resolve_db_path() -> Path:
+    """Determine the database location.
+
+    Loads the database path from the configuration file if available,
+    otherwise falls back to ~/.nihon-cli/vocab.db.
 
-def init_db() -> Path:
-    """Initialize the vocabulary database.
-    
-    Creates the SQLite database at ~/.nihon-cli/vocab.db if it doesn't exist.
-    Also creates the vocabulary table with the required schema and indexes.
-    Loads the database path from the configuration file if available.
-        
     Returns:
-        Path: The path to the initialized database file
-        
-    Raises:
-        sqlite3.Error: If database creation or schema setup fails
+        Path: The path to the database file
     """
     # Try to load database path from config
     config_db_path = load_config('db_path')
-    
+
     # Determine database location
     if config_db_path is not None:
         db_path = Path(config_db_path)
@@ -34,12 +36,24 @@ def init_db() -> Path:
         db_dir = Path.home() / ".nihon-cli"
         db_dir.mkdir(parents=True, exist_ok=True)
         db_path = db_dir / "vocab.db"
-    
+
+    return db_path
+
+
+def _create_schema(db_path: Path) -> None:
+    """Create the base vocabulary table and its indexes.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Raises:
+        sqlite3.Error: If schema setup fails
+    """
     # Connect to database (creates file if it doesn't exist)
     conn = sqlite3.connect(db_path)
     conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
     cursor = conn.cursor()
-    
+
     try:
         # Create vocabulary table
         cursor.execute("""
@@ -56,30 +70,61 @@ def init_db() -> Path:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
         # Create indexes for performance optimization
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_japanese_vocab 
+            CREATE INDEX IF NOT EXISTS idx_japanese_vocab
             ON vocabulary(japanese_vocab)
         """)
-        
+
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_completed 
+            CREATE INDEX IF NOT EXISTS idx_completed
             ON vocabulary(completed)
         """)
-        
+
         # Commit changes
         conn.commit()
-        
+
     except sqlite3.Error as e:
         conn.rollback()
         raise sqlite3.Error(f"Failed to initialize database: {e}") from e
     finally:
         conn.close()
 
-    # Run migrations to add new columns and tables
-    from nihon_cli.infra.migrations import MigrationManager
-    migration_manager = MigrationManager(db_path)
-    migration_manager.run_migrations()
 
-    return Path(db_path)
\ No newline at end of file
+def init_db() -> Path:
+    """Initialize the vocabulary database.
+
+    Creates the SQLite database at ~/.nihon-cli/vocab.db if it doesn't exist.
+    Also creates the vocabulary table with the required schema and indexes.
+    Loads the database path from the configuration file if available.
+
+    The schema check runs at most once per process. A fully migrated
+    database is marked with PRAGMA user_version = SCHEMA_VERSION, so an
+    up-to-date database costs a single pragma read instead of DDL and
+    migration queries.
+
+    Returns:
+        Path: The path to the initialized database file
+
+    Raises:
+        sqlite3.Error: If database creation or schema setup fails
+    """
+    db_path = _resolve_db_path()
+    if db_path in _initialized_paths:
+        return db_path
+
+    conn = get_connection_manager(db_path).connection
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    if user_version < SCHEMA_VERSION:
+        _create_schema(db_path)
+
+        # Run migrations to add new columns and tables
+        migration_manager = MigrationManager(db_path)
+        migration_manager.run_migrations()
+
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    _initialized_paths.add(db_path)
+    return Path(db_path)
@@ -0,0 +1,114 @@
+"""Storage of meaning embeddings for the embedding semantic backend.
+
+Vectors are stored L2-normalized as compact little-endian float32 blobs in
+the meaning_embeddings table, keyed by embedding model and meaning text.
+"""
+
+import math
+import sys
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.database import init_db
+
+# Texts per IN (...) lookup, below SQLite's host parameter limit
+_MAX_SQL_VARIABLES = 500
+
+
+def normalize_vector(values: Sequence[float]) -> array:
+    """Scale a vector to unit length, so cosine similarity is a dot product.
+
+    Args:
+        values: Raw embedding
+
+    Returns:
+        float32 array of unit length (unchanged if the vector is zero)
+    """
+    vector = array('f', values)
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm > 0:
+        vector = array('f', (v / norm for v in vector))
+    return vector
+
+
+def encode_vector(vector: array) -> bytes:
+    """Serialize a float32 array as a little-endian blob."""
+    if sys.byteorder != 'little':
+        vector = array('f', vector)
+        vector.byteswap()
+    return vector.tobytes()
+
+
+def decode_vector(blob: bytes) -> array:
+    """Deserialize a blob written by encode_vector()."""
+    vector = array('f')
+    vector.frombytes(blob)
+    if sys.byteorder != 'little':
+        vector.byteswap()
+    return vector
+
+
+class EmbeddingStore:
+    """Repository for stored meaning embeddings."""
+
+    def __init__(self):
+        """Initialize the store with a database connection."""
+        self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, bytes]:
+        """Fetch the stored vectors of several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Meaning texts
+
+        Returns:
+            Mapping of text to encoded vector, for the texts that have one
+        """
+        texts = list(dict.fromkeys(texts))
+        found: Dict[str, bytes] = {}
+        with self._connections.transaction() as conn:
+            for start in range(0, len(texts), _MAX_SQL_VARIABLES):
+                chunk = texts[start:start + _MAX_SQL_VARIABLES]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT text, vector FROM meaning_embeddings
+                    WHERE model = ? AND text IN ({placeholders})
+                    """,
+                    (model, *chunk)
+                )
+                found.update((text, vector) for text, vector in rows)
+        return found
+
+    def put_many(self, model: str, vectors: List[Tuple[str, array]]) -> None:
+        """Store normalized vectors, replacing existing ones.
+
+        Args:
+            model: Embedding model name
+            vectors: (text, vector) pairs as returned by normalize_vector()
+        """
+        with self._connections.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO meaning_embeddings (model, text, dim, vector)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(model, text, len(vector), encode_vector(vector)) for text, vector in vectors]
+            )
+
+    def missing(self, model: str, texts: Iterable[str]) -> List[str]:
+        """Texts that have no stored vector yet, in first-seen order.
+
+        Args:
+            model: Embedding model name
+            texts: Meaning texts
+
+        Returns:
+            The texts without a stored vector
+        """
+        texts = list(dict.fromkeys(texts))
+        stored = self.get_many(model, texts)
+        return [text for text in texts if text not in stored]
@@ -0,0 +1,226 @@
+"""Repository for the record of imported source files.
+
+Every import stores the fingerprint of its source file (content hash,
+size and mtime), the version of the parser that read it and the ids of
+the vocabulary it inserted. A re-upload of an unchanged file is then
+recognized without parsing it, and a changed file only needs to insert
+the items that the earlier import did not already add.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.database import init_db
+
+# Upper bound for host parameters per statement (SQLite < 3.32 allows 999)
+_MAX_SQL_VARIABLES = 500
+
+# Bytes read per step while hashing a file
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileFingerprint:
+    """Identity of a source file's content.
+
+    Attributes:
+        path: The file
+        size: File size in bytes
+        mtime: Modification time in seconds since the epoch
+        content_hash: SHA-256 of the content, computed on first access
+    """
+
+    path: Path
+    size: int
+    mtime: float
+    _content_hash: Optional[str] = None
+
+    @classmethod
+    def of(cls, path: Path) -> "FileFingerprint":
+        """Fingerprint a file from its metadata; the hash is deferred."""
+        stat = path.stat()
+        return cls(path, stat.st_size, stat.st_mtime)
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the file content."""
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            with open(self.path, "rb") as f:
+                for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    digest.update(block)
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+
+@dataclass
+class ImportRecord:
+    """A stored import of a source file (or one sheet of it)."""
+
+    content_hash: str
+    size: int
+    mtime: float
+    parser_version: int
+    vocab_ids: List[int]
+
+
+class ImportRepository:
+    """Repository for the imports table."""
+
+    def __init__(self):
+        """Initialize the repository with a database connection."""
+        self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
+
+    @staticmethod
+    def source_key(path: Path) -> str:
+        """Key under which imports of a file are stored."""
+        return str(path.resolve())
+
+    def get_import(self, path: Path, sheet: str = "") -> Optional[ImportRecord]:
+        """Look up the last import of a file or sheet.
+
+        Args:
+            path: Source file
+            sheet: Sheet name, '' for files without sheets
+
+        Returns:
+            The stored record, or None if the file was never imported
+
+        Raises:
+            sqlite3.Error: If the lookup fails
+        """
+        with self._connections.transaction() as conn:
+            row = conn.execute(
+                """
+                SELECT content_hash, size, mtime, parser_version, vocab_ids
+                FROM imports WHERE source_path = ? AND sheet = ?
+                """,
+                (self.source_key(path), sheet)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return ImportRecord(row[0], row[1], row[2], row[3], json.loads(row[4]))
+
+    def get_imports(self, path: Path) -> Dict[str, ImportRecord]:
+        """Look up the last imports of all sheets of a file.
+
+        Args:
+            path: Source file
+
+        Returns:
+            Records by sheet name ('' for files without sheets)
+
+        Raises:
+            sqlite3.Error: If the lookup fails
+        """
+        with self._connections.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT sheet, content_hash, size, mtime, parser_version, vocab_ids
+                FROM imports WHERE source_path = ?
+                """,
+                (self.source_key(path),)
+            ).fetchall()
+
+        return {
+            row[0]: ImportRecord(row[1], row[2], row[3], row[4], json.loads(row[5]))
+            for row in rows
+        }
+
+    @staticmethod
+    def is_unchanged(
+        record: Optional[ImportRecord], fingerprint: FileFingerprint, parser_version: int
+    ) -> bool:
+        """Whether an import is still current for a file.
+
+        Size and mtime are compared first; the content is only hashed if
+        they differ, so a touched but unchanged file still counts as
+        unchanged.
+
+        Args:
+            record: The last import, or None
+            fingerprint: Fingerprint of the file as it is now
+            parser_version: Version of the parser that would read it
+
+        Returns:
+            True if parsing the file again cannot produce anything new
+        """
+        if record is None or record.parser_version != parser_version:
+            return False
+        if record.size == fingerprint.size and record.mtime == fingerprint.mtime:
+            return True
+        return record.content_hash == fingerprint.content_hash
+
+    def get_known_keys(self, record: Optional[ImportRecord]) -> Set[str]:
+        """Japanese keys of the vocabulary an import inserted.
+
+        Args:
+            record: The last import, or None
+
+        Returns:
+            Set of japanese_vocab strings still stored
+
+        Raises:
+            sqlite3.Error: If the lookup fails
+        """
+        if record is None or not record.vocab_ids:
+            return set()
+
+        keys: Set[str] = set()
+        ids = record.vocab_ids
+        with self._connections.transaction() as conn:
+            for start in range(0, len(ids), _MAX_SQL_VARIABLES):
+                chunk = ids[start:start + _MAX_SQL_VARIABLES]
+                placeholders = ','.join('?' * len(chunk))
+                keys.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT japanese_vocab FROM vocabulary WHERE id IN ({placeholders})",
+                        chunk
+                    )
+                )
+        return keys
+
+    def record_import(
+        self,
+        path: Path,
+        fingerprint: FileFingerprint,
+        parser_version: int,
+        vocab_ids: Iterable[int],
+        sheet: str = "",
+    ) -> None:
+        """Store or replace the record of an import.
+
+        Args:
+            path: Source file
+            fingerprint: Fingerprint of the imported content
+            parser_version: Version of the parser that read it
+            vocab_ids: Ids of all vocabulary inserted from this source
+            sheet: Sheet name, '' for files without sheets
+
+        Raises:
+            sqlite3.Error: If the record cannot be stored
+        """
+        with self._connections.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO imports (
+                    source_path, sheet, content_hash, size, mtime,
+                    parser_version, vocab_ids, imported_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (
+                    self.source_key(path),
+                    sheet,
+                    fingerprint.content_hash,
+                    fingerprint.size,
+                    fingerprint.mtime,
+                    parser_version,
+                    json.dumps(sorted(set(vocab_ids))),
+                )
+            )
@@ -162,6 +162,326 @@ class Migration002CreateWeeklySessions(Migration):
             conn.close()
 
 
+class Migration003AddSamplingIndex(Migration):
+    """Migration to add an index for sampling incomplete vocabulary."""
+
+    version = 3
+    description = "Add (completed, upload_tag) index for vocabulary sampling"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the covering index used by random sampling."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_completed_upload_tag
+                ON vocabulary(completed, upload_tag)
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 003 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration004CreateVocabularyMeanings(Migration):
+    """Migration to store meanings in a vocabulary_meanings child table."""
+
+    version = 4
+    description = "Create vocabulary_meanings table and backfill it"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the meanings table and split existing entries into it."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS vocabulary_meanings (
+                    vocab_id INTEGER NOT NULL REFERENCES vocabulary(id) ON DELETE CASCADE,
+                    lang TEXT NOT NULL CHECK(lang IN ('ja', 'de')),
+                    position INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    PRIMARY KEY (vocab_id, lang, position)
+                ) WITHOUT ROWID
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_vocabulary_meanings_text
+                ON vocabulary_meanings(text, lang)
+            """)
+
+            # Existing entries only have the comma-separated columns
+            cursor.execute("""
+                SELECT id, japanese_vocab, german_vocab FROM vocabulary
+                WHERE id NOT IN (SELECT vocab_id FROM vocabulary_meanings)
+            """)
+            meanings = []
+            for vocab_id, japanese_str, german_str in cursor.fetchall():
+                for lang, joined in (('ja', japanese_str), ('de', german_str)):
+                    parts = [v.strip() for v in joined.split(',') if v.strip()]
+                    meanings.extend(
+                        (vocab_id, lang, position, text)
+                        for position, text in enumerate(parts)
+                    )
+
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO vocabulary_meanings (vocab_id, lang, position, text)
+                VALUES (?, ?, ?, ?)
+                """,
+                meanings
+            )
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 004 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration005CreateProgressJournalSegments(Migration):
+    """Migration to track applied progress journal segments."""
+
+    version = 5
+    description = "Create progress_journal_segments table"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the table recording flushed journal segments."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS progress_journal_segments (
+                    segment_id TEXT PRIMARY KEY,
+                    event_count INTEGER NOT NULL,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 005 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration006DropRedundantSessionItemsIndex(Migration):
+    """Migration to drop the session_id index on weekly_session_items.
+
+    The UNIQUE(session_id, vocab_id) constraint already creates a covering
+    index with session_id as its prefix, which serves both the lookup of a
+    session's items and the join onto vocabulary.
+    """
+
+    version = 6
+    description = "Drop redundant weekly_session_items(session_id) index"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Drop idx_weekly_session_items_session."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DROP INDEX IF EXISTS idx_weekly_session_items_session")
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 006 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration007CreateSemanticVerdicts(Migration):
+    """Migration to add the cache of semantic answer check verdicts."""
+
+    version = 7
+    description = "Create semantic_verdicts cache table"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the semantic_verdicts table and its eviction index."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_verdicts (
+                    model TEXT NOT NULL,
+                    direction TEXT NOT NULL,
+                    expected TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    accepted BOOLEAN NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    PRIMARY KEY (model, direction, expected, answer)
+                ) WITHOUT ROWID
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_semantic_verdicts_last_used
+                ON semantic_verdicts(last_used_at)
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 007 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration008CreateMeaningEmbeddings(Migration):
+    """Migration to add stored embeddings of vocabulary meanings."""
+
+    version = 8
+    description = "Create meaning_embeddings table"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the meaning_embeddings table."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            # Keyed by text rather than vocabulary id: identical meanings
+            # share one vector, and answers are matched by text
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meaning_embeddings (
+                    model TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, text)
+                ) WITHOUT ROWID
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 008 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration009CreateAnswerAliases(Migration):
+    """Migration to add answer aliases learned from semantic verdicts."""
+
+    version = 9
+    description = "Create answer_aliases table"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the answer_aliases table."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            # An alias is only valid for the checker that accepted it:
+            # backend, model and prompt hash or threshold (verdict_hash)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS answer_aliases (
+                    expected TEXT NOT NULL,
+                    alias TEXT NOT NULL,
+                    backend TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    verdict_hash TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (expected, alias, backend, model, verdict_hash)
+                ) WITHOUT ROWID
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 009 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+class Migration010CreateImports(Migration):
+    """Migration to add the record of imported source files."""
+
+    version = 10
+    description = "Create imports table"
+
+    @classmethod
+    def apply(cls, db_path: Path) -> None:
+        """Create the imports table."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        cursor = conn.cursor()
+
+        try:
+            # One row per source file and sheet ('' for single-table files);
+            # vocab_ids is a JSON array of the ids the import inserted
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS imports (
+                    source_path TEXT NOT NULL,
+                    sheet TEXT NOT NULL DEFAULT '',
+                    content_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    parser_version INTEGER NOT NULL,
+                    vocab_ids TEXT NOT NULL DEFAULT '[]',
+                    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (source_path, sheet)
+                ) WITHOUT ROWID
+            """)
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.Error(f"Migration 010 failed: {e}") from e
+        finally:
+            conn.close()
+
+
+# All migrations in the order they are applied
+MIGRATIONS: List[Type[Migration]] = [
+    Migration001AddWeeklyFields,
+    Migration002CreateWeeklySessions,
+    Migration003AddSamplingIndex,
+    Migration004CreateVocabularyMeanings,
+    Migration005CreateProgressJournalSegments,
+    Migration006DropRedundantSessionItemsIndex,
+    Migration007CreateSemanticVerdicts,
+    Migration008CreateMeaningEmbeddings,
+    Migration009CreateAnswerAliases,
+    Migration010CreateImports,
+]
+
+# Schema version of a fully migrated database
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
 class MigrationManager:
     """Manages database migrations with version tracking."""
 
@@ -172,10 +492,7 @@ class MigrationManager:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
-        self.migrations: List[Type[Migration]] = [
-            Migration001AddWeeklyFields,
-            Migration002CreateWeeklySessions,
-        ]
+        self.migrations: List[Type[Migration]] = list(MIGRATIONS)
 
     def _ensure_schema_version_table(self) -> None:
         """Create schema_version table if it doesn't exist."""
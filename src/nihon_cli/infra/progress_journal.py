@@ -0,0 +1,295 @@
+"""Write-behind journal for quiz progress updates.
+
+Answer events are buffered in memory and appended to a small on-disk
+journal file instead of being written to SQLite one commit at a time.
+The buffer is flushed to the database as a single transaction at the end
+of a session, after a number of events or after a time limit. Journal
+files left behind by a crashed process are replayed on the next start.
+
+A journal file is synced to disk when its segment is opened and closed,
+but not after every event: a process crash loses nothing, while a power
+loss can lose the events of the open segment (at most max_events, or
+max_age_seconds worth of answers).
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import IO, List, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: no advisory locks; live segments are recognized by pid
+    FCNTL_AVAILABLE = False
+
+from nihon_cli.infra.repository import VocabRepository
+
+# Flush after this many buffered events ...
+DEFAULT_MAX_EVENTS = 50
+# ... or when the oldest buffered event is this many seconds old
+DEFAULT_MAX_AGE_SECONDS = 60.0
+
+ProgressEvent = Tuple[str, int, Optional[str]]
+
+
+def _pid_is_running(pid: int) -> bool:
+    """Check whether a process with the given id is still running.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        True if the process exists, False otherwise
+    """
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # os.kill() terminates the target process on Windows, so liveness
+        # cannot be probed; treat journals of other processes as leftovers.
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        # The process exists but belongs to someone else, or the platform
+        # does not support signal 0; err on the side of not replaying.
+        return True
+    return True
+
+
+class ProgressJournal:
+    """Buffers quiz progress events and writes them back in batches.
+
+    Each segment of events is mirrored to a JSON-lines file named
+    <pid>-<segment id>.jsonl in the journal directory. A flush applies the
+    whole segment with VocabRepository.apply_progress_events, which
+    records the segment id in the same transaction, and then removes the
+    file. Replaying a file whose segment was already applied is a no-op.
+
+    The writer holds an exclusive lock on its open segment file, so a
+    replay (from another journal, even in the same process) never takes
+    over a segment that is still being written.
+    """
+
+    def __init__(
+        self,
+        repository: VocabRepository,
+        journal_dir: Optional[Path] = None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        """Initialize the journal and replay leftovers from earlier runs.
+
+        Args:
+            repository: VocabRepository the events are applied to
+            journal_dir: Directory for journal files (default: next to the
+                database, <db name>.journal)
+            max_events: Number of buffered events that triggers a flush
+            max_age_seconds: Age of the oldest buffered event that
+                triggers a flush
+        """
+        self.repository = repository
+        db_path = Path(repository.db_path)
+        self.journal_dir = journal_dir or db_path.parent / f"{db_path.stem}.journal"
+        self.max_events = max_events
+        self.max_age_seconds = max_age_seconds
+
+        self._events: List[ProgressEvent] = []
+        self._segment_id: Optional[str] = None
+        self._segment_file: Optional[IO[str]] = None
+        self._segment_started = 0.0
+
+        self.replay()
+
+    def record_progress(self, vocab_id: int, direction: str) -> None:
+        """Record a correct answer for the overall progress counters.
+
+        Args:
+            vocab_id: ID of the vocabulary item
+            direction: Either "jp_to_de" or "de_to_jp"
+
+        Raises:
+            ValueError: If direction is invalid
+        """
+        self._record("progress", vocab_id, direction)
+
+    def record_weekly_progress(self, vocab_id: int, direction: str) -> None:
+        """Record a correct answer for the weekly progress counters.
+
+        Args:
+            vocab_id: ID of the vocabulary item
+            direction: Either "jp_to_de" or "de_to_jp"
+
+        Raises:
+            ValueError: If direction is invalid
+        """
+        self._record("weekly", vocab_id, direction)
+
+    def record_completed(self, vocab_id: int) -> None:
+        """Record that a vocabulary item was completed.
+
+        Args:
+            vocab_id: ID of the vocabulary item
+        """
+        self._record("completed", vocab_id, None)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events not yet written to the database."""
+        return len(self._events)
+
+    def _record(self, kind: str, vocab_id: int, direction: Optional[str]) -> None:
+        """Buffer an event, mirror it to the journal file and maybe flush."""
+        if kind != "completed" and direction not in ("jp_to_de", "de_to_jp"):
+            raise ValueError(f"Invalid direction: {direction}")
+
+        if self._segment_id is None:
+            self._open_segment()
+
+        event = (kind, vocab_id, direction)
+        self._events.append(event)
+        self._segment_file.write(json.dumps(event) + "\n")
+        self._segment_file.flush()
+
+        if (
+            len(self._events) >= self.max_events
+            or time.monotonic() - self._segment_started >= self.max_age_seconds
+        ):
+            self.flush()
+
+    def _open_segment(self) -> None:
+        """Start a new segment with its own, locked journal file.
+
+        The file is locked under a temporary name and then renamed, so a
+        replay never sees it unlocked.
+        """
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._segment_id = uuid.uuid4().hex
+        self._segment_started = time.monotonic()
+        path = self._segment_path(os.getpid(), self._segment_id)
+        staging = path.with_suffix(".tmp")
+        self._segment_file = open(staging, "a", encoding="utf-8")
+        if FCNTL_AVAILABLE:
+            fcntl.flock(self._segment_file.fileno(), fcntl.LOCK_EX)
+        os.replace(staging, path)
+        self._sync_dir()
+
+    def _sync_dir(self) -> None:
+        """Make the creation of a journal file durable."""
+        if os.name == "nt":
+            # Directories cannot be opened for fsync on Windows
+            return
+        fd = os.open(self.journal_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _segment_path(self, pid: int, segment_id: str) -> Path:
+        """Path of the journal file for a segment."""
+        return self.journal_dir / f"{pid}-{segment_id}.jsonl"
+
+    def flush(self) -> None:
+        """Write all buffered events to the database in one transaction.
+
+        Raises:
+            sqlite3.Error: If the events cannot be applied; they stay in the
+                journal file and are replayed on the next start
+        """
+        if self._segment_id is None:
+            return
+
+        segment_id, events = self._segment_id, self._events
+        # Durable before the lock is released with close()
+        os.fsync(self._segment_file.fileno())
+        self._segment_file.close()
+        self._segment_id = None
+        self._segment_file = None
+        self._events = []
+
+        self.repository.apply_progress_events(segment_id, events)
+        self._segment_path(os.getpid(), segment_id).unlink(missing_ok=True)
+
+    def replay(self) -> int:
+        """Apply journal files left behind by writers that have gone.
+
+        Segments still open in any journal, of this or another process,
+        are left alone.
+
+        Returns:
+            Number of events applied from leftover journal files
+        """
+        if not self.journal_dir.is_dir():
+            return 0
+
+        applied = 0
+        for path in sorted(self.journal_dir.glob("*.jsonl")):
+            pid_str, _, segment_id = path.stem.partition("-")
+            if not pid_str.isdigit() or not segment_id or segment_id == self._segment_id:
+                continue
+            try:
+                f = open(path, "r", encoding="utf-8")
+            except FileNotFoundError:
+                # Flushed by its writer meanwhile
+                continue
+            with f:
+                if not self._is_abandoned(f, int(pid_str)):
+                    continue
+                events = self._read_segment(f)
+                if self.repository.apply_progress_events(segment_id, events):
+                    applied += len(events)
+                if FCNTL_AVAILABLE:
+                    # Removed while the lock is held
+                    path.unlink(missing_ok=True)
+            if not FCNTL_AVAILABLE:
+                path.unlink(missing_ok=True)
+
+        return applied
+
+    @staticmethod
+    def _is_abandoned(f: IO[str], pid: int) -> bool:
+        """Whether no writer holds a journal file open any more.
+
+        Takes the file's lock if so. Without advisory locks, a segment
+        counts as abandoned once the process that wrote it has exited.
+
+        Args:
+            f: The journal file, opened for reading
+            pid: Id of the process that wrote it
+
+        Returns:
+            True if the segment may be replayed
+        """
+        if not FCNTL_AVAILABLE:
+            return not _pid_is_running(pid)
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _read_segment(f: IO[str]) -> List[ProgressEvent]:
+        """Read the events of a journal file.
+
+        A partially written last line (e.g. after a power loss) is skipped.
+
+        Args:
+            f: The journal file, opened for reading
+
+        Returns:
+            List of events in recorded order
+        """
+        events: List[ProgressEvent] = []
+        for line in f:
+            try:
+                kind, vocab_id, direction = json.loads(line)
+            except (ValueError, TypeError):
+                continue
+            events.append((kind, vocab_id, direction))
+        return events
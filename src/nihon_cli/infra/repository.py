@@ -4,13 +4,53 @@ This module provides the VocabRepository class for managing vocabulary
 items in the SQLite database, including batch inserts and duplicate handling.
 """
 
+import random
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.connection import get_connection_manager
 from nihon_cli.infra.database import init_db
+from nihon_cli.infra.vocabulary_rows import (
+    LANG_JAPANESE,
+    MEANING_COLUMNS,
+    MEANINGS_JOIN,
+    MEANINGS_ORDER,
+    meaning_rows,
+    rows_to_vocabulary_items,
+)
+
+# Values allowed by the CHECK constraint on vocabulary.vocab_type
+_VOCAB_TYPES = ('noun', 'adjective', 'pattern')
+
+# Staged rows (see _bulk_insert) whose Japanese meanings, in order, are
+# those of a stored item. Candidates are found through the index on
+# vocabulary_meanings(text, lang); a match must agree on every position
+# and on the number of meanings.
+_DUPLICATES_QUERY = """
+    SELECT im.seq
+    FROM vocabulary_import_meanings im
+    JOIN vocabulary_meanings m
+        ON m.text = im.text AND m.lang = ? AND m.position = im.position
+    GROUP BY im.seq, m.vocab_id
+    HAVING COUNT(*) = (
+            SELECT COUNT(*) FROM vocabulary_import_meanings x WHERE x.seq = im.seq
+        )
+        AND COUNT(*) = (
+            SELECT COUNT(*) FROM vocabulary_meanings y
+            WHERE y.vocab_id = m.vocab_id AND y.lang = ?
+        )
+"""
+
+# Upper bound for host parameters per statement (SQLite < 3.32 allows 999)
+_MAX_SQL_VARIABLES = 500
+
+# Rejection sampling is used when at least this share of the id range
+# matches, and gives up after this many primary key probes per item
+_MIN_SAMPLING_DENSITY = 0.1
+_MAX_PROBES_PER_ITEM = 20
 
 
 class VocabRepository:
@@ -27,28 +67,36 @@ class VocabRepository:
         otherwise the default location ~/.nihon-cli/vocab.db is used.
         """
         self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for safe database connections.
-        
+        """Context manager for a unit of work on the shared connection.
+
+        All repositories of a process share one long-lived connection per
+        thread (see nihon_cli.infra.connection). Nested calls join the
+        outermost transaction, which commits on success and rolls back
+        on error.
+
         Yields:
             sqlite3.Connection: Database connection with row factory set
-            
+
         Raises:
             sqlite3.Error: If database operations fail
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._connections.transaction() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+    
+    def transaction(self):
+        """Group several repository calls into one unit of work.
+
+        Calls made inside the block share a single transaction and are
+        committed together, or rolled back together on error.
+
+        Returns:
+            Context manager yielding the shared sqlite3.Connection
+        """
+        return self._connections.transaction()
     
     def add_vocabulary_batch(
         self, 
@@ -58,8 +106,9 @@ class VocabRepository:
     ) -> tuple[int, int]:
         """Add a batch of vocabulary items to the database.
         
-        Uses a transaction to efficiently insert multiple vocabulary items.
-        Duplicates (based on japanese_vocab) are skipped to avoid redundancy.
+        Uses a single set-based insert (see _bulk_insert) to efficiently
+        insert multiple vocabulary items. Duplicates (based on
+        japanese_vocab) are skipped to avoid redundancy.
         
         Args:
             items: List of VocabularyItem objects to insert
@@ -71,63 +120,12 @@ class VocabRepository:
             
         Raises:
             sqlite3.Error: If database operations fail
-            ValueError: If items list is empty
+            ValueError: If items list is empty or an item has an unknown vocab_type
         """
         if not items:
             raise ValueError("Items list cannot be empty")
         
-        inserted_count = 0
-        skipped_count = 0
-        
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            for item in items:
-                # Convert lists to comma-separated strings for storage
-                japanese_str = ", ".join(item.japanese_vocab)
-                german_str = ", ".join(item.german_vocab)
-                
-                # Check if this vocabulary already exists
-                cursor.execute(
-                    "SELECT id FROM vocabulary WHERE japanese_vocab = ?",
-                    (japanese_str,)
-                )
-                
-                if cursor.fetchone() is not None:
-                    skipped_count += 1
-                    continue
-                
-                # Insert new vocabulary item
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO vocabulary (
-                            japanese_vocab,
-                            german_vocab,
-                            source_file,
-                            upload_tag,
-                            correct_german,
-                            correct_japanese,
-                            completed
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            japanese_str,
-                            german_str,
-                            source_file,
-                            tag,
-                            item.correct_german,
-                            item.correct_japanese,
-                            item.completed
-                        )
-                    )
-                    inserted_count += 1
-                except sqlite3.IntegrityError:
-                    # Handle any constraint violations
-                    skipped_count += 1
-                    continue
-        
-        return inserted_count, skipped_count
+        return self._bulk_insert(items, source_file, tag)
     
     def get_vocabulary_by_id(self, vocab_id: int) -> Optional[VocabularyItem]:
         """Retrieve a vocabulary item by its ID.
@@ -140,57 +138,144 @@ class VocabRepository:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM vocabulary WHERE id = ?",
-                (vocab_id,)
-            )
-            row = cursor.fetchone()
-            
-            if row is None:
-                return None
-            
-            return self._row_to_vocabulary_item(row)
+            items = self._fetch_items_by_ids(cursor, [vocab_id])
+            return items.get(vocab_id)
     
     def get_incomplete_vocabulary(
         self, 
         limit: int = 15,
         tag: Optional[str] = None
     ) -> List[VocabularyItem]:
-        """Retrieve incomplete vocabulary items for learning.
+        """Retrieve a uniform random sample of incomplete vocabulary items.
+        
+        Avoids ORDER BY RANDOM(), which reads and ranks every candidate
+        row. The number of candidates is counted on the covering index
+        (completed, upload_tag). If candidates are dense within the id
+        range, random ids are drawn and probed by primary key until the
+        sample is full (rejection sampling keeps the draw uniform).
+        Otherwise the candidate ids are read from the index and sampled
+        in memory.
         
         Args:
             limit: Maximum number of items to retrieve
             tag: Optional tag filter
             
         Returns:
-            List of VocabularyItem objects that are not yet completed
+            List of VocabularyItem objects that are not yet completed,
+            in random order
         """
+        if tag:
+            condition = "v.completed = FALSE AND v.upload_tag = ?"
+            params: tuple = (tag,)
+        else:
+            condition = "v.completed = FALSE"
+            params = ()
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            if tag:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM vocabulary v WHERE {condition}",
+                params
+            )
+            candidate_count = cursor.fetchone()[0]
+            if candidate_count == 0 or limit <= 0:
+                return []
+            
+            if candidate_count <= limit:
                 cursor.execute(
-                    """
-                    SELECT * FROM vocabulary 
-                    WHERE completed = FALSE AND upload_tag = ?
-                    ORDER BY RANDOM()
-                    LIMIT ?
+                    f"""
+                    SELECT v.*, {MEANING_COLUMNS} FROM vocabulary v
+                    {MEANINGS_JOIN}
+                    WHERE {condition}
+                    ORDER BY {MEANINGS_ORDER}
                     """,
-                    (tag, limit)
+                    params
                 )
-            else:
-                cursor.execute(
-                    """
-                    SELECT * FROM vocabulary 
-                    WHERE completed = FALSE
-                    ORDER BY RANDOM()
-                    LIMIT ?
-                    """,
-                    (limit,)
+                items = rows_to_vocabulary_items(cursor.fetchall())
+                random.shuffle(items)
+                return items
+            
+            cursor.execute(
+                """
+                SELECT (SELECT MIN(id) FROM vocabulary),
+                       (SELECT MAX(id) FROM vocabulary)
+                """
+            )
+            min_id, max_id = cursor.fetchone()
+            density = candidate_count / (max_id - min_id + 1)
+            
+            sample: Dict[int, VocabularyItem] = {}
+            if density >= _MIN_SAMPLING_DENSITY:
+                probed = set()
+                max_probes = limit * _MAX_PROBES_PER_ITEM
+                while len(sample) < limit and len(probed) < max_probes:
+                    vocab_id = random.randint(min_id, max_id)
+                    if vocab_id in probed:
+                        continue
+                    probed.add(vocab_id)
+                    cursor.execute(
+                        f"""
+                        SELECT v.*, {MEANING_COLUMNS} FROM vocabulary v
+                        {MEANINGS_JOIN}
+                        WHERE v.id = ? AND {condition}
+                        ORDER BY {MEANINGS_ORDER}
+                        """,
+                        (vocab_id,) + params
+                    )
+                    for item in rows_to_vocabulary_items(cursor.fetchall()):
+                        sample[vocab_id] = item
+            
+            if len(sample) < limit:
+                # Sparse candidates: sample from the ids in the index
+                id_cursor = conn.cursor()
+                id_cursor.row_factory = None
+                id_cursor.execute(
+                    f"SELECT id FROM vocabulary v WHERE {condition}",
+                    params
                 )
+                candidate_ids = [vocab_id for (vocab_id,) in id_cursor]
+                sample_ids = random.sample(candidate_ids, limit)
+                sample = self._fetch_items_by_ids(cursor, sample_ids)
+                return [
+                    sample[vocab_id] for vocab_id in sample_ids if vocab_id in sample
+                ]
             
-            rows = cursor.fetchall()
-            return [self._row_to_vocabulary_item(row) for row in rows]
+            return list(sample.values())
+    
+    @staticmethod
+    def _fetch_items_by_ids(
+        cursor: sqlite3.Cursor,
+        vocab_ids: List[int]
+    ) -> Dict[int, VocabularyItem]:
+        """Load vocabulary items with their meanings for a list of ids.
+        
+        Ids are queried in chunks to stay below SQLite's limit on
+        host parameters.
+        
+        Args:
+            cursor: Cursor of the current unit of work
+            vocab_ids: IDs of the vocabulary items to load
+            
+        Returns:
+            Dictionary mapping id to item for every id that exists
+        """
+        items: Dict[int, VocabularyItem] = {}
+        for start in range(0, len(vocab_ids), _MAX_SQL_VARIABLES):
+            chunk = vocab_ids[start:start + _MAX_SQL_VARIABLES]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT v.*, {MEANING_COLUMNS} FROM vocabulary v
+                {MEANINGS_JOIN}
+                WHERE v.id IN ({placeholders})
+                ORDER BY {MEANINGS_ORDER}
+                """,
+                chunk
+            )
+            for item in rows_to_vocabulary_items(cursor.fetchall()):
+                items[item.id] = item
+        return items
     
     def update_progress(
         self, 
@@ -263,13 +348,15 @@ class VocabRepository:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total vocabulary count
-            cursor.execute("SELECT COUNT(*) FROM vocabulary")
-            total = cursor.fetchone()[0]
-
-            # Completed count
-            cursor.execute("SELECT COUNT(*) FROM vocabulary WHERE completed = TRUE")
-            completed = cursor.fetchone()[0]
+            # Total and completed count in one statement. Scalar subqueries
+            # keep SQLite's optimized COUNT(*) and the idx_completed lookup;
+            # a SUM(CASE ...) over all rows is much slower.
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM vocabulary),
+                    (SELECT COUNT(*) FROM vocabulary WHERE completed = TRUE)
+            """)
+            total, completed = cursor.fetchone()
 
             # In progress count
             in_progress = total - completed
@@ -290,7 +377,8 @@ class VocabRepository:
         """Add vocabulary items with weekly session fields.
 
         Similar to add_vocabulary_batch but includes new fields:
-        vocab_type, opposite_id, base_form, weekly counters.
+        vocab_type, opposite_id, base_form, weekly counters. The id of
+        every inserted item is written back to item.id.
 
         Args:
             items: List of VocabularyItem objects to insert
@@ -302,74 +390,190 @@ class VocabRepository:
 
         Raises:
             sqlite3.Error: If database operations fail
-            ValueError: If items list is empty
+            ValueError: If items list is empty or an item has an unknown vocab_type
         """
         if not items:
             raise ValueError("Items list cannot be empty")
 
-        inserted_count = 0
-        skipped_count = 0
+        return self._bulk_insert(items, source_file, tag)
+
+    def _bulk_insert(
+        self,
+        items: List[VocabularyItem],
+        source_file: str,
+        tag: str
+    ) -> tuple[int, int]:
+        """Insert vocabulary items with a constant number of statements.
+
+        Repeated Japanese meaning lists within the batch are dropped up
+        front, the remaining rows and their Japanese meanings are staged in
+        temporary tables with executemany. Staged rows whose meaning list
+        an item already stored has are removed (see _DUPLICATES_QUERY, a
+        lookup by meaning served by idx_vocabulary_meanings_text), and the
+        rest are copied into vocabulary by one INSERT ... SELECT. Ids of
+        inserted rows are written back to the corresponding items.
+
+        Items are validated before anything is written, so a batch is
+        either inserted completely (apart from duplicates) or not at all.
+
+        Args:
+            items: List of VocabularyItem objects to insert
+            source_file: Name of the source file
+            tag: User-defined tag for organizing vocabulary
+
+        Returns:
+            Tuple of (inserted_count, skipped_count)
+
+        Raises:
+            sqlite3.Error: If database operations fail
+            ValueError: If an item has an unknown vocab_type
+        """
+        invalid = [item for item in items if item.vocab_type not in (None, *_VOCAB_TYPES)]
+        if invalid:
+            raise ValueError(
+                "Unknown vocab_type for "
+                + "; ".join(
+                    f"{', '.join(item.japanese_vocab)} ({item.vocab_type!r})"
+                    for item in invalid
+                )
+                + f", expected one of: {', '.join(_VOCAB_TYPES)}"
+            )
+
+        # Keep only the first item per list of Japanese meanings
+        first_by_key: Dict[Tuple[str, ...], VocabularyItem] = {}
+        for item in items:
+            first_by_key.setdefault(tuple(item.japanese_vocab), item)
+        unique_items = list(first_by_key.values())
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            for item in items:
-                # Convert lists to comma-separated strings
-                japanese_str = ", ".join(item.japanese_vocab)
-                german_str = ", ".join(item.german_vocab)
+            cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS vocabulary_import (
+                    seq INTEGER PRIMARY KEY,
+                    japanese_vocab TEXT NOT NULL,
+                    german_vocab TEXT NOT NULL,
+                    vocab_type TEXT,
+                    opposite_id INTEGER,
+                    base_form TEXT,
+                    weekly_correct_german INTEGER,
+                    weekly_correct_japanese INTEGER,
+                    correct_german INTEGER,
+                    correct_japanese INTEGER,
+                    completed BOOLEAN
+                )
+            """)
+            cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS vocabulary_import_meanings (
+                    seq INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    PRIMARY KEY (seq, position)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("DELETE FROM vocabulary_import")
+            cursor.execute("DELETE FROM vocabulary_import_meanings")
+
+            cursor.executemany(
+                """
+                INSERT INTO vocabulary_import VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    (
+                        seq,
+                        # The comma-separated columns are NOT NULL and still filled
+                        ", ".join(item.japanese_vocab),
+                        ", ".join(item.german_vocab),
+                        item.vocab_type,
+                        item.opposite_id,
+                        item.base_form,
+                        item.weekly_correct_german,
+                        item.weekly_correct_japanese,
+                        item.correct_german,
+                        item.correct_japanese,
+                        item.completed
+                    )
+                    for seq, item in enumerate(unique_items)
+                )
+            )
+            cursor.executemany(
+                "INSERT INTO vocabulary_import_meanings VALUES (?, ?, ?)",
+                (
+                    (seq, position, text)
+                    for seq, item in enumerate(unique_items)
+                    for position, text in enumerate(item.japanese_vocab)
+                )
+            )
+
+            cursor.execute(
+                f"DELETE FROM vocabulary_import WHERE seq IN ({_DUPLICATES_QUERY})",
+                (LANG_JAPANESE, LANG_JAPANESE)
+            )
 
-                # Check for duplicates
-                cursor.execute(
-                    "SELECT id FROM vocabulary WHERE japanese_vocab = ?",
-                    (japanese_str,)
+            # New rows always get ids above the current maximum, in seq order
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM vocabulary")
+            max_id_before = cursor.fetchone()[0]
+
+            cursor.execute(
+                """
+                INSERT INTO vocabulary (
+                    japanese_vocab,
+                    german_vocab,
+                    source_file,
+                    upload_tag,
+                    vocab_type,
+                    opposite_id,
+                    base_form,
+                    weekly_correct_german,
+                    weekly_correct_japanese,
+                    correct_german,
+                    correct_japanese,
+                    completed
                 )
+                SELECT
+                    t.japanese_vocab,
+                    t.german_vocab,
+                    ?,
+                    ?,
+                    t.vocab_type,
+                    t.opposite_id,
+                    t.base_form,
+                    t.weekly_correct_german,
+                    t.weekly_correct_japanese,
+                    t.correct_german,
+                    t.correct_japanese,
+                    t.completed
+                FROM vocabulary_import t
+                ORDER BY t.seq
+                """,
+                (source_file, tag)
+            )
 
-                if cursor.fetchone() is not None:
-                    skipped_count += 1
-                    continue
+            # Update item.id with the inserted rows' IDs
+            inserted_seqs = [row[0] for row in cursor.execute(
+                "SELECT seq FROM vocabulary_import ORDER BY seq"
+            )]
+            new_ids = [row[0] for row in cursor.execute(
+                "SELECT id FROM vocabulary WHERE id > ? ORDER BY id", (max_id_before,)
+            )]
+            inserted_items = []
+            for seq, vocab_id in zip(inserted_seqs, new_ids):
+                item = unique_items[seq]
+                item.id = vocab_id
+                inserted_items.append(item)
+
+            cursor.executemany(
+                """
+                INSERT INTO vocabulary_meanings (vocab_id, lang, position, text)
+                VALUES (?, ?, ?, ?)
+                """,
+                (row for item in inserted_items for row in meaning_rows(item))
+            )
 
-                # Insert with new fields
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO vocabulary (
-                            japanese_vocab,
-                            german_vocab,
-                            source_file,
-                            upload_tag,
-                            vocab_type,
-                            opposite_id,
-                            base_form,
-                            weekly_correct_german,
-                            weekly_correct_japanese,
-                            correct_german,
-                            correct_japanese,
-                            completed
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            japanese_str,
-                            german_str,
-                            source_file,
-                            tag,
-                            item.vocab_type,
-                            item.opposite_id,
-                            item.base_form,
-                            item.weekly_correct_german,
-                            item.weekly_correct_japanese,
-                            item.correct_german,
-                            item.correct_japanese,
-                            item.completed
-                        )
-                    )
-                    # Update item.id with the inserted row's ID
-                    item.id = cursor.lastrowid
-                    inserted_count += 1
-                except sqlite3.IntegrityError:
-                    skipped_count += 1
-                    continue
+            cursor.execute("DELETE FROM vocabulary_import")
+            cursor.execute("DELETE FROM vocabulary_import_meanings")
 
-        return inserted_count, skipped_count
+        return len(inserted_items), len(items) - len(inserted_items)
 
     def get_adjective_opposite(self, vocab_id: int) -> Optional[VocabularyItem]:
         """Get the opposite adjective for a given vocabulary item.
@@ -470,39 +674,94 @@ class VocabRepository:
                     (vocab_id,)
                 )
 
-    @staticmethod
-    def _row_to_vocabulary_item(row: sqlite3.Row) -> VocabularyItem:
-        """Convert a database row to a VocabularyItem object.
+    def apply_progress_events(
+        self,
+        segment_id: str,
+        events: List[Tuple[str, int, Optional[str]]]
+    ) -> bool:
+        """Apply a segment of buffered progress events in one transaction.
+
+        Events are (kind, vocab_id, direction) tuples where kind is one of
+        "progress" (see update_progress), "weekly" (see
+        update_weekly_progress) or "completed" (see mark_completed; the
+        direction is None). Counter increments are summed per item before
+        writing. The segment id is recorded in the same transaction, so a
+        segment that was already applied is never applied twice.
 
         Args:
-            row: SQLite row object
+            segment_id: Unique id of the journal segment
+            events: Events in the order they were recorded
 
         Returns:
-            VocabularyItem object
+            True if the events were applied, False if the segment had
+            already been applied before
+
+        Raises:
+            ValueError: If an event has an invalid kind or direction
         """
-        # Parse comma-separated strings back to lists
-        japanese_vocab = [v.strip() for v in row['japanese_vocab'].split(',')]
-        german_vocab = [v.strip() for v in row['german_vocab'].split(',')]
+        increments: Dict[Tuple[str, int], List[int]] = {}
+        completed_ids = []
+        for kind, vocab_id, direction in events:
+            if kind == "completed":
+                completed_ids.append(vocab_id)
+                continue
+            if kind not in ("progress", "weekly"):
+                raise ValueError(f"Invalid progress event: {kind}")
+            if direction not in ("jp_to_de", "de_to_jp"):
+                raise ValueError(f"Invalid direction: {direction}")
+            counts = increments.setdefault((kind, vocab_id), [0, 0])
+            counts[0 if direction == "jp_to_de" else 1] += 1
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
 
-        # Helper function to safely get column value
-        def safe_get(key, default=None):
             try:
-                return row[key] if row[key] is not None else default
-            except (IndexError, KeyError):
-                return default
-
-        return VocabularyItem(
-            id=row['id'],
-            japanese_vocab=japanese_vocab,
-            german_vocab=german_vocab,
-            source_file=row['source_file'],
-            upload_tag=row['upload_tag'],
-            correct_german=row['correct_german'],
-            correct_japanese=row['correct_japanese'],
-            completed=bool(row['completed']),
-            vocab_type=safe_get('vocab_type'),
-            opposite_id=safe_get('opposite_id'),
-            base_form=safe_get('base_form'),
-            weekly_correct_german=safe_get('weekly_correct_german', 0),
-            weekly_correct_japanese=safe_get('weekly_correct_japanese', 0)
-        )
\ No newline at end of file
+                cursor.execute(
+                    """
+                    INSERT INTO progress_journal_segments (segment_id, event_count)
+                    VALUES (?, ?)
+                    """,
+                    (segment_id, len(events))
+                )
+            except sqlite3.IntegrityError:
+                return False
+
+            cursor.executemany(
+                """
+                UPDATE vocabulary
+                SET correct_german = correct_german + ?,
+                    correct_japanese = correct_japanese + ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                [
+                    (german, japanese, vocab_id)
+                    for (kind, vocab_id), (german, japanese) in increments.items()
+                    if kind == "progress"
+                ]
+            )
+            cursor.executemany(
+                """
+                UPDATE vocabulary
+                SET weekly_correct_german = weekly_correct_german + ?,
+                    weekly_correct_japanese = weekly_correct_japanese + ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                [
+                    (german, japanese, vocab_id)
+                    for (kind, vocab_id), (german, japanese) in increments.items()
+                    if kind == "weekly"
+                ]
+            )
+            cursor.executemany(
+                """
+                UPDATE vocabulary
+                SET completed = TRUE,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                [(vocab_id,) for vocab_id in completed_ids]
+            )
+
+        return True
@@ -0,0 +1,191 @@
+"""Persistent cache for semantic answer check verdicts.
+
+Verdicts of the Ollama semantic check are stored in the semantic_verdicts
+table of the vocab database, so that answers which recur week after week
+("Opa" for "Großvater") are resolved without a model round trip. A small
+in-memory LRU layer in front of the table serves repeated lookups within
+a process.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.database import init_db
+
+# Rows kept in the table; least recently used rows are evicted first
+DEFAULT_MAX_ENTRIES = 20000
+# Verdicts older than this are asked again
+DEFAULT_TTL_SECONDS = 180 * 24 * 3600.0
+# Entries kept in memory per process
+_MEMORY_CACHE_SIZE = 1024
+# Expired and surplus rows are evicted after this many stores
+_EVICT_EVERY = 100
+
+# (model, direction, normalized expected answers, normalized answer)
+VerdictKey = Tuple[str, str, str, str]
+
+_KEY_CONDITION = "model = ? AND direction = ? AND expected = ? AND answer = ?"
+
+
+class VerdictCache:
+    """Two-level (memory and SQLite) cache of semantic check verdicts.
+
+    Every verdict is stored with a hash of the prompt template that
+    produced it; a lookup with a different hash is a miss and removes the
+    stale row, so changing a prompt invalidates its old verdicts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        """Initialize the cache on the vocab database.
+
+        Args:
+            max_entries: Maximum number of rows kept in the table
+            ttl_seconds: Age after which a verdict is no longer used
+        """
+        self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # key -> (prompt_hash, accepted, created_at)
+        self._memory: "OrderedDict[VerdictKey, Tuple[str, bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stores = 0
+
+    @staticmethod
+    def make_key(
+        model: str, direction: str, expected: Iterable[str], answer: str
+    ) -> VerdictKey:
+        """Build the cache key of a semantic check.
+
+        Args:
+            model: Ollama model name
+            direction: Query direction ("jp_to_de" or "de_to_jp")
+            expected: Normalized expected answers, in any order
+            answer: Normalized user answer
+
+        Returns:
+            Key for get() and put()
+        """
+        return (model, direction, "\n".join(sorted(set(expected))), answer)
+
+    def get(self, key: VerdictKey, prompt_hash: str) -> Optional[bool]:
+        """Look up a verdict.
+
+        Args:
+            key: Key from make_key()
+            prompt_hash: Hash of the prompt template in use
+
+        Returns:
+            The cached verdict, or None on a miss
+
+        Raises:
+            sqlite3.Error: If the lookup fails
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] == prompt_hash and now - entry[2] < self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+        with self._connections.transaction() as conn:
+            row = conn.execute(
+                f"""
+                SELECT prompt_hash, accepted, created_at FROM semantic_verdicts
+                WHERE {_KEY_CONDITION}
+                """,
+                key
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row[0] != prompt_hash or now - row[2] >= self.ttl_seconds:
+                conn.execute(f"DELETE FROM semantic_verdicts WHERE {_KEY_CONDITION}", key)
+                return None
+
+            conn.execute(
+                f"UPDATE semantic_verdicts SET last_used_at = ? WHERE {_KEY_CONDITION}",
+                (now, *key)
+            )
+
+        accepted = bool(row[1])
+        self._remember(key, (row[0], accepted, row[2]))
+        return accepted
+
+    def put(self, key: VerdictKey, prompt_hash: str, accepted: bool) -> None:
+        """Store a verdict, replacing an older one for the same key.
+
+        Args:
+            key: Key from make_key()
+            prompt_hash: Hash of the prompt template that produced it
+            accepted: The model's verdict
+
+        Raises:
+            sqlite3.Error: If the verdict cannot be stored
+        """
+        now = time.time()
+        with self._connections.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO semantic_verdicts (
+                    model, direction, expected, answer,
+                    prompt_hash, accepted, created_at, last_used_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (*key, prompt_hash, accepted, now, now)
+            )
+        self._remember(key, (prompt_hash, accepted, now))
+
+        self._stores += 1
+        if self._stores % _EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove expired rows and the least recently used surplus rows.
+
+        Returns:
+            Number of rows removed
+
+        Raises:
+            sqlite3.Error: If the rows cannot be removed
+        """
+        with self._connections.transaction() as conn:
+            removed = conn.execute(
+                "DELETE FROM semantic_verdicts WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+            total = conn.execute("SELECT COUNT(*) FROM semantic_verdicts").fetchone()[0]
+            if total > self.max_entries:
+                removed += conn.execute(
+                    """
+                    DELETE FROM semantic_verdicts
+                    WHERE (model, direction, expected, answer) IN (
+                        SELECT model, direction, expected, answer
+                        FROM semantic_verdicts
+                        ORDER BY last_used_at
+                        LIMIT ?
+                    )
+                    """,
+                    (total - self.max_entries,)
+                ).rowcount
+
+        return removed
+
+    def _remember(self, key: VerdictKey, entry: Tuple[str, bool, float]) -> None:
+        """Put an entry into the memory layer, dropping the oldest if full."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > _MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
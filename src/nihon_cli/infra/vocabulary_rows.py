@@ -0,0 +1,112 @@
+"""Mapping between vocabulary rows and VocabularyItem objects.
+
+Japanese and German meanings are stored one per row in the
+vocabulary_meanings table. Queries join it onto vocabulary, which yields
+one row per meaning; this module folds those rows back into items.
+"""
+
+import sqlite3
+from itertools import groupby
+from typing import Dict, Iterable, List
+
+from nihon_cli.core.vocabulary import VocabularyItem
+
+# Language codes used in vocabulary_meanings.lang
+LANG_JAPANESE = "ja"
+LANG_GERMAN = "de"
+
+# Columns and join to append to a query over "vocabulary v"
+MEANING_COLUMNS = "m.lang AS meaning_lang, m.text AS meaning_text"
+MEANINGS_JOIN = "LEFT JOIN vocabulary_meanings m ON m.vocab_id = v.id"
+
+# Ordering that keeps the meanings of one item together and in order
+MEANINGS_ORDER = "v.id, m.lang, m.position"
+
+
+def meaning_rows(item: VocabularyItem) -> List[tuple]:
+    """Build vocabulary_meanings rows for a stored item.
+
+    Args:
+        item: Vocabulary item with its database id set
+
+    Returns:
+        List of (vocab_id, lang, position, text) tuples
+    """
+    rows = [
+        (item.id, LANG_JAPANESE, position, text)
+        for position, text in enumerate(item.japanese_vocab)
+    ]
+    rows.extend(
+        (item.id, LANG_GERMAN, position, text)
+        for position, text in enumerate(item.german_vocab)
+    )
+    return rows
+
+
+def rows_to_vocabulary_items(rows: Iterable[sqlite3.Row]) -> List[VocabularyItem]:
+    """Fold joined vocabulary/meaning rows into VocabularyItem objects.
+
+    Rows of the same item must be adjacent and ordered by position, which
+    MEANINGS_ORDER guarantees. Item order is preserved.
+
+    Args:
+        rows: Rows selecting v.* and MEANING_COLUMNS
+
+    Returns:
+        List of VocabularyItem objects
+    """
+    items = []
+    for _, item_rows in groupby(rows, key=lambda row: row['id']):
+        item_rows = list(item_rows)
+        meanings: Dict[str, List[str]] = {LANG_JAPANESE: [], LANG_GERMAN: []}
+        for row in item_rows:
+            if row['meaning_lang'] is not None:
+                meanings[row['meaning_lang']].append(row['meaning_text'])
+        items.append(row_to_vocabulary_item(
+            item_rows[0], meanings[LANG_JAPANESE], meanings[LANG_GERMAN]
+        ))
+    return items
+
+
+def row_to_vocabulary_item(
+    row: sqlite3.Row,
+    japanese_vocab: List[str],
+    german_vocab: List[str],
+) -> VocabularyItem:
+    """Convert a database row to a VocabularyItem object.
+
+    The comma-separated meaning columns of the row are not read; every
+    item's meanings are in vocabulary_meanings (migration 004 backfilled
+    older entries).
+
+    Args:
+        row: SQLite row object
+        japanese_vocab: Japanese meanings from vocabulary_meanings
+        german_vocab: German meanings from vocabulary_meanings
+
+    Returns:
+        VocabularyItem object
+    """
+
+    # Helper function to safely get column value
+    def safe_get(key, default=None):
+        try:
+            return row[key] if row[key] is not None else default
+        except (IndexError, KeyError):
+            return default
+
+    return VocabularyItem(
+        id=row['id'],
+        japanese_vocab=japanese_vocab,
+        german_vocab=german_vocab,
+        source_file=row['source_file'],
+        upload_tag=row['upload_tag'],
+        correct_german=row['correct_german'],
+        correct_japanese=row['correct_japanese'],
+        completed=bool(row['completed']),
+        vocab_type=safe_get('vocab_type'),
+        opposite_id=safe_get('opposite_id'),
+        base_form=safe_get('base_form'),
+        weekly_correct_german=safe_get('weekly_correct_german', 0),
+        weekly_correct_japanese=safe_get('weekly_correct_japanese', 0)
+    )
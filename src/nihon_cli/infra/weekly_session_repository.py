@@ -12,7 +12,27 @@ from typing import Dict, List, Optional
 
 from nihon_cli.core.vocabulary import VocabularyItem
 from nihon_cli.core.weekly_session import WeeklySession, WeeklySessionItem
+from nihon_cli.infra.connection import get_connection_manager
 from nihon_cli.infra.database import init_db
+from nihon_cli.infra.vocabulary_rows import (
+    MEANING_COLUMNS,
+    MEANINGS_JOIN,
+    rows_to_vocabulary_items,
+)
+
+# Same as vocabulary_rows.MEANINGS_ORDER, but on the column of the session items index
+_SESSION_MEANINGS_ORDER = "wsi.vocab_id, m.lang, m.position"
+
+# Items of a session with their meanings. Walking the (session_id,
+# vocab_id) index yields the rows in id order, so SQLite needs no
+# temporary B-tree for sorting
+SESSION_ITEMS_QUERY = f"""
+    SELECT v.*, {MEANING_COLUMNS} FROM vocabulary v
+    INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
+    {MEANINGS_JOIN}
+    WHERE wsi.session_id = ?
+    ORDER BY {_SESSION_MEANINGS_ORDER}
+"""
 
 
 class WeeklySessionRepository:
@@ -25,10 +45,16 @@ class WeeklySessionRepository:
     def __init__(self):
         """Initialize the repository with a database connection."""
         self.db_path = init_db()
+        self._connections = get_connection_manager(self.db_path)
 
     @contextmanager
     def _get_connection(self):
-        """Context manager for safe database connections.
+        """Context manager for a unit of work on the shared connection.
+
+        All repositories of a process share one long-lived connection per
+        thread (see nihon_cli.infra.connection). Nested calls join the
+        outermost transaction, which commits on success and rolls back
+        on error.
 
         Yields:
             sqlite3.Connection: Database connection with row factory set
@@ -36,17 +62,19 @@ class WeeklySessionRepository:
         Raises:
             sqlite3.Error: If database operations fail
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._connections.transaction() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+
+    def transaction(self):
+        """Group several repository calls into one unit of work.
+
+        Calls made inside the block share a single transaction and are
+        committed together, or rolled back together on error.
+
+        Returns:
+            Context manager yielding the shared sqlite3.Connection
+        """
+        return self._connections.transaction()
 
     def get_current_week_session(self) -> Optional[WeeklySession]:
         """Get the active session for the current week.
@@ -162,29 +190,18 @@ class WeeklySessionRepository:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            if prioritize_by_progress:
-                # Order by weekly progress (lower scores first)
-                cursor.execute(
-                    """
-                    SELECT v.* FROM vocabulary v
-                    INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
-                    WHERE wsi.session_id = ?
-                    ORDER BY (v.weekly_correct_german + v.weekly_correct_japanese) ASC
-                    """,
-                    (session_id,)
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT v.* FROM vocabulary v
-                    INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
-                    WHERE wsi.session_id = ?
-                    """,
-                    (session_id,)
-                )
+            cursor.execute(SESSION_ITEMS_QUERY, (session_id,))
+            items = rows_to_vocabulary_items(cursor.fetchall())
 
-            rows = cursor.fetchall()
-            return [self._row_to_vocabulary_item(row) for row in rows]
+        if prioritize_by_progress:
+            # Order by weekly progress (lower scores first). The score is
+            # computed from vocabulary columns, which no index on the
+            # session can serve; the stable sort keeps ties in id order.
+            items.sort(
+                key=lambda item: item.weekly_correct_german + item.weekly_correct_japanese
+            )
+
+        return items
 
     def check_week_expired(self, session_id: int) -> bool:
         """Check if a session's week has expired.
@@ -239,49 +256,27 @@ class WeeklySessionRepository:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total items in session
-            cursor.execute(
-                """
-                SELECT COUNT(*) FROM weekly_session_items
-                WHERE session_id = ?
-                """,
-                (session_id,)
-            )
-            total_items = cursor.fetchone()[0]
-
-            # Items with 2+ correct in JP→DE
+            # All figures in one pass over the session's items. The LEFT
+            # JOIN keeps items counted even if their vocabulary row is gone;
+            # AVG ignores those, as the former inner joins did.
             cursor.execute(
                 """
-                SELECT COUNT(*) FROM vocabulary v
-                INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
-                WHERE wsi.session_id = ? AND v.weekly_correct_german >= 2
-                """,
-                (session_id,)
-            )
-            items_2plus_german = cursor.fetchone()[0]
-
-            # Items with 2+ correct in DE→JP
-            cursor.execute(
-                """
-                SELECT COUNT(*) FROM vocabulary v
-                INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
-                WHERE wsi.session_id = ? AND v.weekly_correct_japanese >= 2
-                """,
-                (session_id,)
-            )
-            items_2plus_japanese = cursor.fetchone()[0]
-
-            # Average weekly progress
-            cursor.execute(
-                """
-                SELECT AVG(v.weekly_correct_german + v.weekly_correct_japanese)
-                FROM vocabulary v
-                INNER JOIN weekly_session_items wsi ON v.id = wsi.vocab_id
+                SELECT
+                    COUNT(*),
+                    SUM(CASE WHEN v.weekly_correct_german >= 2 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN v.weekly_correct_japanese >= 2 THEN 1 ELSE 0 END),
+                    AVG(v.weekly_correct_german + v.weekly_correct_japanese)
+                FROM weekly_session_items wsi
+                LEFT JOIN vocabulary v ON v.id = wsi.vocab_id
                 WHERE wsi.session_id = ?
                 """,
                 (session_id,)
             )
-            avg_progress = cursor.fetchone()[0] or 0
+            row = cursor.fetchone()
+            total_items = row[0]
+            items_2plus_german = row[1] or 0
+            items_2plus_japanese = row[2] or 0
+            avg_progress = row[3] or 0
 
             return {
                 'total_items': total_items,
@@ -359,40 +354,3 @@ class WeeklySessionRepository:
             week_end=date.fromisoformat(row['week_end']),
             status=row['status']
         )
-
-    @staticmethod
-    def _row_to_vocabulary_item(row: sqlite3.Row) -> VocabularyItem:
-        """Convert a database row to a VocabularyItem object.
-
-        Args:
-            row: SQLite row object
-
-        Returns:
-            VocabularyItem object
-        """
-        # Parse comma-separated strings back to lists
-        japanese_vocab = [v.strip() for v in row['japanese_vocab'].split(',')]
-        german_vocab = [v.strip() for v in row['german_vocab'].split(',')]
-
-        # Helper function to safely get column value
-        def safe_get(key, default=None):
-            try:
-                return row[key] if row[key] is not None else default
-            except (IndexError, KeyError):
-                return default
-
-        return VocabularyItem(
-            id=row['id'],
-            japanese_vocab=japanese_vocab,
-            german_vocab=german_vocab,
-            source_file=row['source_file'],
-            upload_tag=row['upload_tag'],
-            correct_german=row['correct_german'],
-            correct_japanese=row['correct_japanese'],
-            completed=bool(row['completed']),
-            vocab_type=safe_get('vocab_type'),
-            opposite_id=safe_get('opposite_id'),
-            base_form=safe_get('base_form'),
-            weekly_correct_german=safe_get('weekly_correct_german', 0),
-            weekly_correct_japanese=safe_get('weekly_correct_japanese', 0)
-        )
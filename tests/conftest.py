@@ -0,0 +1,13 @@
+"""Shared fixtures for the nihon-cli test suite."""
+
+import pytest
+
+from nihon_cli.infra.connection import close_all_connections
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Run every test against its own ~/.nihon-cli (config and database)."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    yield tmp_path
+    close_all_connections()
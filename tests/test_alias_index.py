@@ -0,0 +1,91 @@
+"""Tests for the provenance of learned answer aliases."""
+
+import pytest
+
+from nihon_cli.infra.alias_index import AliasIndex
+from nihon_cli.infra.verdict_cache import VerdictCache
+
+CHAT = ("chat", "gemma3:4b", "prompt-a")
+
+
+@pytest.fixture
+def index():
+    return AliasIndex(seed_groups=[("großvater", "opa")])
+
+
+def test_seed_synonyms_match_any_checker(index):
+    assert index.lookup("opa", ["großvater"], CHAT) == "großvater"
+    assert index.lookup("opa", ["großvater"], ("embedding", "bge-m3", "embedding:0.8")) == "großvater"
+
+
+def test_learned_alias_only_matches_its_checker(index):
+    index.add("omi", ["großmutter"], CHAT)
+
+    assert index.lookup("omi", ["großmutter"], CHAT) == "großmutter"
+    assert index.lookup("omi", ["großmutter"], ("chat", "gemma3:4b", "prompt-b")) is None
+    assert index.lookup("omi", ["großmutter"], ("chat", "llama3", "prompt-a")) is None
+    assert index.lookup("omi", ["großmutter"], ("embedding", "gemma3:4b", "prompt-a")) is None
+
+
+def test_learned_alias_survives_reload(index):
+    index.add("omi", ["großmutter", "oma"], CHAT)
+
+    reloaded = AliasIndex(seed_groups=[])
+    assert reloaded.lookup("omi", ["oma", "großmutter"], CHAT) == "großmutter\noma"
+
+
+def test_expired_alias_is_ignored(index):
+    index.add("omi", ["großmutter"], CHAT)
+
+    assert AliasIndex(seed_groups=[], ttl_seconds=-1).lookup("omi", ["großmutter"], CHAT) is None
+
+
+def test_delete_forgets_alias_and_accepting_verdict(index):
+    cache = VerdictCache()
+    key = cache.make_key("gemma3:4b", "jp_to_de", ["großmutter", "oma"], "omi")
+    cache.put(key, "prompt-a", True)
+    index.add("omi", ["großmutter", "oma"], CHAT)
+    index.add("omi", ["tante"], CHAT)
+
+    assert [a.expected for a in index.list_learned("omi")] == ["tante", "großmutter\noma"]
+    assert index.delete("omi", "oma") == 1
+
+    assert index.lookup("omi", ["großmutter", "oma"], CHAT) is None
+    assert index.lookup("omi", ["tante"], CHAT) == "tante"
+    assert VerdictCache().get(key, "prompt-a") is None
+
+
+def test_checker_ignores_aliases_of_another_model(index):
+    from nihon_cli.core.answer_checker import AnswerChecker
+
+    learner = AnswerChecker(
+        model="gemma3:4b", semantic_backend="chat", alias_index=index, strip_qualifiers=False
+    )
+    learner._store_verdict("omi", ["Großmutter"], "jp_to_de", True)
+    assert learner.check_local("omi", ["Großmutter"], "jp_to_de").accepted
+
+    other = AnswerChecker(
+        model="llama3", semantic_backend="chat", alias_index=index, strip_qualifiers=False
+    )
+    assert other.check_local("omi", ["Großmutter"], "jp_to_de") is None
+
+
+@pytest.mark.parametrize("answer", ["obaasan", "オバアサン", "おばーさん", "oba-san"])
+def test_japanese_seed_alias_matches_in_any_script(answer):
+    from nihon_cli.core.answer_checker import AnswerChecker
+
+    checker = AnswerChecker(semantic_backend="chat", strip_qualifiers=False)
+
+    assert checker.check_local(answer, ["そぼ"], "de_to_jp").accepted
+    assert checker.check_local("sobo", ["おばあさん"], "de_to_jp").accepted
+    assert checker.check_local("okaasan", ["はは"], "de_to_jp").accepted
+    # おばさん (aunt) is a different word
+    assert checker.check_local("obasan", ["そぼ"], "de_to_jp") is None
+
+
+def test_learned_japanese_alias_matches_in_any_script(index):
+    index.add("jiji", ["そふ", "おじいさん"], CHAT)
+
+    reloaded = AliasIndex(seed_groups=[])
+    assert reloaded.lookup("ジジ", ["おじいさん", "そふ"], CHAT) == "おじいさん\nそふ"
+    assert reloaded.lookup("じじ", ["おじいさん", "そふ"], CHAT) == "おじいさん\nそふ"
@@ -0,0 +1,20 @@
+"""Tests for the storage profile configuration."""
+
+from nihon_cli.infra.config import DB_PROFILES, load_db_profile, save_config
+from nihon_cli.infra.connection import get_connection_manager
+from nihon_cli.infra.database import init_db
+
+
+def test_safe_profile_is_default():
+    assert load_db_profile() == DB_PROFILES["safe"]
+
+    with get_connection_manager(init_db()).transaction() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+
+def test_fast_profile_is_opt_in():
+    save_config("db_profile", "fast")
+
+    assert load_db_profile() == DB_PROFILES["fast"]
+    with get_connection_manager(init_db()).transaction() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
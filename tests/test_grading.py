@@ -0,0 +1,136 @@
+"""Tests for cancelling background grading when a session is interrupted."""
+
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from nihon_cli.core.answer_checker import AnswerCheckResult
+from nihon_cli.core.grading import AsyncGrader, BatchGrader
+from nihon_cli.core.quiz_vocab import VocabQuiz
+from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.repository import VocabRepository
+
+
+class FakeChecker:
+    """Semantic checks accept "schnell" at once and block on "langsam"."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.checked = []
+
+    def prewarm(self):
+        pass
+
+    def check_local(self, user_input, correct_answers, direction):
+        return None
+
+    def check_semantic(self, user_input, correct_answers, direction):
+        self.checked.append(user_input)
+        if user_input == "langsam":
+            self.release.wait()
+        return AnswerCheckResult(accepted=True, method="semantic")
+
+
+def _grader_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("grader_")]
+
+
+@pytest.fixture
+def checker():
+    checker = FakeChecker()
+    yield checker
+    checker.release.set()
+    for thread in _grader_threads():
+        thread.join(1.0)
+
+
+def test_cancel_delivers_finished_and_drops_outstanding_checks(checker):
+    grader = AsyncGrader(checker)
+    delivered = []
+
+    grader.grade("schnell", ["a"], "jp_to_de", lambda r: delivered.append("schnell"))
+    grader.grade("langsam", ["a"], "jp_to_de", lambda r: delivered.append("langsam"))
+    grader.grade("später", ["a"], "jp_to_de", lambda r: delivered.append("später"))
+
+    start = time.monotonic()
+    dropped = grader.cancel(timeout=0.2)
+
+    assert time.monotonic() - start < 1.0
+    assert dropped == 2
+    assert delivered == ["schnell"]
+
+    # The check queued behind the blocked one never runs
+    checker.release.set()
+    time.sleep(0.1)
+    assert checker.checked == ["schnell", "langsam"]
+    grader.finish()
+    assert delivered == ["schnell"]
+
+
+def test_workers_are_stopped_and_restarted_per_session(checker):
+    grader = AsyncGrader(checker, max_workers=2)
+    delivered = []
+
+    for session in range(2):
+        grader.grade("schnell", ["a"], "jp_to_de", delivered.append)
+        assert len(_grader_threads()) == 2
+        grader.finish()
+        assert _grader_threads() == []
+
+    assert len(delivered) == 2
+
+
+def test_cancel_stops_idle_workers_and_leaves_busy_one_bounded(checker):
+    grader = AsyncGrader(checker)
+    grader.grade("langsam", ["a"], "jp_to_de", lambda r: None)
+
+    start = time.monotonic()
+    grader.cancel(timeout=0.1)
+    assert time.monotonic() - start < 1.0
+
+    # The busy worker exits as soon as its check returns
+    [busy] = _grader_threads()
+    checker.release.set()
+    busy.join(1.0)
+    assert not busy.is_alive()
+
+
+def test_batch_grader_drops_pending_answers_on_cancel(checker):
+    grader = BatchGrader(checker)
+    grader.grade("schnell", ["a"], "jp_to_de", lambda r: pytest.fail("delivered"))
+
+    assert grader.cancel() == 1
+    grader.finish()
+
+
+def test_interrupted_session_flushes_progress_without_waiting(checker, monkeypatch):
+    repo = VocabRepository()
+    items = [
+        VocabularyItem(id=0, japanese_vocab=[f"ことば{i}"], german_vocab=[f"Wort {i}"],
+                       source_file="test.md", upload_tag="test")
+        for i in range(3)
+    ]
+    repo.add_vocabulary_batch(items, "test.md", "test")
+
+    quiz = VocabQuiz(repo, grading="async")
+    quiz.grader = AsyncGrader(checker)
+    monkeypatch.setattr(quiz.grader, "cancel", partial(quiz.grader.cancel, 0.1))
+    answers = iter(["schnell", "langsam"])
+
+    def fake_input(prompt=""):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("builtins.input", fake_input)
+
+    start = time.monotonic()
+    asked = quiz.run_session(limit=3)
+
+    assert time.monotonic() - start < 1.0
+    assert asked == 2
+    stored = [repo.get_vocabulary_by_id(item.id) for item in items]
+    assert sum(item.correct_german + item.correct_japanese for item in stored) == 1
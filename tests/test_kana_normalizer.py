@@ -0,0 +1,71 @@
+"""Tests for the normalization of Japanese answers."""
+
+import pytest
+
+from nihon_cli.core.kana_normalizer import normalize_japanese, prepare_kana_answers
+
+
+@pytest.mark.parametrize(
+    "answer, expected",
+    [
+        # Doubled vowels against the long vowel mark
+        ("koohii", "コーヒー"),
+        ("keeki", "ケーキ"),
+        ("seetaa", "セーター"),
+        ("おねーさん", "おねえさん"),
+        # ou / ei spellings of long o and e
+        ("toukyou", "とうきょう"),
+        ("sensei", "せんせい"),
+        ("コウヒイ", "コーヒー"),
+        # "-" as long vowel mark in romaji
+        ("ko-hi-", "コーヒー"),
+        ("o-kii", "おおきい"),
+        # Macrons, width and case
+        ("kōhī", "コーヒー"),
+        ("ｺｰﾋｰ", "コーヒー"),
+        ("NEKO", "ねこ"),
+        # "n'" as syllabic n
+        ("kan'i", "かんい"),
+    ],
+)
+def test_equivalent_spellings_normalize_equally(answer, expected):
+    assert normalize_japanese(answer) == normalize_japanese(expected)
+
+
+@pytest.mark.parametrize(
+    "answer, expected",
+    [
+        ("obasan", "おばあさん"),
+        ("ojisan", "おじいさん"),
+        ("kite", "きって"),
+    ],
+)
+def test_different_words_stay_different(answer, expected):
+    assert normalize_japanese(answer) != normalize_japanese(expected)
+
+
+@pytest.mark.parametrize(
+    "answer, expected",
+    [
+        ("わたしのおかあさん", "おかあ"),
+        ("okaasan", "おかあ"),
+        ("oka-san", "おかあ"),
+        ("あなたのいもうとさん", "いもうと"),
+        ("ぼくのはは", "はは"),
+    ],
+)
+def test_strip_qualifiers(answer, expected):
+    assert normalize_japanese(answer, strip_qualifiers=True) == normalize_japanese(expected)
+
+
+@pytest.mark.parametrize(
+    "answer",
+    ["きのう", "ものがたり", "たくさん", "みなさん", "さん", "わたしの", "にほんの"],
+)
+def test_strip_qualifiers_keeps_other_words(answer):
+    assert normalize_japanese(answer, strip_qualifiers=True) == normalize_japanese(answer)
+
+
+def test_prepare_kana_answers_keeps_first_original():
+    prepared = prepare_kana_answers(("コーヒー", "こうひい"))
+    assert prepared == {normalize_japanese("コーヒー"): "コーヒー"}
@@ -0,0 +1,172 @@
+"""Tests for the concurrent OCR extraction against a local fake OpenAI server."""
+
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from nihon_cli.core import ocr_parser
+from nihon_cli.core.ocr_parser import OpenAIVisionParser, collect_image_paths
+
+
+class FakeOpenAI:
+    """Chat completions endpoint answering per image with scripted statuses.
+
+    Each image file contains its name. failures maps a name to the HTTP
+    statuses returned before the request succeeds.
+    """
+
+    def __init__(self, failures=None, latency=0.0):
+        self.failures = {name: list(statuses) for name, statuses in (failures or {}).items()}
+        self.latency = latency
+        self.requests = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def respond(self, name):
+        with self.lock:
+            self.requests[name] = self.requests.get(name, 0) + 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+            pending = self.failures.get(name)
+            status = pending.pop(0) if pending else 200
+
+        if status != 200:
+            return status, {"error": {"message": f"status {status}"}}
+        content = json.dumps([{"japanese": [f"ことば {name}"], "german": [f"Wort {name}"]}])
+        return 200, {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+        }
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Start a fake server and point the OpenAI client at it."""
+    pytest.importorskip("openai")
+    servers = []
+
+    def start(**kwargs):
+        fake = FakeOpenAI(**kwargs)
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                image_url = request["messages"][1]["content"][1]["image_url"]["url"]
+                name = base64.b64decode(image_url.split(",", 1)[1]).decode()
+                status, body = fake.respond(name)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(data)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+        return fake
+
+    monkeypatch.setattr(ocr_parser, "_BACKOFF_BASE", 0.01)
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def images(tmp_path):
+    """Create image files whose content is their name."""
+    def create(*names):
+        paths = []
+        for name in names:
+            path = tmp_path / f"{name}.jpg"
+            path.write_text(name)
+            paths.append(path)
+        return paths
+    return create
+
+
+@pytest.mark.parametrize("status", [408, 409, 429, 500, 503])
+def test_transient_errors_are_retried(fake_openai, images, status):
+    fake = fake_openai(failures={"p1": [status, status]})
+    [path] = images("p1")
+
+    [result] = OpenAIVisionParser(api_key="test").extract_vocabulary_from_images([path])
+
+    assert result.error is None
+    assert result.attempts == 3
+    assert result.items[0]["japanese"] == ["ことば p1"]
+    assert fake.requests["p1"] == 3
+
+
+def test_client_errors_fail_at_once_without_stopping_other_images(fake_openai, images):
+    fake = fake_openai(failures={"bad": [400]})
+    paths = images("p1", "bad", "p2")
+
+    results = OpenAIVisionParser(api_key="test").extract_vocabulary_from_images(paths)
+
+    assert [r.image_path for r in results] == paths
+    assert results[1].error is not None and "400" in results[1].error
+    assert fake.requests["bad"] == 1
+    assert [len(r.items) for r in results] == [1, 0, 1]
+
+
+def test_gives_up_after_max_attempts(fake_openai, images):
+    fake = fake_openai(failures={"p1": [503] * 10})
+    [path] = images("p1")
+
+    [result] = OpenAIVisionParser(api_key="test").extract_vocabulary_from_images([path])
+
+    assert result.error is not None
+    assert fake.requests["p1"] == ocr_parser._MAX_ATTEMPTS
+
+
+def test_requests_in_flight_are_bounded(fake_openai, images):
+    fake = fake_openai(latency=0.1)
+    paths = images(*(f"p{i}" for i in range(8)))
+    done = []
+
+    results = OpenAIVisionParser(api_key="test").extract_vocabulary_from_images(
+        paths, max_workers=3, on_done=done.append
+    )
+
+    assert 1 < fake.max_active <= 3
+    assert [r.image_path for r in results] == paths
+    assert sorted(r.image_path for r in done) == sorted(paths)
+
+
+def test_collect_image_paths(tmp_path):
+    (tmp_path / "week").mkdir()
+    for name in ("b.jpg", "a.PNG", "notes.txt"):
+        (tmp_path / "week" / name).write_text("x")
+    (tmp_path / "c.jpeg").write_text("x")
+
+    paths = collect_image_paths([
+        str(tmp_path / "week"),
+        str(tmp_path / "*.jpeg"),
+        str(tmp_path / "week" / "b.jpg"),
+        str(tmp_path / "missing.jpg"),
+    ])
+
+    assert [p.name for p in paths] == ["a.PNG", "b.jpg", "c.jpeg", "missing.jpg"]
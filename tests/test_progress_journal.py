@@ -0,0 +1,49 @@
+"""Tests for replaying the progress journal."""
+
+import json
+
+import pytest
+
+from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.progress_journal import ProgressJournal
+from nihon_cli.infra.repository import VocabRepository
+
+
+@pytest.fixture
+def repo():
+    repo = VocabRepository()
+    item = VocabularyItem(id=0, japanese_vocab=["ねこ"], german_vocab=["Katze"],
+                          source_file="test.md", upload_tag="test")
+    repo.add_vocabulary_batch([item], "test.md", "test")
+    repo.item_id = item.id
+    return repo
+
+
+def test_second_journal_leaves_open_segment_alone(repo):
+    first = ProgressJournal(repo)
+    first.record_progress(repo.item_id, "jp_to_de")
+    [path] = first.journal_dir.glob("*.jsonl")
+
+    second = ProgressJournal(repo)
+    assert second.replay() == 0
+    assert path.exists()
+
+    first.record_progress(repo.item_id, "jp_to_de")
+    first.flush()
+
+    assert repo.get_vocabulary_by_id(repo.item_id).correct_german == 2
+    assert list(first.journal_dir.glob("*.jsonl")) == []
+
+
+def test_leftover_segment_of_exited_writer_is_replayed(repo):
+    journal = ProgressJournal(repo)
+    journal.journal_dir.mkdir(parents=True, exist_ok=True)
+    # Written by a process that is gone; the last line was cut off
+    leftover = journal.journal_dir / "999999999-deadbeef.jsonl"
+    leftover.write_text(
+        json.dumps(["progress", repo.item_id, "de_to_jp"]) + "\n" + '["progress", 1'
+    )
+
+    assert ProgressJournal(repo).replay() == 0  # applied by the constructor
+    assert not leftover.exists()
+    assert repo.get_vocabulary_by_id(repo.item_id).correct_japanese == 1
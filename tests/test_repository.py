@@ -0,0 +1,79 @@
+"""Tests for the set-based vocabulary insert."""
+
+import pytest
+
+from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.repository import VocabRepository
+
+
+def _item(japanese, german="Wort", vocab_type=None):
+    return VocabularyItem(
+        id=0,
+        japanese_vocab=[japanese],
+        german_vocab=[german],
+        source_file="test.md",
+        upload_tag="test",
+        vocab_type=vocab_type,
+    )
+
+
+def _stored(repo):
+    with repo._get_connection() as conn:
+        return [row[0] for row in conn.execute("SELECT japanese_vocab FROM vocabulary ORDER BY id")]
+
+
+def test_duplicates_are_skipped_and_ids_written_back():
+    repo = VocabRepository()
+    repo.add_vocabulary_batch([_item("いぬ")], "test.md", "test")
+    items = [_item("ねこ", vocab_type="noun"), _item("いぬ"), _item("ねこ", "Kater")]
+
+    inserted, skipped = repo.add_vocabulary_with_weekly_fields(items, "test.md", "test")
+
+    assert (inserted, skipped) == (1, 2)
+    assert items[0].id > 0 and items[1].id == 0 and items[2].id == 0
+    assert repo.get_vocabulary_by_id(items[0].id).german_vocab == ["Wort"]
+    assert _stored(repo) == ["いぬ", "ねこ"]
+
+
+def test_invalid_vocab_type_is_reported_and_nothing_inserted():
+    repo = VocabRepository()
+    items = [_item("ねこ", vocab_type="noun"), _item("たかい", vocab_type="adj")]
+
+    with pytest.raises(ValueError, match=r"たかい \('adj'\)"):
+        repo.add_vocabulary_with_weekly_fields(items, "test.md", "test")
+
+    assert _stored(repo) == []
+
+
+def test_duplicates_are_matched_by_meaning_list():
+    repo = VocabRepository()
+    stored = VocabularyItem(id=0, japanese_vocab=["あか", "赤"], german_vocab=["rot"],
+                            source_file="test.md", upload_tag="test")
+    repo.add_vocabulary_batch([stored], "test.md", "test")
+
+    items = [
+        _item("あか, 赤"),  # one meaning containing a comma
+        VocabularyItem(id=0, japanese_vocab=["あか"], german_vocab=["rot"],
+                       source_file="test.md", upload_tag="test"),
+        VocabularyItem(id=0, japanese_vocab=["あか", "赤"], german_vocab=["Rot"],
+                       source_file="test.md", upload_tag="test"),
+    ]
+    inserted, skipped = repo.add_vocabulary_batch(items, "test.md", "test")
+
+    assert (inserted, skipped) == (2, 1)
+    assert repo.get_vocabulary_by_id(items[0].id).japanese_vocab == ["あか, 赤"]
+    assert repo.get_vocabulary_by_id(items[1].id).japanese_vocab == ["あか"]
+    assert items[2].id == 0
+
+
+def test_duplicate_lookup_uses_meaning_index():
+    from nihon_cli.infra.repository import _DUPLICATES_QUERY
+
+    repo = VocabRepository()
+    repo.add_vocabulary_batch([_item("ねこ")], "test.md", "test")
+    with repo._get_connection() as conn:
+        plan = [row["detail"] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN {_DUPLICATES_QUERY}", ("ja", "ja")
+        )]
+
+    assert any("idx_vocabulary_meanings_text" in detail for detail in plan), plan
@@ -0,0 +1,40 @@
+"""Tests for the romaji to kana conversion."""
+
+import pytest
+
+from nihon_cli.core.romaji_converter import convert_romaji_word_to_kana
+
+
+@pytest.mark.parametrize(
+    "romaji, kana",
+    [
+        # Syllabic n
+        ("hon", "ほん"),
+        ("kan'i", "かんい"),
+        ("konnichiha", "こんにちは"),
+        ("konnnichiha", "こんにちは"),
+        ("onnna", "おんな"),
+        ("onna", "おんな"),
+        ("kinn", "きん"),
+        ("shinnyuu", "しんにゅう"),
+        ("shinbun", "しんぶん"),
+        # Small tsu, long vowels and spelling variants
+        ("kitte", "きって"),
+        ("matcha", "まっちゃ"),
+        ("ko-hi-", "こーひー"),
+        ("kōhī", "こーひー"),
+        ("tsukue", "つくえ"),
+        ("tukue", "つくえ"),
+        ("jisho", "じしょ"),
+    ],
+)
+def test_convert_word_to_kana(romaji, kana):
+    assert convert_romaji_word_to_kana(romaji) == kana
+
+
+def test_katakana_output():
+    assert convert_romaji_word_to_kana("konnnichiha", prefer_hiragana=False) == "コンニチハ"
+
+
+def test_unconvertible_word():
+    assert convert_romaji_word_to_kana("xyz") is None
@@ -0,0 +1,49 @@
+"""Tests for skipping unchanged files on re-upload."""
+
+import pytest
+
+from nihon_cli.cli import commands
+from nihon_cli.core.excel_parser import ExcelVocabParser
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """A workbook with two small vocabulary sheets."""
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for sheet in ("Lektion 1", "Lektion 2"):
+        ws = wb.create_sheet(sheet)
+        ws.append(["かな", "漢字", "ドイツ語訳", "品詞"])
+        for i in range(3):
+            ws.append([f"ことば{sheet[-1]}{i}", None, f"Wort {i}", "01 名詞"])
+    path = tmp_path / "vocab.xlsx"
+    wb.save(path)
+    return path
+
+
+def test_unchanged_workbook_is_not_opened(workbook, monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda prompt="": "a")
+    commands._upload_excel(workbook, "test")
+    assert "6 Vokabeln importiert" in capsys.readouterr().out
+
+    def fail(*args, **kwargs):
+        raise AssertionError("workbook opened")
+
+    monkeypatch.setattr(ExcelVocabParser, "list_sheets", fail)
+    monkeypatch.setattr("builtins.input", fail)
+    commands._upload_excel(workbook, "test")
+
+    assert "unverändert" in capsys.readouterr().out
+
+
+def test_force_imports_unchanged_workbook_again(workbook, monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda prompt="": "a")
+    commands._upload_excel(workbook, "test")
+    capsys.readouterr()
+
+    commands._upload_excel(workbook, "test", force=True)
+
+    out = capsys.readouterr().out
+    assert "2 Sheets gefunden" in out
+    assert "0 Vokabeln importiert" in out
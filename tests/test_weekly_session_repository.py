@@ -0,0 +1,59 @@
+"""Tests for weekly session item retrieval."""
+
+import pytest
+
+from nihon_cli.core.vocabulary import VocabularyItem
+from nihon_cli.infra.repository import VocabRepository
+from nihon_cli.infra.weekly_session_repository import (
+    SESSION_ITEMS_QUERY,
+    WeeklySessionRepository,
+)
+
+
+@pytest.fixture
+def session():
+    """A weekly session of 50 items with two meanings each."""
+    items = [
+        VocabularyItem(
+            id=0,
+            japanese_vocab=[f"ことば{i}", f"言葉{i}"],
+            german_vocab=[f"Wort {i}", f"Begriff {i}"],
+            source_file="test.md",
+            upload_tag="test",
+        )
+        for i in range(50)
+    ]
+    VocabRepository().add_vocabulary_with_weekly_fields(items, "test.md", "test")
+    repo = WeeklySessionRepository()
+    # Reverse insertion order, so id order has to come from the query
+    weekly_session = repo.create_new_session([item.id for item in reversed(items)])
+    return repo, weekly_session, items
+
+
+def _query_plan(repo, session_id):
+    with repo._get_connection() as conn:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {SESSION_ITEMS_QUERY}", (session_id,))
+        return [row["detail"] for row in rows]
+
+
+@pytest.mark.parametrize("analyze", [False, True])
+def test_session_items_query_needs_no_temp_sort(session, analyze):
+    repo, weekly_session, _ = session
+    if analyze:
+        with repo._get_connection() as conn:
+            conn.execute("ANALYZE")
+
+    plan = _query_plan(repo, weekly_session.id)
+
+    assert not [detail for detail in plan if "TEMP B-TREE" in detail], plan
+    assert any("weekly_session_items" in detail and "INDEX" in detail for detail in plan), plan
+
+
+def test_session_items_are_in_id_order_with_meanings(session):
+    repo, weekly_session, items = session
+
+    loaded = repo.get_session_items(weekly_session.id, prioritize_by_progress=False)
+
+    assert [item.id for item in loaded] == sorted(item.id for item in items)
+    assert loaded[0].japanese_vocab == ["ことば0", "言葉0"]
+    assert loaded[0].german_vocab == ["Wort 0", "Begriff 0"]